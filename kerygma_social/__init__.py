@@ -6,10 +6,29 @@ of the eight-organ creative-institutional system.
 
 __version__ = "0.3.0"
 
-from kerygma_social.posse import PosseDistributor, Platform, ContentPost, SyndicationRecord
-from kerygma_social.delivery_log import DeliveryLog, DeliveryRecord
-from kerygma_social.config import load_config, SocialConfig
-from kerygma_social.factory import build_distributor, build_distributor_for_profile
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from kerygma_social.posse import PosseDistributor, Platform, ContentPost, SyndicationRecord
+    from kerygma_social.delivery_log import DeliveryLog, DeliveryRecord
+    from kerygma_social.config import load_config, SocialConfig
+    from kerygma_social.factory import build_distributor, build_distributor_for_profile
+
+# Public names are resolved on first access (PEP 562), so importing one
+# submodule does not pull in every platform client.
+_EXPORTS = {
+    "PosseDistributor": "kerygma_social.posse",
+    "Platform": "kerygma_social.posse",
+    "ContentPost": "kerygma_social.posse",
+    "SyndicationRecord": "kerygma_social.posse",
+    "DeliveryLog": "kerygma_social.delivery_log",
+    "DeliveryRecord": "kerygma_social.delivery_log",
+    "load_config": "kerygma_social.config",
+    "SocialConfig": "kerygma_social.config",
+    "build_distributor": "kerygma_social.factory",
+    "build_distributor_for_profile": "kerygma_social.factory",
+}
 
 __all__ = [
     "PosseDistributor",
@@ -23,3 +42,16 @@ __all__ = [
     "build_distributor",
     "build_distributor_for_profile",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -6,15 +6,21 @@ In mock mode, posts are recorded locally without API calls.
 
 from __future__ import annotations
 
-import json
-import urllib.error
-import urllib.request
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from kerygma_social import json_codec
+from kerygma_social.http_pool import HttpPool, HttpResponse, shared_pool
 
-@dataclass
+if TYPE_CHECKING:
+    from kerygma_social.circuit_breaker import CircuitBreaker
+
+# com.atproto.repo.applyWrites accepts at most this many writes per call.
+MAX_WRITES_PER_BATCH = 200
+
+
+@dataclass(frozen=True, slots=True)
 class BlueskyConfig:
     handle: str
     app_password: str
@@ -22,7 +28,7 @@ class BlueskyConfig:
     max_chars: int = 300
 
 
-@dataclass
+@dataclass(slots=True)
 class BlueskyPost:
     text: str
     reply_to: dict[str, Any] | None = None
@@ -34,11 +40,33 @@ class BlueskyPost:
 class BlueskyClient:
     """Client for posting to Bluesky via the AT Protocol."""
 
-    def __init__(self, config: BlueskyConfig, live: bool = False) -> None:
+    def __init__(
+        self,
+        config: BlueskyConfig,
+        live: bool = False,
+        pool: HttpPool | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
         self.config = config
         self._live = live
         self._posted: list[dict[str, Any]] = []
         self._session: dict[str, Any] | None = None
+        self._http = pool or shared_pool()
+        self._breaker = breaker
+        self._headers = {"Content-Type": "application/json"}
+
+    def _send(self, url: str, payload: dict[str, Any], label: str) -> HttpResponse:
+        """POST JSON, through the circuit breaker when one is configured."""
+        data = json_codec.dumps(payload)
+
+        def request() -> HttpResponse:
+            resp = self._http.request("POST", url, body=data, headers=self._headers)
+            resp.raise_for_status(label)
+            return resp
+
+        if self._breaker is None:
+            return request()
+        return self._breaker.call(request)
 
     def _create_session(self) -> dict[str, Any]:
         """Authenticate and create an AT Protocol session."""
@@ -47,19 +75,14 @@ class BlueskyClient:
             "identifier": self.config.handle,
             "password": self.config.app_password,
         }
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            url, data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        try:
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                self._session = json.loads(resp.read().decode("utf-8"))
-                return self._session
-        except urllib.error.HTTPError as exc:
-            body = exc.read().decode("utf-8", errors="replace")
-            raise RuntimeError(f"Bluesky auth error {exc.code}: {body}") from exc
+        resp = self._send(url, payload, "Bluesky auth error")
+        self._session = resp.json()
+        # Authorization is fixed for the session lifetime — build it once.
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self._session['accessJwt']}",  # type: ignore[index]
+        }
+        return self._session
 
     def _post_to_api(self, post: BlueskyPost) -> dict[str, Any]:
         """Create a post via the AT Protocol."""
@@ -67,34 +90,31 @@ class BlueskyClient:
             self._create_session()
 
         url = f"{self.config.service_url}/xrpc/com.atproto.repo.createRecord"
-        record: dict[str, Any] = {
-            "$type": "app.bsky.feed.post",
-            "text": post.text,
-            "createdAt": datetime.now(timezone.utc).isoformat(),
+        payload = {
+            "repo": self._session["did"],  # type: ignore[index]
+            "collection": "app.bsky.feed.post",
+            "record": _feed_record(post),
         }
-        if post.reply_to:
-            record["reply"] = post.reply_to
+        return self._send(url, payload, "Bluesky API error").json()
 
+    def _apply_writes(self, posts: list[BlueskyPost]) -> list[dict[str, Any]]:
+        """Create several posts in one request via applyWrites."""
+        if not self._session:
+            self._create_session()
+
+        url = f"{self.config.service_url}/xrpc/com.atproto.repo.applyWrites"
         payload = {
             "repo": self._session["did"],  # type: ignore[index]
-            "collection": "app.bsky.feed.post",
-            "record": record,
+            "writes": [
+                {
+                    "$type": "com.atproto.repo.applyWrites#create",
+                    "collection": "app.bsky.feed.post",
+                    "value": _feed_record(post),
+                }
+                for post in posts
+            ],
         }
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            url, data=data,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self._session['accessJwt']}",  # type: ignore[index]
-            },
-            method="POST",
-        )
-        try:
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                return json.loads(resp.read().decode("utf-8"))
-        except urllib.error.HTTPError as exc:
-            body = exc.read().decode("utf-8", errors="replace")
-            raise RuntimeError(f"Bluesky API error {exc.code}: {body}") from exc
+        return self._send(url, payload, "Bluesky API error").json().get("results", [])
 
     def post(self, post: BlueskyPost) -> dict[str, Any]:
         """Post to Bluesky (live or mock)."""
@@ -114,6 +134,26 @@ class BlueskyClient:
         self._posted.append(result)
         return result
 
+    def post_batch(self, posts: list[BlueskyPost]) -> list[dict[str, Any]]:
+        """Post several independent posts, in one API call per 200 when live.
+
+        All posts are validated before anything is sent. Results come back
+        in ``posts`` order, each with the created record's ``uri`` and ``cid``.
+        """
+        if not all(post.validate() for post in posts):
+            raise ValueError("Post text exceeds character limit or is empty")
+
+        if not self._live:
+            return [self.post(post) for post in posts]
+
+        results: list[dict[str, Any]] = []
+        for start in range(0, len(posts), MAX_WRITES_PER_BATCH):
+            created = self._apply_writes(posts[start:start + MAX_WRITES_PER_BATCH])
+            # Recorded per chunk: earlier chunks stay counted if a later one fails.
+            self._posted.extend(created)
+            results.extend(created)
+        return results
+
     def format_for_bluesky(self, title: str, url: str) -> str:
         """Format content for Bluesky's character limit, truncating at word boundary."""
         text = f"{title}\n\n{url}"
@@ -121,11 +161,35 @@ class BlueskyClient:
         if len(text) <= limit:
             return text
         # Reserve space for ellipsis
-        trunc_at = text.rfind(" ", 0, limit - 3)
-        if trunc_at <= 0:
-            trunc_at = limit - 3
-        return text[:trunc_at].rstrip() + "..."
+        end = text.rfind(" ", 0, limit - 3)
+        if end <= 0:
+            end = limit - 3
+        # Back over trailing whitespace by index rather than slicing and
+        # rstrip()-ing, so only the final string is allocated. Code points
+        # are counted, which never undercounts Bluesky's grapheme limit.
+        while end > 0 and text[end - 1].isspace():
+            end -= 1
+        return text[:end] + "..."
+
+    def close(self) -> None:
+        """Release the client.
+
+        The connection pool is shared (``shared_pool()`` or the one passed
+        in), so its keep-alive sockets stay open for other clients; the
+        shared pool closes them at interpreter exit.
+        """
 
     @property
     def post_count(self) -> int:
         return len(self._posted)
+
+
+def _feed_record(post: BlueskyPost) -> dict[str, Any]:
+    record: dict[str, Any] = {
+        "$type": "app.bsky.feed.post",
+        "text": post.text,
+        "createdAt": datetime.now(timezone.utc).isoformat(),
+    }
+    if post.reply_to:
+        record["reply"] = post.reply_to
+    return record
@@ -8,10 +8,12 @@ Implements a three-state machine:
 
 from __future__ import annotations
 
+import threading
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, TypeVar
+from typing import Any, TypeVar
 
 T = TypeVar("T")
 
@@ -22,6 +24,13 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"
 
 
+# Module-level aliases: on Python 3.11, Enum member access goes through a
+# descriptor and costs several times a global lookup on the call() path.
+_CLOSED = CircuitState.CLOSED
+_OPEN = CircuitState.OPEN
+_HALF_OPEN = CircuitState.HALF_OPEN
+
+
 class CircuitOpenError(Exception):
     """Raised when a call is attempted while circuit is OPEN."""
 
@@ -30,7 +39,7 @@ class CircuitOpenError(Exception):
         super().__init__(f"Circuit is OPEN, resets at {reset_at:.1f}")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CircuitBreakerConfig:
     failure_threshold: int = 5
     reset_timeout: float = 60.0
@@ -47,19 +56,23 @@ class CircuitBreaker:
     ) -> None:
         self._config = config or CircuitBreakerConfig()
         self._clock = clock or time.monotonic
-        self._state = CircuitState.CLOSED
+        self._state = _CLOSED
         self._failure_count = 0
         self._success_count = 0
         self._last_failure_time: float = 0.0
+        self._open_until: float = 0.0  # When an OPEN circuit may go HALF_OPEN
         self._half_open_calls = 0
+        self._lock = threading.Lock()
 
     @property
     def state(self) -> CircuitState:
-        if self._state == CircuitState.OPEN:
-            elapsed = self._clock() - self._last_failure_time
-            if elapsed >= self._config.reset_timeout:
-                self._state = CircuitState.HALF_OPEN
-                self._half_open_calls = 0
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> CircuitState:
+        if self._state is _OPEN and self._clock() >= self._open_until:
+            self._state = _HALF_OPEN
+            self._half_open_calls = 0
         return self._state
 
     @property
@@ -67,43 +80,68 @@ class CircuitBreaker:
         return self._failure_count
 
     def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
-        """Execute func through the circuit breaker."""
-        current_state = self.state
+        """Execute func through the circuit breaker.
 
-        if current_state == CircuitState.OPEN:
-            raise CircuitOpenError(
-                self._last_failure_time + self._config.reset_timeout
-            )
-
-        if current_state == CircuitState.HALF_OPEN:
-            if self._half_open_calls >= self._config.half_open_max_calls:
-                raise CircuitOpenError(
-                    self._last_failure_time + self._config.reset_timeout
-                )
-            self._half_open_calls += 1
+        Safe to share between threads: admission and state transitions
+        happen under a lock, while func itself runs outside it.
+        """
+        # Fast path: a CLOSED circuit needs no clock read or gating. The
+        # unlocked read can only let in a call that raced the circuit
+        # opening, as if it had arrived a moment earlier.
+        if self._state is not _CLOSED:
+            self._admit()
 
         try:
             result = func(*args, **kwargs)
-            self._on_success()
-            return result
-        except Exception:
-            self._on_failure()
+        except Exception as exc:
+            if _is_client_error(exc):
+                # The service answered; a rejected request is not an outage.
+                with self._lock:
+                    if self._state is _HALF_OPEN:
+                        self._on_success()
+            else:
+                with self._lock:
+                    self._on_failure()
             raise
+        with self._lock:
+            self._on_success()
+        return result
+
+    def _admit(self) -> None:
+        """Gate a call on an OPEN or HALF_OPEN circuit."""
+        with self._lock:
+            state = self._current_state()
+            if state is _CLOSED:
+                return
+            if state is _OPEN:
+                raise CircuitOpenError(self._open_until)
+            if self._half_open_calls >= self._config.half_open_max_calls:
+                raise CircuitOpenError(self._open_until)
+            self._half_open_calls += 1
 
+    # _on_success and _on_failure expect the caller to hold self._lock.
     def _on_success(self) -> None:
-        if self._state == CircuitState.HALF_OPEN:
-            self._state = CircuitState.CLOSED
+        if self._state is _HALF_OPEN:
+            self._state = _CLOSED
         self._failure_count = 0
         self._success_count += 1
 
     def _on_failure(self) -> None:
         self._failure_count += 1
-        self._last_failure_time = self._clock()
         if self._failure_count >= self._config.failure_threshold:
-            self._state = CircuitState.OPEN
+            self._last_failure_time = self._clock()
+            self._open_until = self._last_failure_time + self._config.reset_timeout
+            self._state = _OPEN
 
     def reset(self) -> None:
         """Manually reset the circuit breaker to CLOSED."""
-        self._state = CircuitState.CLOSED
-        self._failure_count = 0
-        self._half_open_calls = 0
+        with self._lock:
+            self._state = _CLOSED
+            self._failure_count = 0
+            self._half_open_calls = 0
+
+
+def _is_client_error(exc: Exception) -> bool:
+    """True for HTTP 4xx errors (anything carrying an int ``status`` below 500)."""
+    status = getattr(exc, "status", None)
+    return isinstance(status, int) and status < 500
@@ -11,17 +11,28 @@ from __future__ import annotations
 
 import argparse
 import sys
+from collections.abc import Callable
 from pathlib import Path
 
-from kerygma_social.config import load_config, SocialConfig
-from kerygma_social.factory import build_distributor
-from kerygma_social.posse import Platform
-from kerygma_social.delivery_log import DeliveryLog
+from kerygma_social.config import SocialConfig, load_config
+
+# Command handlers import their heavy dependencies (platform clients,
+# distributor, delivery log) on first use, so `status` and `--help` stay
+# fast to start.
 
 
 def cmd_dispatch(cfg: SocialConfig, title: str, url: str, platforms: list[str]) -> None:
+    from kerygma_social.factory import build_distributor
+    from kerygma_social.posse import Platform
+
+    by_value = {p.value: p for p in Platform}
+    unknown = [p for p in platforms if p not in by_value]
+    if unknown:
+        print(f"Unknown platform(s): {', '.join(unknown)}", file=sys.stderr)
+        sys.exit(2)
+    platform_list = [by_value[p] for p in platforms]
+
     dist = build_distributor(cfg)
-    platform_list = [Platform(p) for p in platforms]
     dist.create_post("cli-dispatch", title, "", url, platform_list)
     records = dist.syndicate("cli-dispatch")
 
@@ -44,10 +55,16 @@ def cmd_poll_rss(cfg: SocialConfig) -> None:
 
 
 def cmd_log(cfg: SocialConfig, failures_only: bool) -> None:
+    from kerygma_social.delivery_log import DeliveryLog
+
     log_path = Path(cfg.delivery_log_path) if cfg.delivery_log_path else None
     log = DeliveryLog(log_path)
-    records = log.get_failures() if failures_only else log.all_records
-    print(f"{'Failures' if failures_only else 'All records'}: {len(records)}")
+    if failures_only:
+        print(f"Failures: {log.failure_count}")
+        records = log.iter_failures()
+    else:
+        print(f"All records: {log.total_records}")
+        records = log.iter_records()
     for r in records:
         print(f"  [{r.status}] {r.platform} / {r.post_id}: {r.external_url or r.error}")
 
@@ -60,6 +77,16 @@ def cmd_status(cfg: SocialConfig) -> None:
     print(f"RSS feed: {cfg.rss_feed_url or 'not configured'}")
 
 
+COMMANDS: dict[str, Callable[[SocialConfig, argparse.Namespace], None]] = {
+    "dispatch": lambda cfg, args: cmd_dispatch(
+        cfg, args.title, args.url, [p.strip() for p in args.platforms.split(",")],
+    ),
+    "poll-rss": lambda cfg, args: cmd_poll_rss(cfg),
+    "log": lambda cfg, args: cmd_log(cfg, args.failures),
+    "status": lambda cfg, args: cmd_status(cfg),
+}
+
+
 def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(prog="social-dispatch", description="Social automation CLI")
     parser.add_argument("--config", type=Path, default=None, help="Config YAML file")
@@ -84,16 +111,7 @@ def main(argv: list[str] | None = None) -> None:
         return
 
     cfg = load_config(args.config)
-
-    if args.command == "dispatch":
-        platforms = [p.strip() for p in args.platforms.split(",")]
-        cmd_dispatch(cfg, args.title, args.url, platforms)
-    elif args.command == "poll-rss":
-        cmd_poll_rss(cfg)
-    elif args.command == "log":
-        cmd_log(cfg, args.failures)
-    elif args.command == "status":
-        cmd_status(cfg)
+    COMMANDS[args.command](cfg, args)
 
 
 if __name__ == "__main__":
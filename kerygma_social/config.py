@@ -7,11 +7,11 @@ All env vars use the KERYGMA_ prefix.
 from __future__ import annotations
 
 import os
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable
-
-import yaml
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from kerygma_profiles.registry import ProjectProfile
@@ -77,12 +77,13 @@ def load_config(path: Path | None = None) -> SocialConfig:
     """
     raw: dict[str, Any] = {}
     if path and path.exists():
-        raw = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        st = path.stat()
+        raw = _parse_yaml(str(path), st.st_mtime_ns, st.st_size)
 
-    mastodon = raw.get("mastodon", {}) if isinstance(raw, dict) else {}
-    discord = raw.get("discord", {}) if isinstance(raw, dict) else {}
-    bluesky = raw.get("bluesky", {}) if isinstance(raw, dict) else {}
-    ghost = raw.get("ghost", {}) if isinstance(raw, dict) else {}
+    mastodon = raw.get("mastodon", {})
+    discord = raw.get("discord", {})
+    bluesky = raw.get("bluesky", {})
+    ghost = raw.get("ghost", {})
 
     cfg = SocialConfig(
         mastodon_instance_url=_env_or(
@@ -115,15 +116,34 @@ def load_config(path: Path | None = None) -> SocialConfig:
             ghost.get("admin_api_key", ""),
         ),
         ghost_newsletter_slug=ghost.get("newsletter_slug", ""),
-        delivery_log_path=raw.get("delivery_log_path", "delivery_log.json")
-        if isinstance(raw, dict) else "delivery_log.json",
-        rss_feed_url=raw.get("rss_feed_url", "") if isinstance(raw, dict) else "",
-        live_mode=_env_bool("LIVE_MODE", raw.get("live_mode", False) if isinstance(raw, dict) else False),
+        delivery_log_path=raw.get("delivery_log_path", "delivery_log.json"),
+        rss_feed_url=raw.get("rss_feed_url", ""),
+        live_mode=_env_bool("LIVE_MODE", raw.get("live_mode", False)),
     )
 
     return cfg
 
 
+@lru_cache(maxsize=8)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a config file once per (path, mtime, size).
+
+    Env overrides are applied by the caller on every load, so only the
+    file contents are cached. Callers must not mutate the returned dict.
+    """
+    # PyYAML is imported on first parse: env-only configs (and CLI startup
+    # without a config file) never pay its import cost.
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as loader  # libyaml C parser
+    except ImportError:
+        from yaml import SafeLoader as loader  # type: ignore[assignment]
+
+    raw = yaml.load(Path(path).read_text(encoding="utf-8"), Loader=loader)
+    return raw if isinstance(raw, dict) else {}
+
+
 def _env_or(suffix: str, default: str) -> str:
     return os.environ.get(f"{ENV_PREFIX}{suffix}", default)
 
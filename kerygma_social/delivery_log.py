@@ -1,20 +1,27 @@
 """Persistent delivery log for tracking dispatch records.
 
-Records every syndication attempt to a JSON file, enabling
-deduplication, auditing, and retry of failed deliveries.
+Records every syndication attempt to a JSON Lines file (one record per
+line), enabling deduplication, auditing, and retry of failed deliveries.
+Appends are O(1): each record is a single line written in append mode,
+and the file is only rewritten on compaction.
 """
 
 from __future__ import annotations
 
-import json
+import gc
 import os
-from dataclasses import dataclass, field, asdict
+from collections import deque
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from kerygma_social import json_codec
 
-@dataclass
+
+@dataclass(slots=True)
 class DeliveryRecord:
     """A single delivery attempt."""
     record_id: str
@@ -30,63 +37,247 @@ class DeliveryRecord:
         if not self.timestamp:
             self.timestamp = datetime.now().isoformat()
 
+    @classmethod
+    def _from_row(cls, row: dict[str, Any]) -> DeliveryRecord:
+        """Build a record from a trusted on-disk row, bypassing ``__init__``.
+
+        Raises KeyError if a required field is missing; unknown keys are ignored.
+        """
+        obj = object.__new__(cls)
+        obj.record_id = row["record_id"]
+        obj.post_id = row["post_id"]
+        obj.platform = row["platform"]
+        obj.status = row["status"]
+        obj.timestamp = row.get("timestamp") or datetime.now().isoformat()
+        obj.external_url = row.get("external_url", "")
+        obj.error = row.get("error", "")
+        obj.metadata = row.get("metadata") or {}
+        return obj
+
 
 class DeliveryLog:
-    """JSON file-backed delivery log."""
+    """JSON Lines file-backed delivery log.
+
+    Logs written by older versions as a single ``{"records": [...]}``
+    document are migrated to JSON Lines on load.
+    """
 
     def __init__(self, path: Path | None = None, max_records: int = 0) -> None:
         self._path = path
         self._max_records = max_records
-        self._records: list[DeliveryRecord] = []
+        # Deques throughout: max_records trimming drops the oldest record
+        # from the front of every collection, which is O(1) with popleft()
+        # where list.pop(0) would shift the whole list on every append.
+        self._records: deque[DeliveryRecord] = deque()
+        self._lines_on_disk = 0
+        # Indexes kept in step with _records so lookups avoid full scans.
+        self._by_post: dict[str, deque[DeliveryRecord]] = {}
+        self._by_platform: dict[str, deque[DeliveryRecord]] = {}
+        self._failures: deque[DeliveryRecord] = deque()
+        # post_id -> platform -> success count, so one lookup answers
+        # "where has this post already been delivered?".
+        self._delivered: dict[str, dict[str, int]] = {}
         if path and path.exists():
             self._load()
 
+    def _index(self, record: DeliveryRecord) -> None:
+        by_post = self._by_post.get(record.post_id)
+        if by_post is None:
+            by_post = self._by_post[record.post_id] = deque()
+        by_post.append(record)
+        by_platform = self._by_platform.get(record.platform)
+        if by_platform is None:
+            by_platform = self._by_platform[record.platform] = deque()
+        by_platform.append(record)
+        if record.status == "failure":
+            self._failures.append(record)
+        elif record.status == "success":
+            platforms = self._delivered.setdefault(record.post_id, {})
+            platforms[record.platform] = platforms.get(record.platform, 0) + 1
+
+    def _unindex_oldest(self, record: DeliveryRecord) -> None:
+        """Drop the oldest record, which is first in every index list."""
+        for index, key in ((self._by_post, record.post_id), (self._by_platform, record.platform)):
+            bucket = index[key]
+            bucket.popleft()
+            if not bucket:
+                del index[key]
+        if record.status == "failure":
+            self._failures.popleft()
+        elif record.status == "success":
+            platforms = self._delivered[record.post_id]
+            platforms[record.platform] -= 1
+            if not platforms[record.platform]:
+                del platforms[record.platform]
+                if not platforms:
+                    del self._delivered[record.post_id]
+
+    def _set_records(self, records: list[DeliveryRecord]) -> None:
+        self._records = deque()
+        self._by_post, self._by_platform = {}, {}
+        self._failures, self._delivered = deque(), {}
+        for record in records:
+            self._records.append(record)
+            self._index(record)
+
     def _load(self) -> None:
         if not self._path or not self._path.exists():
             return
+        raw = self._path.read_bytes()
+        if _is_legacy_document(raw):
+            self._load_legacy(raw)
+            return
+
+        lines = [line for line in raw.splitlines() if line.strip()]
+        records: list[DeliveryRecord] = []
+        with _gc_paused():
+            for row in json_codec.loads_lines(lines):
+                try:
+                    records.append(DeliveryRecord._from_row(row))
+                except (KeyError, TypeError):
+                    continue  # Malformed row — keep the rest of the log
+            self._set_records(records)
+        self._lines_on_disk = len(lines)
+        if not raw.endswith(b"\n"):
+            # A torn trailing line would swallow the next appended record;
+            # rewrite the file without it.
+            self.compact()
+        else:
+            self._trim()
+
+    def _load_legacy(self, raw: bytes) -> None:
         try:
-            data = json.loads(self._path.read_text(encoding="utf-8"))
-            self._records = [
-                DeliveryRecord(**rec) for rec in data.get("records", [])
-            ]
-        except (json.JSONDecodeError, TypeError):
-            self._records = []
-
-    def _save(self) -> None:
+            data = json_codec.loads(raw)
+            self._set_records([
+                DeliveryRecord._from_row(rec) for rec in data.get("records", [])
+            ])
+        except (json_codec.JSONDecodeError, KeyError, TypeError, AttributeError):
+            self._set_records([])
+        self.compact()
+
+    def _trim(self) -> None:
+        if self._max_records > 0 and len(self._records) > self._max_records:
+            for _ in range(len(self._records) - self._max_records):
+                self._unindex_oldest(self._records.popleft())
+
+    def compact(self) -> None:
+        """Rewrite the file with only the retained records (atomic replace)."""
+        self._trim()
         if not self._path:
             return
-        records = self._records
-        if self._max_records > 0 and len(records) > self._max_records:
-            records = records[-self._max_records:]
-            self._records = records
-        data = {"records": [asdict(r) for r in records]}
+        lines = b"".join(_encode(r) for r in self._records)
         tmp = self._path.with_suffix(".tmp")
-        tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        tmp.write_bytes(lines)
         os.replace(str(tmp), str(self._path))
+        self._lines_on_disk = len(self._records)
 
     def append(self, record: DeliveryRecord) -> None:
-        self._records.append(record)
-        self._save()
+        self.append_batch((record,))
+
+    def append_batch(self, records: Iterable[DeliveryRecord]) -> None:
+        """Append records with a single write to the log file."""
+        batch = list(records)
+        if not batch:
+            return
+        for record in batch:
+            self._records.append(record)
+            self._index(record)
+        self._trim()
+        if not self._path:
+            return
+        if self._max_records > 0 and self._lines_on_disk >= 2 * self._max_records:
+            # Trimmed records still occupy lines on disk; reclaim them in bulk.
+            self.compact()
+            return
+        with self._path.open("ab") as f:
+            f.write(b"".join(_encode(r) for r in batch))
+        self._lines_on_disk += len(batch)
+
+    def export_json(self, path: Path) -> None:
+        """Write the log as a single ``{"records": [...]}`` JSON document."""
+        data = {"records": [_row(r) for r in self._records]}
+        path.write_bytes(json_codec.dumps(data, indent=True))
+
+    # iter_* accessors walk the internal indexes without copying them; the
+    # log must not be appended to while one of these is being consumed.
+    def iter_by_post(self, post_id: str) -> Iterator[DeliveryRecord]:
+        return iter(self._by_post.get(post_id, ()))
+
+    def iter_by_platform(self, platform: str) -> Iterator[DeliveryRecord]:
+        return iter(self._by_platform.get(platform, ()))
+
+    def iter_failures(self) -> Iterator[DeliveryRecord]:
+        return iter(self._failures)
+
+    def iter_records(self) -> Iterator[DeliveryRecord]:
+        return iter(self._records)
 
     def get_by_post(self, post_id: str) -> list[DeliveryRecord]:
-        return [r for r in self._records if r.post_id == post_id]
+        return list(self.iter_by_post(post_id))
 
     def get_by_platform(self, platform: str) -> list[DeliveryRecord]:
-        return [r for r in self._records if r.platform == platform]
+        return list(self.iter_by_platform(platform))
 
     def get_failures(self) -> list[DeliveryRecord]:
-        return [r for r in self._records if r.status == "failure"]
+        return list(self._failures)
 
     def has_been_delivered(self, post_id: str, platform: str) -> bool:
-        return any(
-            r.post_id == post_id and r.platform == platform and r.status == "success"
-            for r in self._records
-        )
+        return platform in self._delivered.get(post_id, ())
+
+    def get_delivered_platforms(self, post_id: str) -> set[str]:
+        """Platforms with at least one successful delivery of post_id."""
+        return set(self._delivered.get(post_id, ()))
 
     @property
     def total_records(self) -> int:
         return len(self._records)
 
+    @property
+    def failure_count(self) -> int:
+        return len(self._failures)
+
     @property
     def all_records(self) -> list[DeliveryRecord]:
         return list(self._records)
+
+
+def _is_legacy_document(raw: bytes) -> bool:
+    """True for the pre-JSONL ``{"records": [...]}`` format."""
+    head = raw.lstrip()
+    return head.startswith(b'{"records"') or head.split(b"\n", 1)[0].strip() == b"{"
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Suspend the cyclic GC while bulk-building acyclic objects.
+
+    Loading a large log allocates several objects per record; each
+    allocation burst would otherwise trigger full collections that find
+    nothing to free.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _row(record: DeliveryRecord) -> dict[str, Any]:
+    # Built field by field: dataclasses.asdict() deep-copies recursively
+    # and costs several times as much per record.
+    return {
+        "record_id": record.record_id,
+        "post_id": record.post_id,
+        "platform": record.platform,
+        "status": record.status,
+        "timestamp": record.timestamp,
+        "external_url": record.external_url,
+        "error": record.error,
+        "metadata": record.metadata,
+    }
+
+
+def _encode(record: DeliveryRecord) -> bytes:
+    return json_codec.dumps(_row(record)) + b"\n"
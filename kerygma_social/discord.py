@@ -6,14 +6,24 @@ formatted embeds and role mentions.
 
 from __future__ import annotations
 
-import json
-import urllib.error
-import urllib.request
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from kerygma_social import json_codec
+from kerygma_social.http_pool import HttpPool, HttpResponse, shared_pool
+from kerygma_social.rate_limiter import RateLimiter, RateLimiterConfig
 
-@dataclass
+if TYPE_CHECKING:
+    from kerygma_social.circuit_breaker import CircuitBreaker
+
+# Discord accepts at most this many embeds in one webhook message.
+MAX_EMBEDS_PER_MESSAGE = 10
+
+# Discord allows roughly 5 webhook executions per 2 seconds per webhook.
+DEFAULT_RATE_LIMIT = RateLimiterConfig(tokens_per_second=2.5, max_tokens=5.0)
+
+
+@dataclass(slots=True)
 class DiscordEmbed:
     title: str
     description: str
@@ -40,35 +50,44 @@ class DiscordEmbed:
 class DiscordWebhook:
     """Sends formatted messages to Discord channels via webhooks."""
 
-    def __init__(self, webhook_url: str, live: bool = False) -> None:
+    def __init__(
+        self,
+        webhook_url: str,
+        live: bool = False,
+        pool: HttpPool | None = None,
+        breaker: CircuitBreaker | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
         self.webhook_url = webhook_url
         self._live = live
         self._sent: list[dict[str, Any]] = []
+        self._http = pool or shared_pool()
+        self._breaker = breaker
+        # One bucket per webhook URL, kept in step with Discord's
+        # X-RateLimit-* response headers.
+        self._limiter = rate_limiter or RateLimiter(DEFAULT_RATE_LIMIT)
 
     def _send_to_webhook(self, payload: dict[str, Any]) -> dict[str, Any]:
         """Send a payload to the Discord webhook via HTTP POST."""
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            self.webhook_url,
-            data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        try:
-            with urllib.request.urlopen(req) as resp:
-                body = resp.read().decode("utf-8")
-                if body:
-                    return json.loads(body)
-                return {"ok": True, "status": resp.status}
-        except urllib.error.HTTPError as exc:
-            body = exc.read().decode("utf-8", errors="replace")
-            raise RuntimeError(
-                f"Discord webhook error {exc.code}: {body}"
-            ) from exc
-        except urllib.error.URLError as exc:
-            raise RuntimeError(
-                f"Discord connection error: {exc.reason}"
-            ) from exc
+        data = json_codec.dumps(payload)
+
+        def request() -> HttpResponse:
+            self._limiter.acquire()
+            try:
+                resp = self._http.request(
+                    "POST", self.webhook_url, body=data,
+                    headers={"Content-Type": "application/json"},
+                )
+            except OSError as exc:
+                raise RuntimeError(f"Discord connection error: {exc}") from exc
+            self._limiter.observe_headers(resp.headers)
+            resp.raise_for_status("Discord webhook error")
+            return resp
+
+        resp = request() if self._breaker is None else self._breaker.call(request)
+        if resp.body:
+            return resp.json()
+        return {"ok": True, "status": resp.status}
 
     def send_message(self, content: str) -> dict[str, Any]:
         result = {"content": content, "webhook": self.webhook_url, "id": len(self._sent) + 1}
@@ -81,15 +100,16 @@ class DiscordWebhook:
         return result
 
     def send_embed(self, embed: DiscordEmbed, content: str = "") -> dict[str, Any]:
+        embeds = [embed.to_payload()]
         result = {
             "content": content,
-            "embeds": [embed.to_payload()],
+            "embeds": embeds,
             "webhook": self.webhook_url,
             "id": len(self._sent) + 1,
         }
 
         if self._live:
-            payload: dict[str, Any] = {"embeds": [embed.to_payload()]}
+            payload: dict[str, Any] = {"embeds": embeds}
             if content:
                 payload["content"] = content
             api_result = self._send_to_webhook(payload)
@@ -98,6 +118,41 @@ class DiscordWebhook:
         self._sent.append(result)
         return result
 
+    def send_bulk(self, embeds: list[DiscordEmbed], content: str = "") -> list[dict[str, Any]]:
+        """Send embeds in as few webhook calls as possible.
+
+        Embeds are grouped into messages of up to ``MAX_EMBEDS_PER_MESSAGE``;
+        ``content`` is attached to the first message only.
+        """
+        results: list[dict[str, Any]] = []
+        for start in range(0, len(embeds), MAX_EMBEDS_PER_MESSAGE):
+            batch = [e.to_payload() for e in embeds[start:start + MAX_EMBEDS_PER_MESSAGE]]
+            text = content if start == 0 else ""
+            result = {
+                "content": text,
+                "embeds": batch,
+                "webhook": self.webhook_url,
+                "id": len(self._sent) + 1,
+            }
+
+            if self._live:
+                payload: dict[str, Any] = {"embeds": batch}
+                if text:
+                    payload["content"] = text
+                result["api_response"] = self._send_to_webhook(payload)
+
+            self._sent.append(result)
+            results.append(result)
+        return results
+
+    def close(self) -> None:
+        """Release the client.
+
+        The connection pool is shared (``shared_pool()`` or the one passed
+        in), so its keep-alive sockets stay open for other clients; the
+        shared pool closes them at interpreter exit.
+        """
+
     @property
     def messages_sent(self) -> int:
         return len(self._sent)
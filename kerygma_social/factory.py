@@ -6,21 +6,53 @@ to avoid duplicated client construction logic.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Any
 
 from kerygma_social.bluesky import BlueskyClient, BlueskyConfig
+from kerygma_social.circuit_breaker import CircuitBreaker
 from kerygma_social.config import SocialConfig
 from kerygma_social.delivery_log import DeliveryLog
 from kerygma_social.discord import DiscordWebhook
 from kerygma_social.ghost import GhostClient, GhostConfig
 from kerygma_social.mastodon import MastodonClient, MastodonConfig
 from kerygma_social.posse import PosseDistributor
+from kerygma_social.retry import RetryConfig
 
 if TYPE_CHECKING:
     from kerygma_profiles.registry import ProjectProfile
 
 
+# (PosseDistributor kwarg, platform, SocialConfig field that enables it,
+# builder). A client is built only when its gating field is non-empty.
+_CLIENT_SPECS: tuple[tuple[str, str, str, Callable[[SocialConfig], Any]], ...] = (
+    ("mastodon_client", "mastodon", "mastodon_instance_url", lambda cfg: MastodonClient(
+        MastodonConfig(
+            instance_url=cfg.mastodon_instance_url,
+            access_token=cfg.mastodon_access_token,
+            visibility=cfg.mastodon_visibility,
+        ),
+        live=cfg.live_mode,
+    )),
+    ("discord_webhook", "discord", "discord_webhook_url", lambda cfg: DiscordWebhook(
+        cfg.discord_webhook_url, live=cfg.live_mode,
+    )),
+    ("bluesky_client", "bluesky", "bluesky_handle", lambda cfg: BlueskyClient(
+        BlueskyConfig(handle=cfg.bluesky_handle, app_password=cfg.bluesky_app_password),
+        live=cfg.live_mode,
+    )),
+    ("ghost_client", "ghost", "ghost_api_url", lambda cfg: GhostClient(
+        GhostConfig(
+            admin_api_key=cfg.ghost_admin_api_key,
+            api_url=cfg.ghost_api_url,
+            newsletter_slug=cfg.ghost_newsletter_slug,
+        ),
+        live=cfg.live_mode,
+    )),
+)
+
+
 def build_distributor(
     cfg: SocialConfig,
     delivery_log: DeliveryLog | None = None,
@@ -33,50 +65,24 @@ def build_distributor(
             constructed from cfg.delivery_log_path.
 
     Returns:
-        A fully wired PosseDistributor.
+        A fully wired PosseDistributor. Every configured platform gets its
+        own circuit breaker (default thresholds), so an unreachable host
+        fails fast instead of costing a connection timeout per post, and
+        transient failures (5xx, 429, connection errors) are retried with
+        jittered exponential backoff.
     """
-    mastodon = None
-    if cfg.mastodon_instance_url:
-        mastodon = MastodonClient(
-            MastodonConfig(
-                instance_url=cfg.mastodon_instance_url,
-                access_token=cfg.mastodon_access_token,
-                visibility=getattr(cfg, "mastodon_visibility", "public"),
-            ),
-            live=cfg.live_mode,
-        )
-
-    discord = None
-    if cfg.discord_webhook_url:
-        discord = DiscordWebhook(cfg.discord_webhook_url, live=cfg.live_mode)
-
-    bluesky = None
-    if cfg.bluesky_handle:
-        bluesky = BlueskyClient(
-            BlueskyConfig(handle=cfg.bluesky_handle, app_password=cfg.bluesky_app_password),
-            live=cfg.live_mode,
-        )
-
-    ghost = None
-    if cfg.ghost_api_url:
-        ghost = GhostClient(
-            GhostConfig(
-                admin_api_key=cfg.ghost_admin_api_key,
-                api_url=cfg.ghost_api_url,
-                newsletter_slug=getattr(cfg, "ghost_newsletter_slug", ""),
-            ),
-            live=cfg.live_mode,
-        )
+    specs = [spec for spec in _CLIENT_SPECS if getattr(cfg, spec[2])]
+    clients = {kwarg: build(cfg) for kwarg, _, _, build in specs}
+    breakers = {platform: CircuitBreaker() for _, platform, _, _ in specs}
 
     if delivery_log is None:
         log_path = Path(cfg.delivery_log_path) if cfg.delivery_log_path else None
         delivery_log = DeliveryLog(log_path)
 
     return PosseDistributor(
-        mastodon_client=mastodon,
-        discord_webhook=discord,
-        bluesky_client=bluesky,
-        ghost_client=ghost,
+        **clients,
+        retry_config=RetryConfig(),
+        circuit_breakers=breakers,
         delivery_log=delivery_log,
     )
 
@@ -9,23 +9,27 @@ split as {id}:{secret} and signed into a short-lived token.
 
 from __future__ import annotations
 
-import json
-import urllib.error
-import urllib.request
+import time
 from dataclasses import dataclass, field
 from typing import Any
 
-from kerygma_social.ghost_jwt import build_ghost_jwt
+from kerygma_social import json_codec
+from kerygma_social.ghost_jwt import JWT_TTL, build_ghost_jwt
+from kerygma_social.http_pool import HttpPool, shared_pool
 
+# Refresh a cached token this many seconds before it expires, leaving
+# headroom for clock skew and request latency.
+_JWT_REFRESH_MARGIN = 30
 
-@dataclass
+
+@dataclass(slots=True)
 class GhostConfig:
     admin_api_key: str  # Format: {id}:{secret}
     api_url: str  # e.g. https://your-ghost.com
     newsletter_slug: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class GhostPost:
     title: str
     html: str
@@ -38,14 +42,27 @@ class GhostPost:
 class GhostClient:
     """Client for publishing to Ghost via the Admin API."""
 
-    def __init__(self, config: GhostConfig, live: bool = False) -> None:
+    def __init__(
+        self,
+        config: GhostConfig,
+        live: bool = False,
+        pool: HttpPool | None = None,
+    ) -> None:
         self.config = config
         self._live = live
         self._posted: list[dict[str, Any]] = []
+        self._http = pool or shared_pool()
+        self._jwt_cache: tuple[str, int] | None = None  # (token, exp)
 
     def _build_jwt(self) -> str:
-        """Build an HS256 JWT for Ghost Admin API authentication."""
-        return build_ghost_jwt(self.config.admin_api_key)
+        """Return an HS256 JWT for the Admin API, reusing it until near expiry."""
+        now = int(time.time())
+        cached = self._jwt_cache
+        if cached is not None and now < cached[1] - _JWT_REFRESH_MARGIN:
+            return cached[0]
+        token = build_ghost_jwt(self.config.admin_api_key, now=now)
+        self._jwt_cache = (token, now + JWT_TTL)
+        return token
 
     def create_post(self, post: GhostPost) -> dict[str, Any]:
         """Create a post on Ghost (live or mock)."""
@@ -82,23 +99,26 @@ class GhostClient:
         if self.config.newsletter_slug:
             body["posts"][0]["newsletter"] = {"slug": self.config.newsletter_slug}
 
-        data = json.dumps(body).encode("utf-8")
-        req = urllib.request.Request(
-            url, data=data,
+        data = json_codec.dumps(body)
+        resp = self._http.request(
+            "POST", url, body=data,
             headers={
                 "Content-Type": "application/json",
                 "Authorization": f"Ghost {token}",
             },
-            method="POST",
         )
-        try:
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                result = json.loads(resp.read().decode("utf-8"))
-                self._posted.append(result.get("posts", [{}])[0])
-                return result.get("posts", [{}])[0]
-        except urllib.error.HTTPError as exc:
-            body_text = exc.read().decode("utf-8", errors="replace")
-            raise RuntimeError(f"Ghost API error {exc.code}: {body_text}") from exc
+        resp.raise_for_status("Ghost API error")
+        created = resp.json().get("posts", [{}])[0]
+        self._posted.append(created)
+        return created
+
+    def close(self) -> None:
+        """Release the client.
+
+        The connection pool is shared (``shared_pool()`` or the one passed
+        in), so its keep-alive sockets stay open for other clients; the
+        shared pool closes them at interpreter exit.
+        """
 
     def format_for_ghost(self, title: str, body: str, canonical_url: str = "") -> GhostPost:
         """Convert pipeline content into a Ghost post with HTML formatting."""
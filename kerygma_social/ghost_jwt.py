@@ -12,16 +12,23 @@ from __future__ import annotations
 
 import hashlib
 import hmac
-import json
 import time
 from base64 import urlsafe_b64encode
+from functools import lru_cache
 
+from kerygma_social import json_codec
 
-def build_ghost_jwt(admin_api_key: str) -> str:
+# Token lifetime in seconds. Ghost rejects tokens valid for more than 5 minutes.
+JWT_TTL = 300
+
+
+def build_ghost_jwt(admin_api_key: str, *, now: int | None = None) -> str:
     """Build an HS256 JWT for Ghost Admin API authentication.
 
     Args:
         admin_api_key: Ghost admin key in "{id}:{secret}" format.
+        now: Issue time as a Unix timestamp (defaults to the current time).
+            The token expires at ``now + JWT_TTL``.
 
     Returns:
         Signed JWT string.
@@ -34,18 +41,36 @@ def build_ghost_jwt(admin_api_key: str) -> str:
         raise ValueError("Ghost admin_api_key must be in {id}:{secret} format")
     key_id, secret_hex = parts
 
-    header = {"alg": "HS256", "typ": "JWT", "kid": key_id}
-    now = int(time.time())
-    payload = {"iat": now, "exp": now + 300, "aud": "/admin/"}
+    if now is None:
+        now = int(time.time())
+    payload = {"iat": now, "exp": now + JWT_TTL, "aud": "/admin/"}
+    payload_b64 = _b64(json_codec.dumps(payload))
+
+    # Segments are ASCII bytes throughout; decode to str only at the end.
+    signing_input = _header_b64(key_id) + b"." + payload_b64
+    mac = _keyed_hmac(secret_hex).copy()
+    mac.update(signing_input)
+    signature = mac.digest()
+
+    return (signing_input + b"." + _b64(signature)).decode("ascii")
 
-    def _b64(data: bytes) -> str:
-        return urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
 
-    header_b64 = _b64(json.dumps(header, separators=(",", ":")).encode())
-    payload_b64 = _b64(json.dumps(payload, separators=(",", ":")).encode())
+def _b64(data: bytes) -> bytes:
+    return urlsafe_b64encode(data).rstrip(b"=")
 
-    signing_input = f"{header_b64}.{payload_b64}"
-    secret_bytes = bytes.fromhex(secret_hex)
-    signature = hmac.new(secret_bytes, signing_input.encode(), hashlib.sha256).digest()
 
-    return f"{signing_input}.{_b64(signature)}"
+# The header and keyed HMAC state depend only on the admin key, which is
+# fixed for a deployment, so both are derived once per key.
+@lru_cache(maxsize=8)
+def _header_b64(key_id: str) -> bytes:
+    return _b64(json_codec.dumps({"alg": "HS256", "typ": "JWT", "kid": key_id}))
+
+
+@lru_cache(maxsize=8)
+def _keyed_hmac(secret_hex: str) -> hmac.HMAC:
+    """HMAC-SHA256 with the key already absorbed; callers ``copy()`` it.
+
+    Copying skips re-deriving the inner/outer padded key blocks per token.
+    The cached object itself is never updated, so sharing it is safe.
+    """
+    return hmac.new(bytes.fromhex(secret_hex), digestmod=hashlib.sha256)
@@ -0,0 +1,240 @@
+"""Keep-alive HTTP connection pool for platform clients.
+
+``urllib.request.urlopen`` opens (and TLS-handshakes) a fresh socket for
+every call. Platform clients instead route requests through an ``HttpPool``,
+which keeps idle ``http.client`` connections per origin and hands them back
+out on the next request to the same host. Clients built without a ``pool=``
+share the process-wide ``shared_pool()``, so a client created per event or
+per profile still reuses the warm connection to its host. Stdlib-only, like
+the rest of the package.
+"""
+
+from __future__ import annotations
+
+import atexit
+import email.utils
+import http.client
+import select
+import ssl
+import threading
+import time
+import urllib.parse
+from dataclasses import dataclass
+from typing import Any
+
+from kerygma_social import json_codec
+
+_Origin = tuple[str, str, int]
+
+# Errors raised when the server has closed a pooled keep-alive socket. If
+# one is raised while the request is being sent, the server never received
+# the whole request, and it is replayed once on a fresh connection. Raised
+# later, the server may already have acted on the request before dropping
+# the socket, so only idempotent methods are replayed.
+_STALE_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class HttpError(RuntimeError):
+    """Raised when a platform API returns a non-2xx status.
+
+    ``retry_after`` holds the seconds from a ``Retry-After`` header, if the
+    response carried one; ``retry()`` waits at least that long.
+    """
+
+    def __init__(
+        self, status: int, body: str, message: str, retry_after: float | None = None,
+    ) -> None:
+        self.status = status
+        self.body = body
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
+class DeliveryUncertainError(Exception):
+    """A non-idempotent request failed after it was sent.
+
+    The server may already have acted on it (posted the status, embed or
+    post), so resending could publish it twice. Deliberately neither a
+    ``RuntimeError`` nor an ``OSError``: ``retry()`` never retries it.
+    """
+
+    def __init__(self, method: str, url: str, cause: BaseException) -> None:
+        self.method = method
+        self.url = url
+        super().__init__(f"{method} {url} may have been delivered before failing: {cause}")
+
+
+@dataclass(slots=True)
+class HttpResponse:
+    """A fully-read HTTP response."""
+    status: int
+    headers: http.client.HTTPMessage
+    body: bytes
+
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        # Parse the bytes directly; no intermediate str copy.
+        return json_codec.loads(self.body)
+
+    def raise_for_status(self, label: str) -> None:
+        """Raise HttpError as ``"{label} {status}: {body}"`` on non-2xx."""
+        if self.status >= 400:
+            body = self.text()
+            raise HttpError(
+                self.status, body, f"{label} {self.status}: {body}",
+                retry_after=_parse_retry_after(
+                    self.headers.get("Retry-After") if self.headers is not None else None,
+                ),
+            )
+
+
+class HttpPool:
+    """Thread-safe pool of keep-alive connections keyed by origin."""
+
+    def __init__(self, max_idle_per_host: int = 8, timeout: float = 30.0) -> None:
+        self._max_idle = max_idle_per_host
+        self._timeout = timeout
+        self._idle: dict[_Origin, list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._ssl_context: ssl.SSLContext | None = None
+
+    def _new_connection(self, origin: _Origin) -> http.client.HTTPConnection:
+        scheme, host, port = origin
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            return http.client.HTTPSConnection(
+                host, port, timeout=self._timeout, context=self._ssl_context,
+            )
+        return http.client.HTTPConnection(host, port, timeout=self._timeout)
+
+    def _checkout(self, origin: _Origin) -> tuple[http.client.HTTPConnection, bool]:
+        while True:
+            with self._lock:
+                idle = self._idle.get(origin)
+                conn = idle.pop() if idle else None
+            if conn is None:
+                return self._new_connection(origin), False
+            if not _is_dropped(conn):
+                return conn, True
+            conn.close()
+
+    def _checkin(self, origin: _Origin, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(origin, [])
+            if len(idle) < self._max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> HttpResponse:
+        """Send a request, reusing an idle connection to the same origin if any."""
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme or "http"
+        if scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {url}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        origin = (scheme, parts.hostname or "", port)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        conn, reused = self._checkout(origin)
+        sent = False
+        try:
+            for attempt in range(2):
+                sent = False
+                try:
+                    conn.request(method, path, body=body, headers=headers or {})
+                    sent = True
+                    resp = conn.getresponse()
+                    data = resp.read()
+                    break
+                except _STALE_ERRORS:
+                    if attempt or not reused or (sent and method not in _IDEMPOTENT_METHODS):
+                        raise
+                    conn.close()
+                    conn = self._new_connection(origin)
+        except (OSError, http.client.HTTPException) as exc:
+            conn.close()
+            if sent and method not in _IDEMPOTENT_METHODS:
+                raise DeliveryUncertainError(method, url, exc) from exc
+            raise
+        except BaseException:
+            conn.close()
+            raise
+
+        if resp.will_close:
+            conn.close()
+        else:
+            self._checkin(origin, conn)
+        return HttpResponse(status=resp.status, headers=resp.headers, body=data)
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    @property
+    def idle_connections(self) -> int:
+        with self._lock:
+            return sum(len(conns) for conns in self._idle.values())
+
+
+_shared: HttpPool | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_pool() -> HttpPool:
+    """The process-wide pool used by clients that are not given one.
+
+    Created on first use; its idle connections are closed at interpreter exit.
+    """
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = HttpPool()
+            atexit.register(_shared.close)
+        return _shared
+
+
+def _is_dropped(conn: http.client.HTTPConnection) -> bool:
+    """True if an idle connection's socket is closed or has been closed by the peer.
+
+    An idle keep-alive socket has nothing to read, so a readable one is at
+    EOF (or holds stray data); either way it must not carry a new request.
+    """
+    sock = conn.sock
+    if sock is None:
+        return True
+    try:
+        return bool(select.select([sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        return True
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
@@ -0,0 +1,58 @@
+"""JSON encoding helpers with optional orjson acceleration.
+
+When the optional ``orjson`` package is installed
+(``pip install social-automation[fast]``) it handles encoding and decoding;
+otherwise the stdlib ``json`` module produces equivalent output. Both paths
+emit UTF-8 bytes without ASCII escaping, so files written by either are
+interchangeable.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both.
+JSONDecodeError = json.JSONDecodeError
+
+_compact = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+_indented = json.JSONEncoder(indent=2, ensure_ascii=False).encode
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize obj to JSON bytes — compact, or 2-space indented."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return (_indented(obj) if indent else _compact(obj)).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def loads_lines(lines: list[bytes]) -> list[Any]:
+    """Decode JSON Lines, skipping lines that are not valid JSON.
+
+    The lines are first parsed as one JSON array, so the decoder loops in C
+    instead of being entered once per line; only input with a torn or
+    corrupt line pays for the line-by-line fallback.
+    """
+    try:
+        return loads(b"[" + b",".join(lines) + b"]")
+    except JSONDecodeError:
+        pass
+    rows = []
+    for line in lines:
+        try:
+            rows.append(loads(line))
+        except JSONDecodeError:
+            continue  # Torn or malformed line
+    return rows
@@ -6,22 +6,34 @@ for Mastodon instances in the Fediverse.
 
 from __future__ import annotations
 
-import json
-import urllib.error
-import urllib.request
+import re
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from typing import Any
 
+from kerygma_social import json_codec
+from kerygma_social.http_pool import HttpPool, shared_pool
+from kerygma_social.rate_limiter import RateLimiter, RateLimiterConfig
 
-@dataclass
+# Character limit of a stock Mastodon instance; many instances raise it.
+DEFAULT_MAX_CHARS = 500
+
+_NON_SPACE = re.compile(r"\S")
+
+# Mastodon's default API budget: 300 calls per 5 minutes per account.
+DEFAULT_RATE_LIMIT = RateLimiterConfig(tokens_per_second=1.0, max_tokens=300.0)
+
+
+@dataclass(slots=True)
 class MastodonConfig:
     instance_url: str
     access_token: str
     visibility: str = "public"
-    max_chars: int = 500
+    max_chars: int = DEFAULT_MAX_CHARS
 
 
-@dataclass
+@dataclass(slots=True)
 class Toot:
     content: str
     visibility: str = "public"
@@ -29,17 +41,27 @@ class Toot:
     media_ids: list[str] = field(default_factory=list)
     in_reply_to: str | None = None
 
-    def validate(self, max_chars: int = 500) -> bool:
+    def validate(self, max_chars: int = DEFAULT_MAX_CHARS) -> bool:
         return 0 < len(self.content) <= max_chars
 
 
 class MastodonClient:
     """Client for publishing and interacting with Mastodon."""
 
-    def __init__(self, config: MastodonConfig, live: bool = False) -> None:
+    def __init__(
+        self,
+        config: MastodonConfig,
+        live: bool = False,
+        pool: HttpPool | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
         self.config = config
         self._live = live
         self._posted: list[dict[str, Any]] = []
+        self._http = pool or shared_pool()
+        # One bucket per client, i.e. per instance and account; it is kept
+        # in step with the instance's X-RateLimit-* response headers.
+        self._limiter = rate_limiter or RateLimiter(DEFAULT_RATE_LIMIT)
 
     def _post_to_api(self, toot: Toot) -> dict[str, Any]:
         """Send a toot to the Mastodon API via HTTP POST."""
@@ -55,28 +77,21 @@ class MastodonClient:
         if toot.in_reply_to:
             payload["in_reply_to_id"] = toot.in_reply_to
 
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            url,
-            data=data,
-            headers={
-                "Authorization": f"Bearer {self.config.access_token}",
-                "Content-Type": "application/json",
-            },
-            method="POST",
-        )
+        data = json_codec.dumps(payload)
+        self._limiter.acquire()
         try:
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                return json.loads(resp.read().decode("utf-8"))
-        except urllib.error.HTTPError as exc:
-            body = exc.read().decode("utf-8", errors="replace")
-            raise RuntimeError(
-                f"Mastodon API error {exc.code}: {body}"
-            ) from exc
-        except urllib.error.URLError as exc:
-            raise RuntimeError(
-                f"Mastodon connection error: {exc.reason}"
-            ) from exc
+            resp = self._http.request(
+                "POST", url, body=data,
+                headers={
+                    "Authorization": f"Bearer {self.config.access_token}",
+                    "Content-Type": "application/json",
+                },
+            )
+        except OSError as exc:
+            raise RuntimeError(f"Mastodon connection error: {exc}") from exc
+        self._limiter.observe_headers(resp.headers)
+        resp.raise_for_status("Mastodon API error")
+        return resp.json()
 
     def post_toot(self, toot: Toot) -> dict[str, Any]:
         if not toot.validate(max_chars=self.config.max_chars):
@@ -96,42 +111,64 @@ class MastodonClient:
         self._posted.append(result)
         return result
 
-    def format_for_mastodon(self, title: str, url: str, tags: list[str] | None = None) -> str:
-        parts = [title, "", url]
-        if tags:
-            hashtags = " ".join(f"#{t}" for t in tags)
-            parts.append("")
-            parts.append(hashtags)
-        text = "\n".join(parts)
-        return text[:self.config.max_chars]
-
-    def split_for_thread(self, text: str) -> list[str]:
-        """Split long text into thread-safe chunks respecting word boundaries."""
-        limit = self.config.max_chars
-        if len(text) <= limit:
-            return [text]
-
-        chunks: list[str] = []
-        while text:
-            if len(text) <= limit:
-                chunks.append(text)
-                break
-            # Find last space within limit
-            split_at = text.rfind(" ", 0, limit)
-            if split_at <= 0:
-                split_at = limit
-            chunks.append(text[:split_at].rstrip())
-            text = text[split_at:].lstrip()
-        return chunks
-
-    def post_thread(self, toots: list[Toot]) -> list[dict[str, Any]]:
-        """Post a thread (chain of reply toots)."""
+    def format_for_mastodon(
+        self,
+        title: str,
+        url: str,
+        tags: list[str] | None = None,
+        truncate: bool = True,
+    ) -> str:
+        limit = self.config.max_chars if truncate else None
+        return _format_toot(title, url, tuple(tags) if tags else (), limit)
+
+    def format_batch(
+        self,
+        items: Iterable[tuple[str, str]],
+        tags: list[str] | None = None,
+        truncate: bool = True,
+    ) -> list[str]:
+        """Format many ``(title, url)`` pairs that share one tag set.
+
+        Same output as ``format_for_mastodon`` per item; the hashtag block
+        is joined once for the whole batch.
+        """
+        suffix = _hashtag_suffix(tags)
+        limit = self.config.max_chars if truncate else None
+        return [_fit(title, f"\n\n{url}{suffix}", limit) for title, url in items]
+
+    def would_exceed(self, title_len: int, url_len: int) -> bool:
+        """True if an untagged title + URL toot would not fit in one post."""
+        return title_len + url_len + 2 > self.config.max_chars  # "\n\n" separator
+
+    def split_for_thread(self, text: str, number: bool = False) -> list[str]:
+        """Split long text into thread-safe chunks respecting word boundaries.
+
+        With ``number=True`` each chunk of a multi-part thread ends in an
+        ``" i/N"`` marker, with room for it reserved during the split so
+        numbered chunks still fit in ``max_chars``.
+        """
+        if number:
+            return list(_split_numbered(text, self.config.max_chars))
+        return list(_split_text(text, self.config.max_chars))
+
+    def post_thread(
+        self,
+        toots: list[Toot],
+        send: Callable[..., dict[str, Any]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Post a thread (chain of reply toots).
+
+        Each toot is posted as ``send(post_toot, toot)`` when ``send`` is
+        given, so a caller can wrap every toot in its own retry: a failure
+        mid-thread resends only that toot, never the replies before it.
+        """
+        post = self.post_toot if send is None else partial(send, self.post_toot)
         results: list[dict[str, Any]] = []
         reply_to: str | None = None
 
         for toot in toots:
             toot.in_reply_to = reply_to
-            result = self.post_toot(toot)
+            result = post(toot)
             results.append(result)
             reply_to = result.get("id")
 
@@ -140,3 +177,77 @@ class MastodonClient:
     @property
     def post_count(self) -> int:
         return len(self._posted)
+
+    def close(self) -> None:
+        """Release the client.
+
+        The connection pool is shared (``shared_pool()`` or the one passed
+        in), so its keep-alive sockets stay open for other clients; the
+        shared pool closes them at interpreter exit.
+        """
+
+
+# Republish and retry paths render the same post again and again, and the
+# inputs are just a post's title, URL and tags, so memoize per process.
+@lru_cache(maxsize=4096)
+def _format_toot(title: str, url: str, tags: tuple[str, ...], limit: int | None) -> str:
+    return _fit(title, f"\n\n{url}{_hashtag_suffix(tags)}", limit)
+
+
+def _hashtag_suffix(tags: tuple[str, ...] | list[str] | None) -> str:
+    return f"\n\n#{' #'.join(tags)}" if tags else ""
+
+
+def _fit(title: str, tail: str, limit: int | None) -> str:
+    """``title + tail`` within limit, shortening only the title if possible."""
+    if limit is None or len(title) + len(tail) <= limit:
+        return title + tail
+    # Shorten the title, never the link or hashtags: a cut-off URL is a
+    # broken back-link. Only when they alone overflow is the tail cut.
+    budget = limit - len(tail)
+    if budget < 2:
+        return (title + tail)[:limit]
+    return title[:budget - 1].rstrip() + "\u2026" + tail
+
+
+@lru_cache(maxsize=1024)
+def _split_text(text: str, limit: int) -> tuple[str, ...]:
+    if len(text) <= limit:
+        return (text,)
+
+    # Walk the text by index: slicing off the remainder after every chunk
+    # would copy the rest of the text each time (quadratic in chunk count).
+    chunks: list[str] = []
+    end = len(text)
+    start = 0
+    while start < end:
+        if end - start <= limit:
+            chunks.append(text[start:])
+            break
+        # Find last space within limit
+        split_at = text.rfind(" ", start, start + limit)
+        if split_at <= start:
+            split_at = start + limit
+        chunks.append(text[start:split_at].rstrip())
+        next_word = _NON_SPACE.search(text, split_at)
+        start = next_word.start() if next_word else end
+    return tuple(chunks)
+
+
+@lru_cache(maxsize=1024)
+def _split_numbered(text: str, limit: int) -> tuple[str, ...]:
+    if len(text) <= limit:
+        return (text,)
+    # Reserve room for " i/N", guessing N's width from the length; word
+    # boundaries can add chunks, so widen and re-split if N outgrows it.
+    digits = len(str(-(-len(text) // limit)))
+    while True:
+        budget = limit - (2 * digits + 2)
+        if budget < 1:
+            raise ValueError("max_chars is too small to number a thread")
+        chunks = _split_text(text, budget)
+        if len(str(len(chunks))) <= digits:
+            break
+        digits = len(str(len(chunks)))
+    total = len(chunks)
+    return tuple(f"{chunk} {i}/{total}" for i, chunk in enumerate(chunks, 1))
@@ -9,10 +9,25 @@ and delivery log persistence.
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from kerygma_social.bluesky import MAX_WRITES_PER_BATCH, BlueskyPost
+from kerygma_social.circuit_breaker import CircuitOpenError
+from kerygma_social.delivery_log import DeliveryRecord
+from kerygma_social.discord import DiscordEmbed
+from kerygma_social.http_pool import DeliveryUncertainError
+from kerygma_social.mastodon import Toot
+from kerygma_social.rate_limiter import RateLimitExceeded
+from kerygma_social.retry import RetryError, retry
 
 if TYPE_CHECKING:
     from kerygma_social.bluesky import BlueskyClient
@@ -34,6 +49,18 @@ class Platform(Enum):
     TWITTER = "twitter"
 
 
+# Discord embed colors by content category; the first category found in
+# the post title or opening body wins.
+_CATEGORY_COLORS: tuple[tuple[str, int], ...] = (
+    ("launch", 0x2ECC71),         # green
+    ("release", 0x3498DB),        # blue
+    ("essay", 0xF1C40F),          # gold
+    ("community", 0x9B59B6),      # purple
+    ("institutional", 0x95A5A6),  # gray
+)
+_DEFAULT_EMBED_COLOR = 0x5865F2  # Discord blurple
+
+
 class SyndicationStatus(Enum):
     PENDING = "pending"
     PUBLISHED = "published"
@@ -41,7 +68,7 @@ class SyndicationStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(slots=True)
 class SyndicationRecord:
     platform: Platform
     status: SyndicationStatus = SyndicationStatus.PENDING
@@ -49,17 +76,56 @@ class SyndicationRecord:
     published_at: datetime | None = None
     error: str | None = None
 
-    def mark_published(self, url: str) -> None:
+    def mark_published(self, url: str, now: datetime | None = None) -> None:
+        """Record success; ``now`` lets a batch stamp its records with one clock read."""
         self.status = SyndicationStatus.PUBLISHED
         self.external_url = url
-        self.published_at = datetime.now()
+        self.published_at = now or datetime.now()
 
     def mark_failed(self, error: str) -> None:
         self.status = SyndicationStatus.FAILED
         self.error = error
 
 
-@dataclass
+# Concurrent API calls allowed per platform. Bulk syndication fans many
+# posts out at once; past these limits Mastodon and Discord answer 429.
+DEFAULT_MAX_IN_FLIGHT: dict[str, int] = {"mastodon": 5, "discord": 10}
+
+_DEDUP_REASON = "Already delivered (dedup)"
+# What a platform call is expected to raise: HttpError (a RuntimeError),
+# transport errors (OSError), a POST lost after sending
+# (DeliveryUncertainError), rejected or unparseable payloads (ValueError),
+# and the resilience layers giving up.
+_API_ERRORS = (
+    RuntimeError, ValueError, OSError, DeliveryUncertainError,
+    RetryError, CircuitOpenError, RateLimitExceeded,
+)
+
+_NO_CLIENT_REASON = {p: f"No client configured for {p.value}" for p in Platform}
+
+# Stand-in URL prefix per platform for API responses that carry no link
+# (e.g. dry-run clients), built once rather than formatted per record.
+_PLACEHOLDER_URL = {
+    p: f"at://{p.value}.example.com/" if p is Platform.BLUESKY else f"https://{p.value}.example.com/"
+    for p in Platform
+}
+
+
+def _result_url(result: dict[str, Any], key: str, platform: Platform, post_id: str) -> str:
+    url = result.get(key)
+    return _PLACEHOLDER_URL[platform] + post_id if url is None else url
+
+
+def _skipped(platform: Platform, reason: str) -> SyndicationRecord:
+    """A fresh SKIPPED record, built in a single constructor call.
+
+    Records are mutable and handed to callers, so each skip gets its own
+    instance rather than a shared one.
+    """
+    return SyndicationRecord(platform=platform, status=SyndicationStatus.SKIPPED, error=reason)
+
+
+@dataclass(slots=True)
 class ContentPost:
     post_id: str
     title: str
@@ -68,13 +134,35 @@ class ContentPost:
     platforms: list[Platform] = field(default_factory=list)
     syndications: list[SyndicationRecord] = field(default_factory=list)
     created_at: datetime = field(default_factory=datetime.now)
+    # Platform -> record index over `syndications`, rebuilt when that list
+    # is replaced or changes length.
+    _syndication_map: dict[Platform, SyndicationRecord] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+    _syndication_source: tuple[list[SyndicationRecord] | None, int] = field(
+        default=(None, 0), init=False, repr=False, compare=False,
+    )
 
     def add_platform(self, platform: Platform) -> None:
         if platform not in self.platforms:
             self.platforms.append(platform)
 
     def get_syndication(self, platform: Platform) -> SyndicationRecord | None:
-        return next((s for s in self.syndications if s.platform == platform), None)
+        source, size = self._syndication_source
+        if source is not self.syndications or size != len(self.syndications):
+            self._index_syndications()
+        return self._syndication_map.get(platform)
+
+    def _set_syndications(self, records: list[SyndicationRecord]) -> None:
+        """Replace syndications and index them in the same step."""
+        self.syndications = records
+        self._index_syndications()
+
+    def _index_syndications(self) -> None:
+        # Built back to front so the first record per platform wins, as
+        # with a forward scan, without a setdefault() call per record.
+        self._syndication_map = {r.platform: r for r in reversed(self.syndications)}
+        self._syndication_source = (self.syndications, len(self.syndications))
 
 
 class PosseDistributor:
@@ -84,6 +172,8 @@ class PosseDistributor:
     - retry_config: Exponential backoff on transient failures
     - circuit_breakers: Per-platform circuit breakers
     - rate_limiter: Shared rate limiter across platforms
+    - max_in_flight: Per-platform cap on concurrent API calls (defaults to
+      ``DEFAULT_MAX_IN_FLIGHT``), so batch syndication cannot flood one host
     - delivery_log: Persistent record of all dispatch attempts
     """
 
@@ -97,6 +187,7 @@ class PosseDistributor:
         circuit_breakers: dict[str, CircuitBreaker] | None = None,
         rate_limiter: RateLimiter | None = None,
         delivery_log: DeliveryLog | None = None,
+        max_in_flight: dict[str, int] | None = None,
     ) -> None:
         self._posts: dict[str, ContentPost] = {}
         self._mastodon = mastodon_client
@@ -104,9 +195,30 @@ class PosseDistributor:
         self._bluesky = bluesky_client
         self._ghost = ghost_client
         self._retry_config = retry_config
-        self._circuit_breakers = circuit_breakers or {}
+        self._circuit_breakers = dict(circuit_breakers or {})
         self._rate_limiter = rate_limiter
+        limits = DEFAULT_MAX_IN_FLIGHT if max_in_flight is None else max_in_flight
+        self._in_flight = {
+            platform: threading.BoundedSemaphore(limit)
+            for platform, limit in limits.items() if limit > 0
+        }
+        # post_id -> syndication currently running for it (single-flight).
+        self._inflight: dict[str, Future[list[SyndicationRecord]]] = {}
+        self._inflight_lock = threading.Lock()
+        # Per-platform resilience runners, built on first use.
+        self._runners: dict[str, Callable[..., Any]] = {}
         self._delivery_log = delivery_log
+        self._embed_fragments: dict[str, tuple[str, str, int]] = {}
+        # Syndication handler per configured platform, resolved once.
+        self._handlers: dict[Platform, Callable[[ContentPost], SyndicationRecord]] = {}
+        if mastodon_client is not None:
+            self._handlers[Platform.MASTODON] = self._syndicate_mastodon
+        if discord_webhook is not None:
+            self._handlers[Platform.DISCORD] = self._syndicate_discord
+        if bluesky_client is not None:
+            self._handlers[Platform.BLUESKY] = self._syndicate_bluesky
+        if ghost_client is not None:
+            self._handlers[Platform.GHOST] = self._syndicate_ghost
 
     def create_post(
         self,
@@ -115,12 +227,16 @@ class PosseDistributor:
         body: str,
         canonical_url: str,
         platforms: list[Platform] | None = None,
+        created_at: datetime | None = None,
     ) -> ContentPost:
+        """Register a post; bulk imports can pass one shared ``created_at``."""
         post = ContentPost(
             post_id=post_id, title=title, body=body,
             canonical_url=canonical_url, platforms=platforms or [],
+            created_at=created_at or datetime.now(),
         )
         self._posts[post_id] = post
+        self._embed_fragments.pop(post_id, None)
         return post
 
     def _with_resilience(
@@ -132,128 +248,152 @@ class PosseDistributor:
     ) -> Any:
         """Wrap a syndication call with rate limiter, circuit breaker, and retry.
 
-        Ordering: rate limiter (outermost) → circuit breaker (fail-fast) → retry → API call.
+        Ordering: rate limiter (outermost) → in-flight cap → circuit breaker
+        (fail-fast) → retry → API call.
         Retry wraps only the raw API call so CircuitOpenError propagates immediately
         instead of being retried pointlessly.
         """
-        # Rate limiter (outermost)
-        if self._rate_limiter:
-            self._rate_limiter.acquire(block=True)
+        runner = self._runners.get(platform)
+        if runner is None:
+            runner = self._runners[platform] = self._build_runner(platform)
+        return runner(func, *args, **kwargs)
+
+    def _build_runner(self, platform: str) -> Callable[..., Any]:
+        """Compose the resilience layers configured for platform into one callable.
 
-        # Circuit breaker (fail-fast before retry)
+        The layers are fixed at construction, so the branching happens once
+        per platform; the runner takes the API call as its first argument.
+        """
         cb = self._circuit_breakers.get(platform)
-        if cb:
+        retry_config = self._retry_config
+        if cb and retry_config:
             # Let CircuitOpenError propagate immediately — no retry around it
-            def _retryable() -> Any:
+            def run(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+                return cb.call(retry, partial(func, *args, **kwargs), retry_config)
+        elif cb:
+            run = cb.call
+        elif retry_config:
+            def run(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+                return retry(func, retry_config, None, *args, **kwargs)
+        else:
+            def run(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
                 return func(*args, **kwargs)
 
-            if self._retry_config:
-                from kerygma_social.retry import retry
-                return cb.call(retry, _retryable, self._retry_config)
-            return cb.call(func, *args, **kwargs)
+        slots = self._in_flight.get(platform)
+        if slots is not None:
+            bounded = run
 
-        # No circuit breaker — retry wraps raw call
-        if self._retry_config:
-            from kerygma_social.retry import retry
-            return retry(func, self._retry_config, None, *args, **kwargs)
+            def run(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+                with slots:
+                    return bounded(func, *args, **kwargs)
 
-        return func(*args, **kwargs)
+        limiter = self._rate_limiter
+        if limiter is None:
+            return run
+        inner = run
 
-    def _log_delivery(
-        self, post_id: str, platform: str, record: SyndicationRecord,
-    ) -> None:
-        if not self._delivery_log:
-            return
-        from kerygma_social.delivery_log import DeliveryRecord
-        self._delivery_log.append(DeliveryRecord(
+        def run_limited(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+            limiter.acquire(block=True)
+            return inner(func, *args, **kwargs)
+        return run_limited
+
+    @staticmethod
+    def _delivery_record(post_id: str, record: SyndicationRecord) -> DeliveryRecord:
+        platform = record.platform.value
+        return DeliveryRecord(
             record_id=f"{post_id}-{platform}",
             post_id=post_id,
             platform=platform,
-            status="success" if record.status == SyndicationStatus.PUBLISHED else "failure",
+            status="success" if record.status is SyndicationStatus.PUBLISHED else "failure",
             external_url=record.external_url or "",
             error=record.error or "",
-        ))
+        )
 
     def _syndicate_mastodon(self, post: ContentPost) -> SyndicationRecord:
-        from kerygma_social.mastodon import Toot
-
         record = SyndicationRecord(platform=Platform.MASTODON)
-        text = self._mastodon.format_for_mastodon(post.title, post.canonical_url)
 
-        # Use threading for long content that exceeds the character limit
-        if len(text) > self._mastodon.config.max_chars:
+        # Use threading for long content that exceeds the character limit.
+        # Decide from the part lengths before formatting: the common short
+        # case formats once and posts a single toot.
+        if self._mastodon.would_exceed(len(post.title), len(post.canonical_url)):
+            text = self._mastodon.format_for_mastodon(
+                post.title, post.canonical_url, truncate=False,
+            )
             chunks = self._mastodon.split_for_thread(text)
             toots = [Toot(content=chunk) for chunk in chunks]
             try:
-                results = self._with_resilience(
-                    "mastodon", self._mastodon.post_thread, toots,
+                # Resilience wraps each toot, not the thread: a retry after a
+                # mid-thread failure must not repost the toots before it.
+                results = self._mastodon.post_thread(
+                    toots, send=partial(self._with_resilience, "mastodon"),
                 )
                 urls = [r.get("url", "") for r in results if r.get("url")]
-                url = urls[0] if urls else f"https://mastodon.example.com/{post.post_id}"
+                url = urls[0] if urls else _PLACEHOLDER_URL[Platform.MASTODON] + post.post_id
                 record.mark_published(url)
-            except Exception as exc:
+            except _API_ERRORS as exc:
                 record.mark_failed(str(exc))
         else:
+            text = self._mastodon.format_for_mastodon(post.title, post.canonical_url)
             toot = Toot(content=text)
             try:
                 result = self._with_resilience(
                     "mastodon", self._mastodon.post_toot, toot,
                 )
-                url = result.get("url", f"https://mastodon.example.com/{post.post_id}")
+                url = _result_url(result, "url", Platform.MASTODON, post.post_id)
                 record.mark_published(url)
-            except Exception as exc:
+            except _API_ERRORS as exc:
                 record.mark_failed(str(exc))
         return record
 
-    def _syndicate_discord(self, post: ContentPost) -> SyndicationRecord:
-        from kerygma_social.discord import DiscordEmbed
+    def _discord_fragments(self, post: ContentPost) -> tuple[str, str, int]:
+        """Embed title, description, and color for a post, computed once per post.
 
-        record = SyndicationRecord(platform=Platform.DISCORD)
+        The "Published" timestamp field is not cached; it is added per attempt.
+        """
+        cached = self._embed_fragments.get(post.post_id)
+        if cached is not None:
+            return cached
 
-        # Build richer embed: split body into title line + description,
-        # use category-based color, add timestamp
+        # Split body into title line + description
         lines = post.body.strip().split("\n", 1)
         embed_title = lines[0].strip() if lines else post.title
         embed_desc = lines[1].strip() if len(lines) > 1 else post.body[:200]
 
-        # Category-based embed colors
-        category_colors = {
-            "launch": 0x2ECC71,        # green
-            "release": 0x3498DB,       # blue
-            "essay": 0xF1C40F,         # gold
-            "community": 0x9B59B6,     # purple
-            "institutional": 0x95A5A6, # gray
-        }
-        color = 0x5865F2  # default Discord blurple
-        for category, cat_color in category_colors.items():
-            if category in post.title.lower() or category in post.body[:100].lower():
-                color = cat_color
-                break
+        haystack = f"{post.title}\n{post.body[:100]}".lower()
+        color = next(
+            (c for category, c in _CATEGORY_COLORS if category in haystack),
+            _DEFAULT_EMBED_COLOR,
+        )
+        fragments = (embed_title, embed_desc[:4096], color)
+        self._embed_fragments[post.post_id] = fragments
+        return fragments
+
+    def _syndicate_discord(self, post: ContentPost) -> SyndicationRecord:
+        record = SyndicationRecord(platform=Platform.DISCORD)
 
+        embed_title, embed_desc, color = self._discord_fragments(post)
         embed = DiscordEmbed(
             title=embed_title,
-            description=embed_desc[:4096],
+            description=embed_desc,
             url=post.canonical_url,
             color=color,
         )
         embed.add_field(
             name="Published",
-            value=datetime.now().strftime("%Y-%m-%d %H:%M UTC"),
+            value=datetime.now(UTC).strftime("%Y-%m-%d %H:%M UTC"),
             inline=True,
         )
         try:
             result = self._with_resilience(
                 "discord", self._discord.send_embed, embed,
             )
-            url = result.get("url", f"https://discord.example.com/{post.post_id}")
+            url = _result_url(result, "url", Platform.DISCORD, post.post_id)
             record.mark_published(url)
-        except Exception as exc:
+        except _API_ERRORS as exc:
             record.mark_failed(str(exc))
         return record
 
     def _syndicate_bluesky(self, post: ContentPost) -> SyndicationRecord:
-        from kerygma_social.bluesky import BlueskyPost
-
         record = SyndicationRecord(platform=Platform.BLUESKY)
         text = self._bluesky.format_for_bluesky(post.title, post.canonical_url)
         bsky_post = BlueskyPost(text=text)
@@ -261,12 +401,48 @@ class PosseDistributor:
             result = self._with_resilience(
                 "bluesky", self._bluesky.post, bsky_post,
             )
-            url = result.get("uri", f"at://bluesky.example.com/{post.post_id}")
+            url = _result_url(result, "uri", Platform.BLUESKY, post.post_id)
             record.mark_published(url)
-        except Exception as exc:
+        except _API_ERRORS as exc:
             record.mark_failed(str(exc))
         return record
 
+    def _syndicate_bluesky_batch(self, posts: list[ContentPost]) -> list[SyndicationRecord]:
+        """Bluesky records for several posts, created one applyWrites call per chunk.
+
+        Each chunk goes through the resilience layers on its own, so a retry
+        resends only the chunk that failed, and posts from chunks that went
+        through stay published when a later chunk fails.
+        """
+        records = [SyndicationRecord(platform=Platform.BLUESKY) for _ in posts]
+        for start in range(0, len(posts), MAX_WRITES_PER_BATCH):
+            chunk = posts[start:start + MAX_WRITES_PER_BATCH]
+            chunk_records = records[start:start + MAX_WRITES_PER_BATCH]
+            try:
+                bsky_posts = [
+                    BlueskyPost(
+                        text=self._bluesky.format_for_bluesky(post.title, post.canonical_url),
+                    )
+                    for post in chunk
+                ]
+                results = self._with_resilience(
+                    "bluesky", self._bluesky.post_batch, bsky_posts,
+                )
+            except Exception as exc:  # noqa: BLE001 — no _dispatch() net around batches
+                for record in chunk_records:
+                    record.mark_failed(str(exc))
+                continue
+            # One request created the chunk, so its records share one timestamp.
+            now = datetime.now()
+            for n, (post, record) in enumerate(zip(chunk, chunk_records)):
+                if n < len(results):
+                    record.mark_published(
+                        _result_url(results[n], "uri", Platform.BLUESKY, post.post_id), now,
+                    )
+                else:
+                    record.mark_failed("Bluesky applyWrites returned no result for this post")
+        return records
+
     def _syndicate_ghost(self, post: ContentPost) -> SyndicationRecord:
         record = SyndicationRecord(platform=Platform.GHOST)
         ghost_post = self._ghost.format_for_ghost(
@@ -276,43 +452,209 @@ class PosseDistributor:
             result = self._with_resilience(
                 "ghost", self._ghost.create_post, ghost_post,
             )
-            url = result.get("url", f"https://ghost.example.com/{post.post_id}")
+            url = _result_url(result, "url", Platform.GHOST, post.post_id)
             record.mark_published(url)
-        except Exception as exc:
+        except _API_ERRORS as exc:
             record.mark_failed(str(exc))
         return record
 
+    def _dedup_records(self, post: ContentPost) -> list[SyndicationRecord | None]:
+        """A SKIPPED record per already-delivered platform, None for the rest."""
+        if self._delivery_log is None:
+            return [None] * len(post.platforms)
+        # One index lookup for the post, then set membership per platform.
+        delivered = self._delivery_log.get_delivered_platforms(post.post_id)
+        return [
+            _skipped(p, _DEDUP_REASON) if p.value in delivered else None
+            for p in post.platforms
+        ]
+
+    def _dispatch(self, post: ContentPost, platform: Platform) -> SyndicationRecord:
+        handler = self._handlers.get(platform)
+        if handler is None:
+            return _skipped(platform, _NO_CLIENT_REASON[platform])
+        try:
+            return handler(post)
+        except Exception as exc:  # noqa: BLE001 — last resort, see below
+            # Handlers record API failures themselves; this catches anything
+            # else (e.g. a formatting bug) so one platform cannot abort the
+            # fan-out and lose the others' results.
+            record = SyndicationRecord(platform=platform)
+            record.mark_failed(str(exc))
+            return record
+
     def syndicate(self, post_id: str) -> list[SyndicationRecord]:
-        post = self._posts[post_id]
-        records: list[SyndicationRecord] = []
-
-        for platform in post.platforms:
-            # Deduplication: skip if already delivered successfully
-            if self._delivery_log and self._delivery_log.has_been_delivered(post_id, platform.value):
-                record = SyndicationRecord(platform=platform)
-                record.status = SyndicationStatus.SKIPPED
-                record.error = "Already delivered (dedup)"
-                records.append(record)
-                continue
+        """Syndicate to all platforms, dispatching them concurrently.
 
-            if platform == Platform.MASTODON and self._mastodon is not None:
-                record = self._syndicate_mastodon(post)
-            elif platform == Platform.DISCORD and self._discord is not None:
-                record = self._syndicate_discord(post)
-            elif platform == Platform.BLUESKY and self._bluesky is not None:
-                record = self._syndicate_bluesky(post)
-            elif platform == Platform.GHOST and self._ghost is not None:
-                record = self._syndicate_ghost(post)
+        Each platform is dispatched in its own worker thread, so total
+        latency is the slowest platform rather than the sum. Dedup checks
+        and delivery-log writes stay on the calling thread, and records
+        come back in ``post.platforms`` order.
+
+        Concurrent calls for the same post_id (from threads or
+        :meth:`syndicate_async`) coalesce: one call does the work and the
+        others wait for and return its result.
+        """
+        flight, leader = self._join_flight(post_id)
+        if not leader:
+            return flight.result()
+        with self._leading(post_id, flight):
+            post = self._posts[post_id]
+            records = self._dedup_records(post)
+            pending = [i for i, record in enumerate(records) if record is None]
+            if len(pending) > 1:
+                with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+                    results = list(pool.map(
+                        lambda i: self._dispatch(post, post.platforms[i]), pending,
+                    ))
             else:
-                record = SyndicationRecord(platform=platform)
-                record.status = SyndicationStatus.SKIPPED
-                record.error = f"No client configured for {platform.value}"
-            records.append(record)
-            self._log_delivery(post_id, platform.value, record)
+                results = [self._dispatch(post, post.platforms[i]) for i in pending]
+            return self._settle(flight, self._collect(post, records, pending, results))
 
-        post.syndications = records
+    async def syndicate_async(self, post_id: str) -> list[SyndicationRecord]:
+        """Async variant of :meth:`syndicate` for callers already in an event loop.
+
+        The blocking platform clients run via ``asyncio.to_thread``.
+        """
+        flight, leader = self._join_flight(post_id)
+        if not leader:
+            return await asyncio.wrap_future(flight)
+        with self._leading(post_id, flight):
+            post = self._posts[post_id]
+            records = self._dedup_records(post)
+            pending = [i for i, record in enumerate(records) if record is None]
+            results = await asyncio.gather(*(
+                asyncio.to_thread(self._dispatch, post, post.platforms[i]) for i in pending
+            ))
+            return self._settle(flight, self._collect(post, records, pending, results))
+
+    def _join_flight(self, post_id: str) -> tuple[Future[list[SyndicationRecord]], bool]:
+        """Return the in-flight syndication of post_id, and whether the caller leads it."""
+        with self._inflight_lock:
+            flight = self._inflight.get(post_id)
+            if flight is not None:
+                return flight, False
+            flight = self._inflight[post_id] = Future()
+            return flight, True
+
+    @contextmanager
+    def _leading(
+        self, post_id: str, flight: Future[list[SyndicationRecord]],
+    ) -> Iterator[None]:
+        """Run the leader's work; hand any failure to waiters and end the flight."""
+        try:
+            yield
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[post_id]
+
+    @staticmethod
+    def _settle(
+        flight: Future[list[SyndicationRecord]], records: list[SyndicationRecord],
+    ) -> list[SyndicationRecord]:
+        flight.set_result(records)
         return records
 
+    async def syndicate_batch_async(
+        self, post_ids: Iterable[str],
+    ) -> dict[str, list[SyndicationRecord]]:
+        """Syndicate many posts at once, e.g. for a backfill.
+
+        Every post's platforms are dispatched together, so the wall-clock
+        time for a batch tracks the slowest call rather than one round of
+        platform calls per post. Bluesky posts are created with a single
+        ``applyWrites`` request instead of one request each. Rate limiters
+        and circuit breakers still apply per platform. Repeated ids are
+        syndicated once; ids already being syndicated elsewhere are awaited.
+        """
+        unique_ids = list(dict.fromkeys(post_ids))
+        flights = {post_id: self._join_flight(post_id) for post_id in unique_ids}
+        results: dict[str, list[SyndicationRecord]] = {}
+        with ExitStack() as stack:
+            led = [post_id for post_id, (_, leader) in flights.items() if leader]
+            for post_id in led:
+                stack.enter_context(self._leading(post_id, flights[post_id][0]))
+            plans = []
+            for post_id in led:
+                post = self._posts[post_id]
+                records = self._dedup_records(post)
+                pending = [i for i, record in enumerate(records) if record is None]
+                plans.append((post, records, pending))
+
+            # (post index, platform index) per call; Bluesky legs are pulled
+            # out into one batched call when there is more than one.
+            jobs = [(n, i) for n, (_, _, pending) in enumerate(plans) for i in pending]
+            bluesky_jobs = []
+            if Platform.BLUESKY in self._handlers:
+                bluesky_jobs = [
+                    (n, i) for n, i in jobs if plans[n][0].platforms[i] is Platform.BLUESKY
+                ]
+            if len(bluesky_jobs) > 1:
+                batched = set(bluesky_jobs)
+                jobs = [job for job in jobs if job not in batched]
+            else:
+                bluesky_jobs = []
+
+            calls = [
+                asyncio.to_thread(self._dispatch, plans[n][0], plans[n][0].platforms[i])
+                for n, i in jobs
+            ]
+            if bluesky_jobs:
+                calls.append(asyncio.to_thread(
+                    self._syndicate_bluesky_batch, [plans[n][0] for n, _ in bluesky_jobs],
+                ))
+            outcomes = await asyncio.gather(*calls)
+            dispatched = dict(zip(jobs, outcomes))
+            if bluesky_jobs:
+                dispatched.update(zip(bluesky_jobs, outcomes[-1]))
+
+            # Every post finished in the same gather, so the whole batch is
+            # logged with one write before any waiter sees a result.
+            deferred: list[DeliveryRecord] = []
+            collected = [
+                self._collect(
+                    post, records, pending, [dispatched[(n, i)] for i in pending], deferred,
+                )
+                for n, (post, records, pending) in enumerate(plans)
+            ]
+            if deferred:
+                self._delivery_log.append_batch(deferred)  # type: ignore[union-attr]
+            for (post, _, _), syndications in zip(plans, collected):
+                results[post.post_id] = self._settle(flights[post.post_id][0], syndications)
+
+        for post_id, (flight, leader) in flights.items():
+            if not leader:
+                results[post_id] = await asyncio.wrap_future(flight)
+        return {post_id: results[post_id] for post_id in unique_ids}
+
+    def _collect(
+        self,
+        post: ContentPost,
+        records: list[SyndicationRecord | None],
+        pending: list[int],
+        results: list[SyndicationRecord],
+        deferred: list[DeliveryRecord] | None = None,
+    ) -> list[SyndicationRecord]:
+        """Slot dispatch results into place and log them, in platform order.
+
+        With ``deferred``, delivery records are added to it for the caller
+        to write rather than written here.
+        """
+        for i, record in zip(pending, results):
+            records[i] = record
+        if self._delivery_log is not None:
+            rows = (self._delivery_record(post.post_id, record) for record in results)
+            if deferred is None:
+                # One write for the whole post rather than one per platform.
+                self._delivery_log.append_batch(rows)
+            else:
+                deferred.extend(rows)
+        post._set_syndications([r for r in records if r is not None])
+        return post.syndications
+
     def get_post(self, post_id: str) -> ContentPost:
         return self._posts[post_id]
 
@@ -1,14 +1,19 @@
 """Token bucket rate limiter for social API calls.
 
 Prevents exceeding platform rate limits by controlling the
-rate of outgoing requests.
+rate of outgoing requests. A limiter can also be tightened from a
+platform's rate-limit response headers (``observe_headers``), so the
+bucket follows the server's own count rather than drifting from it.
 """
 
 from __future__ import annotations
 
+import threading
 import time
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
-from typing import Callable
+from datetime import datetime
+from typing import Any
 
 
 class RateLimitExceeded(Exception):
@@ -39,16 +44,20 @@ class RateLimiter:
         cfg = config or RateLimiterConfig()
         self._rate = cfg.tokens_per_second
         self._max = cfg.max_tokens
-        self._tokens = cfg.initial_tokens if cfg.initial_tokens is not None else cfg.max_tokens
         self._clock = clock or time.monotonic
         self._sleep = sleep_func or time.sleep
-        self._last_refill = self._clock()
-
-    def _refill(self) -> None:
-        now = self._clock()
-        elapsed = now - self._last_refill
-        self._tokens = min(self._max, self._tokens + elapsed * self._rate)
-        self._last_refill = now
+        # The bucket is stored as the moment it will be full again rather
+        # than (tokens, last_refill); the token count at any instant follows
+        # from that, so an acquire needs one clock read and no refill step.
+        initial = cfg.initial_tokens if cfg.initial_tokens is not None else cfg.max_tokens
+        self._full_at = self._clock() + (self._max - initial) / self._rate
+        # Platforms are dispatched from worker threads that share one limiter.
+        self._lock = threading.Lock()
+
+    def _tokens_at(self, now: float) -> float:
+        if self._full_at <= now:
+            return self._max
+        return self._max - (self._full_at - now) * self._rate
 
     def acquire(self, tokens: float = 1.0, block: bool = True) -> bool:
         """Acquire tokens from the bucket.
@@ -61,26 +70,74 @@ class RateLimiter:
         Returns:
             True if tokens were acquired.
         """
-        self._refill()
-
-        if self._tokens >= tokens:
-            self._tokens -= tokens
-            return True
-
-        if not block:
-            deficit = tokens - self._tokens
-            retry_after = deficit / self._rate
-            raise RateLimitExceeded(retry_after)
-
-        # Block until enough tokens
-        deficit = tokens - self._tokens
-        wait_time = deficit / self._rate
-        self._sleep(wait_time)
-        self._refill()
-        self._tokens -= tokens
+        with self._lock:
+            wait_time = self._reserve(tokens, block)
+        # Sleep outside the lock: the tokens are already reserved, so other
+        # threads can queue their own reservations behind this one meanwhile.
+        if wait_time > 0:
+            self._sleep(wait_time)
         return True
 
+    def _reserve(self, tokens: float, block: bool) -> float:
+        """Consume tokens now and return how long to wait before using them."""
+        now = self._clock()
+        deficit = tokens - self._tokens_at(now)
+        wait_time = deficit / self._rate if deficit > 0 else 0.0
+        if wait_time and not block:
+            raise RateLimitExceeded(wait_time)
+        # Consuming tokens pushes the refill-complete time further out.
+        self._full_at = max(self._full_at, now) + tokens / self._rate
+        return wait_time
+
     @property
     def available_tokens(self) -> float:
-        self._refill()
-        return self._tokens
+        with self._lock:
+            return self._tokens_at(self._clock())
+
+    def observe(self, remaining: float, reset_after: float) -> None:
+        """Tighten the bucket to a server-reported budget.
+
+        ``remaining`` calls are left in the server's window, which resets in
+        ``reset_after`` seconds. The bucket never holds more than
+        ``remaining`` tokens afterwards; with none remaining, the next token
+        becomes available when the window resets. Observations only ever
+        lower the bucket, never refill it.
+        """
+        with self._lock:
+            now = self._clock()
+            if remaining >= 1:
+                full_at = now + (self._max - remaining) / self._rate
+            else:
+                full_at = now + reset_after + (self._max - 1) / self._rate
+            self._full_at = max(self._full_at, full_at)
+
+    def observe_headers(self, headers: Mapping[str, Any] | None) -> None:
+        """Apply ``X-RateLimit-*`` response headers, if present.
+
+        Understands Discord's ``X-RateLimit-Reset-After`` (seconds) and
+        Mastodon's ``X-RateLimit-Reset`` (ISO 8601 timestamp).
+        """
+        limits = rate_limit_from_headers(headers)
+        if limits is not None:
+            self.observe(*limits)
+
+
+def rate_limit_from_headers(headers: Mapping[str, Any] | None) -> tuple[float, float] | None:
+    """``(remaining, reset_after_seconds)`` from rate-limit headers, or None."""
+    if headers is None:
+        return None
+    remaining = headers.get("X-RateLimit-Remaining")
+    if remaining is None:
+        return None
+    try:
+        count = float(remaining)
+        reset_after = headers.get("X-RateLimit-Reset-After")
+        if reset_after is not None:
+            return count, max(0.0, float(reset_after))
+        reset = headers.get("X-RateLimit-Reset")
+        if reset is None:
+            return count, 0.0
+        when = datetime.fromisoformat(reset)
+    except ValueError:
+        return None
+    return count, max(0.0, when.timestamp() - time.time())
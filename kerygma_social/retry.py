@@ -2,19 +2,29 @@
 
 Wraps callables with configurable retry logic: max attempts,
 base delay, exponential multiplier, and random jitter.
+
+Jitter strategies follow Marc Brooker's "Exponential Backoff and Jitter":
+``"full"`` sleeps ``uniform(0, backoff)``, ``"equal"`` sleeps
+``backoff/2 + uniform(0, backoff/2)``, and ``"decorrelated"`` sleeps
+``uniform(base_delay, previous_sleep * 3)`` capped at ``max_delay``.
 """
 
 from __future__ import annotations
 
 import random
 import time
-from dataclasses import dataclass
-from typing import Any, Callable, TypeVar
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Literal, TypeVar, get_args
+
+from kerygma_social.http_pool import DeliveryUncertainError
 
 T = TypeVar("T")
 
+JitterStrategy = Literal["full", "equal", "decorrelated"]
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class RetryConfig:
     """Configuration for retry behavior."""
     max_attempts: int = 3
@@ -22,7 +32,22 @@ class RetryConfig:
     max_delay: float = 30.0
     multiplier: float = 2.0
     jitter: bool = True
+    jitter_strategy: JitterStrategy = "full"
     retryable_exceptions: tuple[type[Exception], ...] = (RuntimeError, OSError, ConnectionError)
+    # Capped exponential backoff before each retry, computed once per config.
+    _delays: tuple[float, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.jitter_strategy not in get_args(JitterStrategy):
+            raise ValueError(f"Unknown jitter strategy: {self.jitter_strategy!r}")
+        delays = tuple(
+            min(self.base_delay * self.multiplier ** i, self.max_delay)
+            for i in range(max(self.max_attempts - 1, 0))
+        )
+        object.__setattr__(self, "_delays", delays)
+
+
+_DEFAULT_CONFIG = RetryConfig()
 
 
 class RetryError(Exception):
@@ -34,6 +59,18 @@ class RetryError(Exception):
         super().__init__(f"Failed after {attempts} attempts: {last_error}")
 
 
+def _next_delay(cfg: RetryConfig, attempt: int, previous: float) -> float:
+    """Delay before the next attempt, given the delay slept before this one."""
+    if cfg.jitter and cfg.jitter_strategy == "decorrelated":
+        return min(cfg.max_delay, random.uniform(cfg.base_delay, previous * 3))
+    backoff = cfg._delays[attempt - 1]
+    if not cfg.jitter:
+        return backoff
+    if cfg.jitter_strategy == "equal":
+        return backoff / 2 + random.uniform(0, backoff / 2)
+    return random.uniform(0, backoff)  # "full"; RetryConfig rejects anything else
+
+
 def retry(
     func: Callable[..., T],
     config: RetryConfig | None = None,
@@ -53,25 +90,55 @@ def retry(
         The return value of func on success.
 
     Raises:
-        RetryError: If all attempts fail.
+        RetryError: If all attempts fail, or a ``Retry-After`` on the last
+            error asks for a longer wait than ``max_delay``.
+
+    An HTTP error carrying a 4xx ``status`` other than 408 or 429 is raised
+    as-is on the first attempt: the request itself was rejected, so sending
+    it again cannot succeed.
+    ``DeliveryUncertainError`` is raised as-is too, whatever
+    ``retryable_exceptions`` says: the server may already have acted on
+    the request, and sending it again could publish it twice.
     """
-    cfg = config or RetryConfig()
+    cfg = config or _DEFAULT_CONFIG
     do_sleep = sleep_func or time.sleep
     last_exc: Exception | None = None
+    delay = cfg.base_delay
+    attempt = 0
 
     for attempt in range(1, cfg.max_attempts + 1):
         try:
             return func(*args, **kwargs)
         except cfg.retryable_exceptions as exc:
+            if _is_rejection(exc) or isinstance(exc, DeliveryUncertainError):
+                raise
             last_exc = exc
             if attempt == cfg.max_attempts:
                 break
         except Exception:
             raise
 
-        delay = min(cfg.base_delay * (cfg.multiplier ** (attempt - 1)), cfg.max_delay)
-        if cfg.jitter:
-            delay = delay * (0.5 + random.random() * 0.5)
+        delay = _next_delay(cfg, attempt, delay)
+        # A server-sent Retry-After (HttpError.retry_after) is a floor; if it
+        # is beyond max_delay, retrying sooner would only be rejected again.
+        retry_after = getattr(last_exc, "retry_after", None)
+        if retry_after is not None:
+            if retry_after > cfg.max_delay:
+                break
+            delay = max(delay, retry_after)
         do_sleep(delay)
 
-    raise RetryError(cfg.max_attempts, last_exc)  # type: ignore[arg-type]
+    raise RetryError(attempt, last_exc)  # type: ignore[arg-type]
+
+
+# 4xx statuses that mean "try again later" rather than "bad request".
+_RETRYABLE_CLIENT_STATUSES = frozenset({408, 429})
+
+
+def _is_rejection(exc: Exception) -> bool:
+    """True for a 4xx HTTP error that retrying cannot fix."""
+    status = getattr(exc, "status", None)
+    return (
+        isinstance(status, int) and 400 <= status < 500
+        and status not in _RETRYABLE_CLIENT_STATUSES
+    )
@@ -3,23 +3,59 @@
 Polls a feed URL, tracks seen entries, and yields new items
 for distribution. Handles both RSS 2.0 and Atom feeds using
 stdlib xml.etree.
+
+Feeds are parsed incrementally by an ``XMLParser`` target that turns
+parse events straight into ``FeedEntry`` objects, so no element tree is
+built at all. Each polled body is fingerprinted (BLAKE2b) first, and a
+body identical to the last one parsed is not parsed again.
+
+Seen entry ids are persisted as an append-only log with one JSON string
+per line, so recording new ids writes only those lines; the file is
+rewritten only when pruning to ``max_seen``. Seen files written by older
+versions as a single ``{"seen_ids": [...]}`` document are migrated on load.
+
+Network polls are conditional: the feed's ``ETag`` and ``Last-Modified``
+validators are persisted in a small sidecar file and sent back as
+``If-None-Match`` / ``If-Modified-Since``, so an unchanged feed costs a
+bodiless 304. A ``Cache-Control: max-age`` skips the request entirely
+until the feed could have changed. The last body's fingerprint is kept
+in the same sidecar, covering servers that send no validators.
 """
 
 from __future__ import annotations
 
-import json
+import hashlib
 import os
+import re
+import time
+import urllib.error
 import urllib.request
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from email.message import Message
 from pathlib import Path
 from typing import Any
 
+from kerygma_social import json_codec
+
 
 ATOM_NS = "http://www.w3.org/2005/Atom"
 
+_ATOM_FEED = f"{{{ATOM_NS}}}feed"
+_ATOM_ENTRY = f"{{{ATOM_NS}}}entry"
+_ATOM_ID = f"{{{ATOM_NS}}}id"
+_ATOM_TITLE = f"{{{ATOM_NS}}}title"
+_ATOM_LINK = f"{{{ATOM_NS}}}link"
+_ATOM_SUMMARY = f"{{{ATOM_NS}}}summary"
+_ATOM_PUBLISHED = f"{{{ATOM_NS}}}published"
+_ATOM_UPDATED = f"{{{ATOM_NS}}}updated"
+_READ_CHUNK = 64 * 1024
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
 
-@dataclass
+@dataclass(slots=True)
 class FeedEntry:
     """A single entry from an RSS/Atom feed."""
     entry_id: str
@@ -42,107 +78,289 @@ class RssPoller:
     ) -> None:
         self._feed_url = feed_url
         self._seen_path = seen_path
-        self._seen: set[str] = set()
-        self._seen_order: list[str] = []  # Insertion order for pruning
+        # Insertion-ordered, so the oldest ids are pruned first in O(1) each.
+        self._seen: OrderedDict[str, None] = OrderedDict()
         self._max_seen = max_seen
         self._fetch = fetch_func  # Injectable for testing
+        self._etag = ""
+        self._last_modified = ""
+        self._digest = ""  # BLAKE2b of the last fully parsed feed body
+        self._fresh_until = 0.0  # time.monotonic() deadline from max-age
+        self._pending_headers: Message | None = None
+        self._lines_on_disk = 0
         if seen_path and seen_path.exists():
             self._load_seen()
 
+    @property
+    def _validators_path(self) -> Path | None:
+        if not self._seen_path:
+            return None
+        return self._seen_path.with_name(self._seen_path.name + ".validators")
+
     def _load_seen(self) -> None:
         if not self._seen_path or not self._seen_path.exists():
             return
+        raw = self._seen_path.read_bytes()
+        if raw.lstrip().startswith(b"{"):
+            self._load_legacy(raw)
+            return
+        lines = [line for line in raw.splitlines() if line.strip()]
+        # A torn trailing line is skipped; the rest of the log is kept.
+        self._set_seen(json_codec.loads_lines(lines))
+        self._lines_on_disk = len(lines)
+        if raw and not raw.endswith(b"\n"):
+            # The next append would land on the torn fragment; drop it first.
+            self._compact()
+        validators = self._validators_path
+        if validators is not None and validators.exists():
+            try:
+                data = json_codec.loads(validators.read_bytes())
+                self._etag = data.get("etag", "")
+                self._last_modified = data.get("last_modified", "")
+                self._digest = data.get("digest", "")
+            except (json_codec.JSONDecodeError, AttributeError):
+                pass
+
+    def _load_legacy(self, raw: bytes) -> None:
         try:
-            data = json.loads(self._seen_path.read_text(encoding="utf-8"))
-            ids = data.get("seen_ids", [])
-            self._seen_order = list(ids)
-            self._seen = set(ids)
-        except (json.JSONDecodeError, TypeError):
-            self._seen = set()
-            self._seen_order = []
-
-    def _save_seen(self) -> None:
+            data = json_codec.loads(raw)
+            self._set_seen(list(data.get("seen_ids", [])))
+            self._etag = data.get("etag", "")
+            self._last_modified = data.get("last_modified", "")
+        except (json_codec.JSONDecodeError, TypeError, AttributeError):
+            self._set_seen([])
+        self._compact()
+        self._save_validators()
+
+    def _set_seen(self, ids: list[str]) -> None:
+        self._seen = OrderedDict.fromkeys(ids)
+        self._prune()
+
+    def _prune(self) -> None:
+        if self._max_seen > 0:
+            while len(self._seen) > self._max_seen:
+                self._seen.popitem(last=False)
+
+    def _record_seen(self, ids: list[str]) -> None:
+        """Remember new ids and append them to the seen log in one write."""
+        if not ids:
+            return
+        for entry_id in ids:
+            self._seen[entry_id] = None
+        self._prune()
+        if not self._seen_path:
+            return
+        if self._max_seen > 0 and self._lines_on_disk + len(ids) >= 2 * self._max_seen:
+            # Pruned ids still occupy lines on disk; reclaim them in bulk.
+            self._compact()
+            return
+        with self._seen_path.open("ab") as f:
+            f.write(b"".join(_encode_id(i) for i in ids))
+        self._lines_on_disk += len(ids)
+
+    def _compact(self) -> None:
+        """Rewrite the seen log with only the retained ids (atomic replace)."""
         if not self._seen_path:
             return
-        # Prune to max_seen most recent entries
-        if self._max_seen > 0 and len(self._seen_order) > self._max_seen:
-            self._seen_order = self._seen_order[-self._max_seen:]
-            self._seen = set(self._seen_order)
-        data = {"seen_ids": self._seen_order}
         tmp = self._seen_path.with_suffix(".tmp")
-        tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        tmp.write_bytes(b"".join(_encode_id(i) for i in self._seen))
         os.replace(str(tmp), str(self._seen_path))
+        self._lines_on_disk = len(self._seen)
+
+    def _save_validators(self) -> None:
+        path = self._validators_path
+        if path is None:
+            return
+        data = {
+            "etag": self._etag, "last_modified": self._last_modified, "digest": self._digest,
+        }
+        path.write_bytes(json_codec.dumps(data))
 
-    def _fetch_feed(self) -> str:
-        """Fetch feed content from URL."""
+    def _fetch_feed(self) -> Iterator[str | bytes] | None:
+        """Return the feed body as chunks read from URL, or None if unchanged."""
         if self._fetch:
-            return self._fetch(self._feed_url)
-        req = urllib.request.Request(self._feed_url)
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            return resp.read().decode("utf-8")
+            return iter((self._fetch(self._feed_url),))
+        if time.monotonic() < self._fresh_until:
+            return None
+        self._pending_headers = None
+        headers = {}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+        req = urllib.request.Request(self._feed_url, headers=headers)
+        try:
+            resp = urllib.request.urlopen(req, timeout=30)
+        except urllib.error.HTTPError as exc:
+            if exc.code != 304:
+                raise
+            exc.close()
+            self._remember_validators(exc.headers)
+            return None
+        # Validators are only kept once poll() has consumed the whole body;
+        # a failed parse must not turn the next poll into a 304.
+        self._pending_headers = resp.headers
+        return self._read_chunks(resp)
 
-    def parse_feed(self, xml_text: str) -> list[FeedEntry]:
+    @staticmethod
+    def _read_chunks(resp: Any) -> Iterator[bytes]:
+        with resp:
+            while chunk := resp.read(_READ_CHUNK):
+                yield chunk
+
+    def _remember_validators(self, headers: Message, digest: str | None = None) -> None:
+        etag = headers.get("ETag", self._etag)
+        last_modified = headers.get("Last-Modified", self._last_modified)
+        digest = self._digest if digest is None else digest
+        if (etag, last_modified, digest) != (self._etag, self._last_modified, self._digest):
+            self._etag, self._last_modified, self._digest = etag, last_modified, digest
+            self._save_validators()
+        match = _MAX_AGE.search(headers.get("Cache-Control", ""))
+        if match:
+            self._fresh_until = time.monotonic() + int(match.group(1))
+
+    def parse_feed(self, xml_text: str | bytes) -> list[FeedEntry]:
         """Parse an RSS or Atom feed XML string into FeedEntry objects."""
-        root = ET.fromstring(xml_text)
-        entries: list[FeedEntry] = []
-
-        # Try Atom first
-        atom_entries = root.findall(f"{{{ATOM_NS}}}entry")
-        if atom_entries:
-            for entry in atom_entries:
-                entry_id = self._text(entry, f"{{{ATOM_NS}}}id") or ""
-                title = self._text(entry, f"{{{ATOM_NS}}}title") or ""
-                link_el = entry.find(f"{{{ATOM_NS}}}link[@rel='alternate']")
-                if link_el is None:
-                    link_el = entry.find(f"{{{ATOM_NS}}}link")
-                url = link_el.get("href", "") if link_el is not None else ""
-                summary = self._text(entry, f"{{{ATOM_NS}}}summary") or ""
-                published = self._text(entry, f"{{{ATOM_NS}}}published") or ""
-                updated = self._text(entry, f"{{{ATOM_NS}}}updated") or ""
-                entries.append(FeedEntry(
-                    entry_id=entry_id, title=title, url=url,
-                    summary=summary, published=published, updated=updated,
-                ))
-            return entries
-
-        # Fall back to RSS 2.0
-        for item in root.iter("item"):
-            guid = self._text(item, "guid") or self._text(item, "link") or ""
-            title = self._text(item, "title") or ""
-            url = self._text(item, "link") or ""
-            summary = self._text(item, "description") or ""
-            published = self._text(item, "pubDate") or ""
-            entries.append(FeedEntry(
-                entry_id=guid, title=title, url=url,
-                summary=summary, published=published,
-            ))
+        return list(self._iter_entries((xml_text,)))
 
-        return entries
+    def _iter_entries(self, chunks: Iterable[str | bytes]) -> Iterator[FeedEntry]:
+        """Stream FeedEntry objects out of a feed document fed in chunks."""
+        target = _FeedTarget()
+        parser = ET.XMLParser(target=target)
+        for chunk in chunks:
+            parser.feed(chunk)
+            yield from target.drain()
+        parser.close()
+        yield from target.drain()
 
     def poll(self) -> list[FeedEntry]:
         """Fetch feed and return only new (unseen) entries."""
-        xml_text = self._fetch_feed()
-        all_entries = self.parse_feed(xml_text)
-        new_entries = [e for e in all_entries if e.entry_id not in self._seen]
-
-        for entry in new_entries:
-            self._seen.add(entry.entry_id)
-            self._seen_order.append(entry.entry_id)
-
-        self._save_seen()
+        chunks = self._fetch_feed()
+        if chunks is None:
+            return []
+        body = list(chunks)
+        hasher = hashlib.blake2b(digest_size=16)
+        for chunk in body:
+            hasher.update(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+        digest = hasher.hexdigest()
+        new_entries: list[FeedEntry] = []
+        if digest != self._digest:
+            new_entries = [e for e in self._iter_entries(body) if e.entry_id not in self._seen]
+            self._record_seen(list(dict.fromkeys(e.entry_id for e in new_entries)))
+        headers, self._pending_headers = self._pending_headers, None
+        if headers is not None:
+            self._remember_validators(headers, digest)
+        elif digest != self._digest:
+            self._digest = digest
+            self._save_validators()
         return new_entries
 
     def mark_seen(self, entry_id: str) -> None:
         if entry_id not in self._seen:
-            self._seen.add(entry_id)
-            self._seen_order.append(entry_id)
-        self._save_seen()
+            self._record_seen([entry_id])
 
     @property
     def seen_count(self) -> int:
         return len(self._seen)
 
-    @staticmethod
-    def _text(el: ET.Element, tag: str) -> str | None:
-        child = el.find(tag)
-        return child.text if child is not None else None
+
+def _encode_id(entry_id: str) -> bytes:
+    return json_codec.dumps(entry_id) + b"\n"
+
+
+class _FeedTarget:
+    """``XMLParser`` target that builds FeedEntry objects from parse events.
+
+    No ``Element`` tree is built: only the direct child text of each entry
+    is collected, matching what ``entry.findtext(tag)`` would return (the
+    first such child wins). A document whose root is an Atom ``<feed>``
+    yields its ``<entry>`` children; anything else is read as RSS 2.0 and
+    yields every ``<item>``. Atom URLs come from the first
+    ``<link rel="alternate">``, falling back to the first ``<link>``.
+    """
+
+    def __init__(self) -> None:
+        self._entries: list[FeedEntry] = []
+        self._depth = 0
+        self._atom = False
+        self._entry_depth = 0  # Depth of the open entry element, 0 if none
+        self._fields: dict[str, str] = {}
+        self._field: str | None = None  # Child whose text is being collected
+        self._text: list[str] = []
+        self._links: list[str | None] = [None, None]  # [alternate, first]
+
+    def drain(self) -> list[FeedEntry]:
+        entries, self._entries = self._entries, []
+        return entries
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        self._depth += 1
+        depth = self._depth
+        if depth == 1:
+            self._atom = tag == _ATOM_FEED
+        elif not self._entry_depth:
+            opens_entry = (tag == _ATOM_ENTRY and depth == 2) if self._atom else tag == "item"
+            if opens_entry:
+                self._entry_depth = depth
+                self._fields = {}
+                self._links = [None, None]
+        elif depth == self._entry_depth + 1:
+            if tag == _ATOM_LINK and self._atom:
+                href = attrib.get("href", "")
+                if self._links[0] is None and attrib.get("rel") == "alternate":
+                    self._links[0] = href
+                if self._links[1] is None:
+                    self._links[1] = href
+            if tag not in self._fields:
+                self._field = tag
+                self._text = []
+        else:
+            # Text after a grandchild is tail text, not the child's own text.
+            self._finish_field()
+
+    def data(self, data: str) -> None:
+        if self._field is not None:
+            self._text.append(data)
+
+    def end(self, tag: str) -> None:
+        depth = self._depth
+        self._depth -= 1
+        if not self._entry_depth:
+            return
+        if depth == self._entry_depth + 1:
+            self._finish_field()
+            self._fields.setdefault(tag, "")
+        elif depth == self._entry_depth:
+            self._entry_depth = 0
+            self._entries.append(self._atom_entry() if self._atom else self._rss_entry())
+
+    def close(self) -> None:
+        pass
+
+    def _finish_field(self) -> None:
+        if self._field is not None:
+            self._fields.setdefault(self._field, "".join(self._text))
+            self._field = None
+
+    def _atom_entry(self) -> FeedEntry:
+        get = self._fields.get
+        alternate, first = self._links
+        return FeedEntry(
+            entry_id=get(_ATOM_ID, ""),
+            title=get(_ATOM_TITLE, ""),
+            url=alternate if alternate is not None else first or "",
+            summary=get(_ATOM_SUMMARY, ""),
+            published=get(_ATOM_PUBLISHED, ""),
+            updated=get(_ATOM_UPDATED, ""),
+        )
+
+    def _rss_entry(self) -> FeedEntry:
+        get = self._fields.get
+        link = get("link", "")
+        return FeedEntry(
+            entry_id=get("guid") or link,
+            title=get("title", ""),
+            url=link,
+            summary=get("description", ""),
+            published=get("pubDate", ""),
+        )
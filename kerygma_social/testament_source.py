@@ -18,7 +18,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
@@ -56,7 +56,7 @@ def _tier(event_type: str) -> str:
 
 # --- Event record (lightweight, no engine dependency) ---
 
-@dataclass
+@dataclass(slots=True)
 class ChainEvent:
     """A single event from the Testament Chain."""
 
@@ -167,7 +167,7 @@ def _save_cursor(sequence: int) -> None:
 
 # --- Testament Source ---
 
-@dataclass
+@dataclass(slots=True)
 class SyndicationJob:
     """A formatted post ready for POSSE distribution."""
 
@@ -203,8 +203,6 @@ class TestamentSource:
 
     def _save_cursor(self, sequence: int) -> None:
         """Save the last-syndicated sequence number."""
-        from datetime import timezone
-
         self._cursor_path.parent.mkdir(parents=True, exist_ok=True)
         self._cursor_path.write_text(json.dumps({
             "last_sequence": sequence,
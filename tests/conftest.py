@@ -0,0 +1,89 @@
+"""Shared pytest fixtures."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class _ApiHandler(BaseHTTPRequestHandler):
+    """Keep-alive handler that records requests and replays queued responses."""
+
+    protocol_version = "HTTP/1.1"
+
+    def _handle(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        server = self.server
+        server.requests.append({
+            "method": self.command,
+            "path": self.path,
+            "headers": dict(self.headers),
+            "body": body,
+            "client_port": self.client_address[1],
+        })
+        if server.drop_without_response:
+            # The request was received and "processed", but the socket is
+            # closed before any response bytes go out.
+            server.drop_without_response -= 1
+            self.close_connection = True
+            return
+        status, payload, headers = 200, {"ok": True}, {}
+        if server.responses:
+            status, payload, headers = server.responses.pop(0)
+        if isinstance(payload, bytes):
+            data = payload
+        else:
+            data = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        if server.drop_after_response:
+            # Close without "Connection: close" — the client still believes
+            # the socket is reusable, like a server-side idle timeout.
+            self.close_connection = True
+
+    do_GET = _handle
+    do_POST = _handle
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class MockApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _ApiHandler)
+        self.requests: list[dict] = []
+        self.responses: list[tuple[int, object, dict[str, str]]] = []
+        self.drop_after_response = False
+        self.drop_without_response = 0  # Number of requests to answer by closing
+        self.url = f"http://127.0.0.1:{self.server_port}"
+
+    def queue(self, status: int = 200, payload: object = None, **headers: str) -> None:
+        """Queue a response; unqueued requests get 200 {"ok": true}.
+
+        A bytes payload is sent as-is rather than JSON-encoded.
+        """
+        self.responses.append((status, payload, {k.replace("_", "-"): v for k, v in headers.items()}))
+
+    @property
+    def connections(self) -> int:
+        """Number of distinct client sockets seen so far."""
+        return len({r["client_port"] for r in self.requests})
+
+
+@pytest.fixture
+def api_server():
+    server = MockApiServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
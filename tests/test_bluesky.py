@@ -26,6 +26,18 @@ class TestBluesky:
         assert "https://example.com" in text
         assert len(text) <= 300
 
+    def test_format_truncates_at_word_boundary(self):
+        client = self._client()
+        title = "word " * 80
+        text = client.format_for_bluesky(title, "https://example.com/essay")
+        assert len(text) <= 300
+        assert text.endswith("word...")
+
+    def test_format_truncates_unbroken_text(self):
+        client = self._client()
+        text = client.format_for_bluesky("x" * 400, "https://example.com")
+        assert text == "x" * 297 + "..."
+
     def test_post_count(self):
         client = self._client()
         assert client.post_count == 0
@@ -38,3 +50,75 @@ class TestBluesky:
         import pytest
         with pytest.raises(ValueError):
             client.post(BlueskyPost(text="x" * 301))
+
+    def test_live_post_reuses_connection(self, api_server):
+        api_server.queue(payload={"did": "did:plc:abc", "accessJwt": "jwt-token"})
+        api_server.queue(payload={"uri": "at://did:plc:abc/app.bsky.feed.post/1"})
+        api_server.queue(payload={"uri": "at://did:plc:abc/app.bsky.feed.post/2"})
+        client = BlueskyClient(
+            BlueskyConfig(handle="h", app_password="p", service_url=api_server.url),
+            live=True,
+        )
+        client.post(BlueskyPost(text="One"))
+        result = client.post(BlueskyPost(text="Two"))
+        assert result["uri"].endswith("/2")
+        assert len(api_server.requests) == 3  # one createSession, two createRecord
+        assert api_server.requests[2]["headers"]["Authorization"] == "Bearer jwt-token"
+        assert api_server.connections == 1
+
+    def test_live_auth_error(self, api_server):
+        import pytest
+        api_server.queue(401, {"error": "AuthenticationRequired"})
+        client = BlueskyClient(
+            BlueskyConfig(handle="h", app_password="bad", service_url=api_server.url),
+            live=True,
+        )
+        with pytest.raises(RuntimeError, match="Bluesky auth error 401"):
+            client.post(BlueskyPost(text="Hello"))
+
+    def test_live_breaker_fails_fast(self, api_server):
+        import pytest
+
+        from kerygma_social.circuit_breaker import (
+            CircuitBreaker,
+            CircuitBreakerConfig,
+            CircuitOpenError,
+        )
+        api_server.queue(502, {"error": "BadGateway"})
+        client = BlueskyClient(
+            BlueskyConfig(handle="h", app_password="p", service_url=api_server.url),
+            live=True,
+            breaker=CircuitBreaker(CircuitBreakerConfig(failure_threshold=1)),
+        )
+        with pytest.raises(RuntimeError, match="Bluesky auth error 502"):
+            client.post(BlueskyPost(text="Hello"))
+        with pytest.raises(CircuitOpenError):
+            client.post(BlueskyPost(text="Hello"))
+        assert len(api_server.requests) == 1
+
+    def test_live_post_batch_single_request(self, api_server):
+        import json
+
+        api_server.queue(payload={"did": "did:plc:abc", "accessJwt": "jwt-token"})
+        api_server.queue(payload={"results": [
+            {"uri": "at://did:plc:abc/app.bsky.feed.post/1", "cid": "c1"},
+            {"uri": "at://did:plc:abc/app.bsky.feed.post/2", "cid": "c2"},
+        ]})
+        client = BlueskyClient(
+            BlueskyConfig(handle="h", app_password="p", service_url=api_server.url),
+            live=True,
+        )
+        results = client.post_batch([BlueskyPost(text="One"), BlueskyPost(text="Two")])
+        assert [r["uri"][-1] for r in results] == ["1", "2"]
+        assert len(api_server.requests) == 2  # one createSession, one applyWrites
+        assert api_server.requests[1]["path"] == "/xrpc/com.atproto.repo.applyWrites"
+        writes = json.loads(api_server.requests[1]["body"])["writes"]
+        assert [w["value"]["text"] for w in writes] == ["One", "Two"]
+        assert client.post_count == 2
+
+    def test_post_batch_validates_first(self):
+        import pytest
+        client = self._client()
+        with pytest.raises(ValueError):
+            client.post_batch([BlueskyPost(text="ok"), BlueskyPost(text="")])
+        assert client.post_count == 0
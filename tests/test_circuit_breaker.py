@@ -119,3 +119,139 @@ class TestCircuitBreaker:
 
         cb.call(lambda: "ok")
         assert cb.failure_count == 0
+
+    def test_closed_calls_do_not_read_clock(self):
+        reads = []
+
+        def clock():
+            reads.append(1)
+            return 0.0
+
+        cb = CircuitBreaker(CircuitBreakerConfig(failure_threshold=3), clock=clock)
+        for _ in range(5):
+            cb.call(lambda: "ok")
+        with pytest.raises(RuntimeError):
+            cb.call(lambda: (_ for _ in ()).throw(RuntimeError("fail")))
+        assert reads == []
+
+    def test_open_error_reports_reset_time(self):
+        clock, _ = self._clock(100.0)
+        cb = CircuitBreaker(
+            CircuitBreakerConfig(failure_threshold=1, reset_timeout=30.0),
+            clock=clock,
+        )
+        with pytest.raises(RuntimeError):
+            cb.call(lambda: (_ for _ in ()).throw(RuntimeError("fail")))
+        with pytest.raises(CircuitOpenError) as exc_info:
+            cb.call(lambda: 42)
+        assert exc_info.value.reset_at == 130.0
+
+    def test_half_open_limits_trial_calls(self):
+        clock, advance = self._clock()
+        cb = CircuitBreaker(
+            CircuitBreakerConfig(failure_threshold=1, reset_timeout=10.0, half_open_max_calls=1),
+            clock=clock,
+        )
+        with pytest.raises(RuntimeError):
+            cb.call(lambda: (_ for _ in ()).throw(RuntimeError("fail")))
+        advance(11.0)
+
+        def reentrant():
+            # A second trial while the first is still in flight is rejected.
+            with pytest.raises(CircuitOpenError):
+                cb.call(lambda: "nested")
+            return "first"
+
+        assert cb.call(reentrant) == "first"
+        assert cb.state == CircuitState.CLOSED
+
+    def test_concurrent_half_open_admits_max_calls(self):
+        import threading
+        import time
+
+        now = [0.0]
+
+        def slow_clock():
+            time.sleep(0.001)  # Widen the window between check and admit
+            return now[0]
+
+        cb = CircuitBreaker(
+            CircuitBreakerConfig(failure_threshold=1, reset_timeout=10.0, half_open_max_calls=2),
+            clock=slow_clock,
+        )
+        with pytest.raises(RuntimeError):
+            cb.call(lambda: (_ for _ in ()).throw(RuntimeError("fail")))
+        now[0] = 11.0
+
+        release = threading.Event()
+        admitted, rejected = [], []
+
+        def trial():
+            try:
+                cb.call(lambda: admitted.append(1) or release.wait(5))
+            except CircuitOpenError:
+                rejected.append(1)
+
+        threads = [threading.Thread(target=trial) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        while len(admitted) + len(rejected) < 8 and len(rejected) < 6:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert len(admitted) == 2
+        assert len(rejected) == 6
+
+    def test_config_is_frozen(self):
+        import dataclasses
+
+        config = CircuitBreakerConfig()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.failure_threshold = 1  # type: ignore[misc]
+        assert hash(config) == hash(CircuitBreakerConfig())
+
+    def test_client_errors_do_not_trip(self):
+        from kerygma_social.http_pool import HttpError
+
+        cb = CircuitBreaker(CircuitBreakerConfig(failure_threshold=2))
+
+        def rejected():
+            raise HttpError(422, "", "Unprocessable")
+
+        for _ in range(3):
+            with pytest.raises(HttpError):
+                cb.call(rejected)
+        assert cb.state == CircuitState.CLOSED
+        assert cb.failure_count == 0
+
+    def test_server_errors_trip(self):
+        from kerygma_social.http_pool import HttpError
+
+        cb = CircuitBreaker(CircuitBreakerConfig(failure_threshold=2))
+
+        def unavailable():
+            raise HttpError(503, "", "Unavailable")
+
+        for _ in range(2):
+            with pytest.raises(HttpError):
+                cb.call(unavailable)
+        assert cb.state == CircuitState.OPEN
+
+    def test_client_error_closes_half_open(self):
+        from kerygma_social.http_pool import HttpError
+
+        clock, advance = self._clock()
+        cb = CircuitBreaker(
+            CircuitBreakerConfig(failure_threshold=1, reset_timeout=10.0), clock=clock,
+        )
+        with pytest.raises(RuntimeError):
+            cb.call(lambda: (_ for _ in ()).throw(RuntimeError("fail")))
+        advance(11.0)
+
+        def rejected():
+            raise HttpError(400, "", "Bad Request")
+
+        with pytest.raises(HttpError):
+            cb.call(rejected)
+        assert cb.state == CircuitState.CLOSED
@@ -0,0 +1,106 @@
+"""Tests for the social-dispatch CLI."""
+
+import subprocess
+import sys
+
+import pytest
+
+import kerygma_social
+from kerygma_social.cli import COMMANDS, main
+
+
+class TestCli:
+    def test_status(self, capsys):
+        main(["status"])
+        out = capsys.readouterr().out
+        assert "Live mode: False" in out
+        assert "Mastodon:" in out
+
+    def test_log_empty(self, tmp_path, capsys):
+        config = tmp_path / "config.yaml"
+        config.write_text(f"delivery_log_path: {tmp_path / 'log.jsonl'}\n")
+        main(["--config", str(config), "log"])
+        assert "All records: 0" in capsys.readouterr().out
+
+    def test_commands_match_subparsers(self):
+        assert set(COMMANDS) == {"dispatch", "poll-rss", "log", "status"}
+
+    def test_status_does_not_import_platform_clients(self):
+        code = (
+            "import sys; from kerygma_social.cli import main; main(['status']); "
+            "print(sorted(m for m in sys.modules if m.startswith('kerygma_social.')))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        ).stdout
+        assert "kerygma_social.factory" not in out
+        assert "kerygma_social.posse" not in out
+
+    def test_status_without_config_file_skips_yaml(self):
+        code = (
+            "import sys; from kerygma_social.cli import main; main(['status']); "
+            "print('yaml' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        ).stdout
+        assert out.strip().endswith("False")
+
+
+class TestPackageExports:
+    def test_lazy_exports_resolve(self):
+        from kerygma_social.posse import PosseDistributor
+
+        assert kerygma_social.PosseDistributor is PosseDistributor
+        assert set(kerygma_social.__all__) <= set(dir(kerygma_social))
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            kerygma_social.not_a_thing  # noqa: B018
+
+
+class TestCliLog:
+    def _config(self, tmp_path):
+        from kerygma_social.delivery_log import DeliveryLog, DeliveryRecord
+
+        log_path = tmp_path / "log.jsonl"
+        log = DeliveryLog(log_path)
+        log.append(DeliveryRecord("r1", "p1", "mastodon", "success", external_url="https://m/1"))
+        log.append(DeliveryRecord("r2", "p1", "discord", "failure", error="boom"))
+        config = tmp_path / "config.yaml"
+        config.write_text(f"delivery_log_path: {log_path}\n")
+        return config
+
+    def test_log_lists_records(self, tmp_path, capsys):
+        main(["--config", str(self._config(tmp_path)), "log"])
+        out = capsys.readouterr().out
+        assert "All records: 2" in out
+        assert "[success] mastodon / p1: https://m/1" in out
+
+    def test_log_failures_only(self, tmp_path, capsys):
+        main(["--config", str(self._config(tmp_path)), "log", "--failures"])
+        out = capsys.readouterr().out
+        assert "Failures: 1" in out
+        assert "[failure] discord / p1: boom" in out
+        assert "mastodon" not in out
+
+
+class TestCliDispatch:
+    def test_dispatch_dry_run(self, tmp_path, capsys):
+        config = tmp_path / "config.yaml"
+        config.write_text(
+            "discord:\n  webhook_url: https://discord.com/api/webhooks/test\n"
+            f"delivery_log_path: {tmp_path / 'log.jsonl'}\n"
+        )
+        main([
+            "--config", str(config), "dispatch",
+            "--title", "T", "--url", "https://example.com", "--platforms", "discord",
+        ])
+        assert "[PUBLISHED] discord" in capsys.readouterr().out
+        assert (tmp_path / "log.jsonl").exists()
+
+    def test_dispatch_unknown_platform(self, capsys):
+        with pytest.raises(SystemExit) as exc_info:
+            main(["dispatch", "--title", "T", "--url", "u", "--platforms", "discord,myspace"])
+        assert exc_info.value.code == 2
+        assert "Unknown platform(s): myspace" in capsys.readouterr().err
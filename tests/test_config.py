@@ -35,3 +35,32 @@ class TestConfig:
     def test_missing_file(self):
         cfg = load_config(Path("/nonexistent/config.yaml"))
         assert cfg.mastodon_instance_url == ""
+
+    def test_parse_is_cached_until_file_changes(self, tmp_path):
+        import os
+
+        from kerygma_social.config import _parse_yaml
+
+        path = tmp_path / "config.yaml"
+        path.write_text("mastodon:\n  instance_url: https://one.test\n")
+        misses = _parse_yaml.cache_info().misses
+        assert load_config(path).mastodon_instance_url == "https://one.test"
+        assert load_config(path).mastodon_instance_url == "https://one.test"
+        assert _parse_yaml.cache_info().misses == misses + 1
+
+        path.write_text("mastodon:\n  instance_url: https://two.test\n")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert load_config(path).mastodon_instance_url == "https://two.test"
+
+    def test_env_override_applies_to_cached_parse(self, tmp_path, monkeypatch):
+        path = tmp_path / "config.yaml"
+        path.write_text("discord:\n  webhook_url: https://file.test\n")
+        assert load_config(path).discord_webhook_url == "https://file.test"
+        monkeypatch.setenv("KERYGMA_DISCORD_WEBHOOK_URL", "https://env.test")
+        assert load_config(path).discord_webhook_url == "https://env.test"
+
+    def test_non_mapping_yaml_uses_defaults(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text("- just\n- a list\n")
+        assert load_config(path).delivery_log_path == "delivery_log.json"
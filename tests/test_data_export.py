@@ -72,3 +72,27 @@ def test_export_all_valid_json(tmp_output):
         assert data["organ_name"] == "Kerygma"
         assert data["repo"] == "social-automation"
         assert "generated_at" in data
+
+
+def test_export_all_shares_one_timestamp(tmp_output):
+    paths = export_all(tmp_output)
+    stamps = {json.loads(p.read_text())["generated_at"] for p in paths}
+    assert len(stamps) == 1
+
+
+def test_posse_manifest_is_independent_per_call():
+    first = build_posse_manifest()
+    first["platforms"][0]["module"] = "mutated"
+    first["resilience_stack"].clear()
+    second = build_posse_manifest()
+    assert second["platforms"][0]["module"] != "mutated"
+    assert len(second["resilience_stack"]) == 4
+
+
+def test_delivery_log_schema_is_independent_per_call():
+    first = build_delivery_log_schema()
+    first["fields"][0]["field"] = "mutated"
+    first["sample_record"]["metadata"]["k"] = "v"
+    second = build_delivery_log_schema()
+    assert second["fields"][0]["field"] == "record_id"
+    assert second["sample_record"]["metadata"] == {}
@@ -1,5 +1,6 @@
 """Tests for the delivery log module."""
 
+import json
 
 from kerygma_social.delivery_log import DeliveryLog, DeliveryRecord
 
@@ -38,6 +39,16 @@ class TestDeliveryLog:
         assert log.has_been_delivered("p1", "mastodon") is True
         assert log.has_been_delivered("p1", "discord") is False
 
+    def test_get_delivered_platforms(self):
+        log = DeliveryLog(max_records=3)
+        log.append(DeliveryRecord(record_id="r1", post_id="p1", platform="mastodon", status="success"))
+        log.append(DeliveryRecord(record_id="r2", post_id="p1", platform="discord", status="failure"))
+        log.append(DeliveryRecord(record_id="r3", post_id="p1", platform="bluesky", status="success"))
+        assert log.get_delivered_platforms("p1") == {"mastodon", "bluesky"}
+        assert log.get_delivered_platforms("p2") == set()
+        log.append(DeliveryRecord(record_id="r4", post_id="p2", platform="ghost", status="success"))
+        assert log.get_delivered_platforms("p1") == {"bluesky"}
+
     def test_persistence(self, tmp_path):
         path = tmp_path / "log.json"
         log1 = DeliveryLog(path)
@@ -64,3 +75,152 @@ class TestDeliveryLog:
         assert log.get_by_post("p0") == []
         assert log.get_by_post("p1") == []
         assert len(log.get_by_post("p4")) == 1
+
+    def test_append_writes_one_line_per_record(self, tmp_path):
+        path = tmp_path / "log.json"
+        log = DeliveryLog(path)
+        log.append(DeliveryRecord(record_id="r1", post_id="p1", platform="mastodon", status="success"))
+        log.append(DeliveryRecord(record_id="r2", post_id="p1", platform="discord", status="failure"))
+        lines = path.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])["record_id"] == "r2"
+
+    def test_migrates_legacy_json_document(self, tmp_path):
+        path = tmp_path / "log.json"
+        legacy = {"records": [{
+            "record_id": "r1", "post_id": "p1", "platform": "mastodon",
+            "status": "success", "timestamp": "2026-01-01T00:00:00",
+        }]}
+        path.write_text(json.dumps(legacy, indent=2))
+        log = DeliveryLog(path)
+        assert log.has_been_delivered("p1", "mastodon")
+        assert json.loads(path.read_text().splitlines()[0])["record_id"] == "r1"
+
+    def test_skips_torn_trailing_line(self, tmp_path):
+        path = tmp_path / "log.json"
+        log = DeliveryLog(path)
+        log.append(DeliveryRecord(record_id="r1", post_id="p1", platform="mastodon", status="success"))
+        with path.open("a") as f:
+            f.write('{"record_id": "r2", "post_id"')
+        log = DeliveryLog(path)
+        assert log.total_records == 1
+        log.append(DeliveryRecord(record_id="r3", post_id="p3", platform="mastodon", status="success"))
+        reloaded = DeliveryLog(path)
+        assert reloaded.total_records == 2
+        assert reloaded.has_been_delivered("p3", "mastodon")
+
+    def test_max_records_compacts_file(self, tmp_path):
+        path = tmp_path / "log.json"
+        log = DeliveryLog(path, max_records=2)
+        for i in range(10):
+            log.append(DeliveryRecord(
+                record_id=f"r{i}", post_id=f"p{i}", platform="mastodon", status="success",
+            ))
+        assert len(path.read_text().splitlines()) <= 4
+        reloaded = DeliveryLog(path, max_records=2)
+        assert [r.record_id for r in reloaded.all_records] == ["r8", "r9"]
+
+    def test_export_json(self, tmp_path):
+        log = DeliveryLog()
+        log.append(DeliveryRecord(record_id="r1", post_id="p1", platform="mastodon", status="success"))
+        out = tmp_path / "export.json"
+        log.export_json(out)
+        assert json.loads(out.read_text())["records"][0]["record_id"] == "r1"
+
+    def test_indexes_follow_max_records_trim(self):
+        log = DeliveryLog(max_records=2)
+        log.append(DeliveryRecord(record_id="r0", post_id="p0", platform="mastodon", status="success"))
+        log.append(DeliveryRecord(record_id="r1", post_id="p1", platform="discord", status="failure"))
+        log.append(DeliveryRecord(record_id="r2", post_id="p2", platform="mastodon", status="success"))
+        assert log.has_been_delivered("p0", "mastodon") is False
+        assert log.has_been_delivered("p2", "mastodon") is True
+        assert [r.record_id for r in log.get_by_platform("mastodon")] == ["r2"]
+        assert [r.record_id for r in log.get_failures()] == ["r1"]
+        log.append(DeliveryRecord(record_id="r3", post_id="p3", platform="ghost", status="success"))
+        assert log.get_failures() == []
+        assert log.get_by_platform("discord") == []
+
+    def test_repeat_success_keeps_delivered_after_trim(self):
+        log = DeliveryLog(max_records=2)
+        for i in range(2):
+            log.append(DeliveryRecord(record_id=f"r{i}", post_id="p1", platform="mastodon", status="success"))
+        log.append(DeliveryRecord(record_id="r2", post_id="p2", platform="discord", status="success"))
+        assert log.has_been_delivered("p1", "mastodon") is True
+
+    def test_record_has_no_instance_dict(self):
+        record = DeliveryRecord("r1", "p1", "mastodon", "success")
+        assert not hasattr(record, "__dict__")
+
+    def test_iter_accessors(self):
+        log = DeliveryLog()
+        log.append(DeliveryRecord("r1", "p1", "mastodon", "success"))
+        log.append(DeliveryRecord("r2", "p1", "discord", "failure", error="boom"))
+        log.append(DeliveryRecord("r3", "p2", "mastodon", "failure"))
+        assert [r.record_id for r in log.iter_by_post("p1")] == ["r1", "r2"]
+        assert [r.record_id for r in log.iter_by_platform("mastodon")] == ["r1", "r3"]
+        assert [r.record_id for r in log.iter_failures()] == ["r2", "r3"]
+        assert [r.record_id for r in log.iter_records()] == ["r1", "r2", "r3"]
+        assert list(log.iter_by_post("missing")) == []
+        assert log.failure_count == 2
+
+    def test_load_round_trips_fields_and_skips_bad_rows(self, tmp_path):
+        path = tmp_path / "log.json"
+        log = DeliveryLog(path)
+        log.append(DeliveryRecord(
+            "r1", "p1", "discord", "failure",
+            timestamp="2026-01-01T00:00:00", error="boom", metadata={"attempt": 2},
+        ))
+        with path.open("a") as f:
+            f.write('{"record_id": "r2", "platform": "discord"}\n')  # missing fields
+            f.write("[1, 2]\n")
+        records = DeliveryLog(path).all_records
+        assert records == [log.all_records[0]]
+        assert records[0].timestamp == "2026-01-01T00:00:00"
+        assert records[0].metadata == {"attempt": 2}
+
+    def test_append_batch_single_write(self, tmp_path, monkeypatch):
+        from pathlib import Path
+
+        path = tmp_path / "log.json"
+        log = DeliveryLog(path)
+        opens = []
+        real_open = Path.open
+
+        def counting_open(self, *args, **kwargs):
+            opens.append(self)
+            return real_open(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "open", counting_open)
+        log.append_batch(
+            DeliveryRecord(f"r{i}", "p1", platform, "success")
+            for i, platform in enumerate(["mastodon", "discord", "bluesky"])
+        )
+        assert len(opens) == 1
+        assert len(path.read_text().splitlines()) == 3
+        assert DeliveryLog(path).has_been_delivered("p1", "bluesky")
+
+    def test_append_batch_empty_is_noop(self, tmp_path):
+        path = tmp_path / "log.json"
+        DeliveryLog(path).append_batch([])
+        assert not path.exists()
+
+    def test_row_matches_asdict(self):
+        from dataclasses import asdict
+
+        from kerygma_social.delivery_log import _row
+
+        record = DeliveryRecord("r1", "p1", "mastodon", "failure", error="boom", metadata={"n": 1})
+        assert _row(record) == asdict(record)
+
+    def test_load_skips_bad_rows_and_restores_gc(self, tmp_path):
+        import gc
+
+        path = tmp_path / "log.json"
+        path.write_text(
+            '{"record_id": "r1", "post_id": "p1", "platform": "mastodon", "status": "success"}\n'
+            '{"record_id": "r2"}\n'
+            '{"record_id": "r3", "post_id": "p1", "platform": "discord", "status": "success"}\n'
+        )
+        log = DeliveryLog(path)
+        assert [r.record_id for r in log.all_records] == ["r1", "r3"]
+        assert gc.isenabled()
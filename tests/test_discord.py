@@ -25,6 +25,18 @@ def test_embed_add_field():
     assert "fields" in payload
 
 
+def test_payload_reflects_edits_after_send():
+    """to_payload() is rebuilt per call, so edits between sends are never stale."""
+    wh = DiscordWebhook("https://discord.com/api/webhooks/test")
+    embed = DiscordEmbed(title="T", description="D")
+    wh.send_embed(embed)
+    embed.title = "Edited"
+    embed.add_field("key", "value")
+    sent = wh.send_embed(embed)["embeds"][0]
+    assert sent["title"] == "Edited"
+    assert sent["fields"] == [{"name": "key", "value": "value", "inline": False}]
+
+
 def test_embed_field_inline_is_bool():
     """Discord API expects inline as a boolean, not a string."""
     embed = DiscordEmbed(title="T", description="D")
@@ -32,3 +44,88 @@ def test_embed_field_inline_is_bool():
     assert embed.fields[0]["inline"] is True
     embed.add_field("key2", "value2", inline=False)
     assert embed.fields[1]["inline"] is False
+
+
+def test_live_send_reuses_connection(api_server):
+    api_server.queue(204)
+    wh = DiscordWebhook(f"{api_server.url}/api/webhooks/1/token", live=True)
+    first = wh.send_message("One")
+    wh.send_message("Two")
+    assert first["api_response"] == {"ok": True, "status": 204}
+    assert api_server.connections == 1
+
+
+def test_live_webhook_error(api_server):
+    import pytest
+    api_server.queue(400, {"message": "Invalid Form Body"})
+    wh = DiscordWebhook(f"{api_server.url}/api/webhooks/1/token", live=True)
+    with pytest.raises(RuntimeError, match="Discord webhook error 400"):
+        wh.send_message("Hello")
+
+
+def test_send_bulk_batches_embeds():
+    wh = DiscordWebhook("https://discord.com/api/webhooks/test")
+    embeds = [DiscordEmbed(title=f"T{i}", description="D") for i in range(23)]
+    results = wh.send_bulk(embeds, content="Backlog")
+    assert [len(r["embeds"]) for r in results] == [10, 10, 3]
+    assert [r["content"] for r in results] == ["Backlog", "", ""]
+    assert wh.messages_sent == 3
+    assert wh.send_bulk([]) == []
+
+
+def test_live_send_bulk_single_request(api_server):
+    import json
+    api_server.queue(204)
+    wh = DiscordWebhook(f"{api_server.url}/api/webhooks/1/token", live=True)
+    wh.send_bulk([DiscordEmbed(title="A", description="1"), DiscordEmbed(title="B", description="2")])
+    assert len(api_server.requests) == 1
+    body = json.loads(api_server.requests[0]["body"])
+    assert [e["title"] for e in body["embeds"]] == ["A", "B"]
+    assert "content" not in body
+
+
+def test_live_breaker_ignores_client_errors(api_server):
+    import pytest
+
+    from kerygma_social.circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitState
+    breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=1))
+    api_server.queue(400, {"message": "Invalid Form Body"})
+    wh = DiscordWebhook(f"{api_server.url}/api/webhooks/1/token", live=True, breaker=breaker)
+    with pytest.raises(RuntimeError, match="Discord webhook error 400"):
+        wh.send_message("Hello")
+    assert breaker.state == CircuitState.CLOSED
+    api_server.queue(204)
+    assert wh.send_message("Again")["api_response"]["status"] == 204
+
+
+def test_live_payload_is_compact(api_server):
+    api_server.queue(204)
+    wh = DiscordWebhook(f"{api_server.url}/api/webhooks/1/token", live=True)
+    wh.send_message("Héllo, world")
+    assert api_server.requests[0]["body"] == '{"content":"Héllo, world"}'.encode()
+
+
+def test_live_observes_rate_limit_headers(api_server):
+    import pytest
+
+    from kerygma_social.rate_limiter import RateLimiter, RateLimiterConfig, RateLimitExceeded
+
+    # Exhausted bucket: the next send must wait out the reset window.
+    api_server.queue(204, None, X_RateLimit_Remaining="0", X_RateLimit_Reset_After="30")
+    limiter = RateLimiter(RateLimiterConfig(tokens_per_second=2.5, max_tokens=5.0))
+    wh = DiscordWebhook(f"{api_server.url}/api/webhooks/1/token", live=True, rate_limiter=limiter)
+    wh.send_message("one")
+    with pytest.raises(RateLimitExceeded):
+        limiter.acquire(block=False)
+    wh.close()
+
+
+def test_webhooks_share_default_pool(api_server):
+    url = f"{api_server.url}/api/webhooks/1/token"
+    api_server.queue(204)
+    api_server.queue(204)
+    # A webhook built per event still reuses the warm connection to its host.
+    DiscordWebhook(url, live=True).send_message("one")
+    DiscordWebhook(url, live=True).send_message("two")
+    assert len(api_server.requests) == 2
+    assert api_server.connections == 1
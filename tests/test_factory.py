@@ -25,6 +25,38 @@ class TestBuildDistributor:
         dist = build_distributor(cfg)
         assert dist._discord is not None
 
+    def test_build_with_bluesky_and_ghost(self):
+        cfg = SocialConfig(
+            bluesky_handle="me.bsky.social",
+            bluesky_app_password="pw",
+            ghost_api_url="https://ghost.example.com",
+            ghost_admin_api_key="id:00ff",
+            ghost_newsletter_slug="weekly",
+            live_mode=True,
+        )
+        dist = build_distributor(cfg)
+        assert dist._mastodon is None and dist._discord is None
+        assert dist._bluesky.config.handle == "me.bsky.social"
+        assert dist._ghost.config.newsletter_slug == "weekly"
+        assert dist._bluesky._live and dist._ghost._live
+
+    def test_breaker_per_configured_platform(self):
+        from kerygma_social.circuit_breaker import CircuitBreaker
+
+        cfg = SocialConfig(
+            mastodon_instance_url="https://mastodon.social",
+            discord_webhook_url="https://discord.com/api/webhooks/test",
+        )
+        breakers = build_distributor(cfg)._circuit_breakers
+        assert set(breakers) == {"mastodon", "discord"}
+        assert all(isinstance(b, CircuitBreaker) for b in breakers.values())
+        assert breakers["mastodon"] is not breakers["discord"]
+
+    def test_retries_transient_failures(self):
+        from kerygma_social.retry import RetryConfig
+
+        assert build_distributor(SocialConfig())._retry_config == RetryConfig()
+
 
 class TestBuildDistributorForProfile:
     def _make_profile(self, platforms=None):
@@ -3,6 +3,8 @@
 import json
 from base64 import urlsafe_b64decode
 
+import pytest
+
 from kerygma_social.ghost import GhostClient, GhostConfig, GhostPost
 
 
@@ -11,18 +13,25 @@ def _pad_b64(s: str) -> str:
     return s + "=" * (-len(s) % 4)
 
 
-class TestGhost:
-    def _client(self) -> GhostClient:
-        return GhostClient(
-            GhostConfig(
-                admin_api_key="abc123:deadbeef0102030405060708090a0b0c0d0e0f101112131415161718191a1b",
-                api_url="https://ghost.example.com",
-            )
+def _client() -> GhostClient:
+    return GhostClient(
+        GhostConfig(
+            admin_api_key="abc123:deadbeef0102030405060708090a0b0c0d0e0f101112131415161718191a1b",
+            api_url="https://ghost.example.com",
         )
+    )
+
+
+@pytest.fixture(scope="class")
+def ghost_client() -> GhostClient:
+    """Shared by tests that do not post (post_count is per client)."""
+    return _client()
+
 
-    def test_jwt_structure(self):
-        client = self._client()
-        token = client._build_jwt()  # allow-secret — test-generated JWT token
+class TestGhost:
+
+    def test_jwt_structure(self, ghost_client):
+        token = ghost_client._build_jwt()  # allow-secret — test-generated JWT token
         parts = token.split(".")
         assert len(parts) == 3, "JWT must have 3 dot-separated parts"
 
@@ -38,16 +47,52 @@ class TestGhost:
         assert payload["exp"] - payload["iat"] == 300
 
     def test_jwt_invalid_key_format(self):
-        import pytest
-
         client = GhostClient(
             GhostConfig(admin_api_key="no-colon-here", api_url="https://x.com")
         )
         with pytest.raises(ValueError, match="id.*secret"):
             client._build_jwt()
 
+    def test_jwt_reused_until_near_expiry(self, monkeypatch):
+        import kerygma_social.ghost as ghost_module
+
+        now = [1_000_000.0]
+        monkeypatch.setattr(ghost_module.time, "time", lambda: now[0])
+        client = _client()
+        first = client._build_jwt()  # allow-secret — test-generated JWT token
+        now[0] += 200
+        assert client._build_jwt() == first
+        now[0] += 80  # within the refresh margin of the 300s expiry
+        second = client._build_jwt()  # allow-secret — test-generated JWT token
+        assert second != first
+        payload = json.loads(urlsafe_b64decode(_pad_b64(second.split(".")[1])))
+        assert payload["iat"] == 1_000_280
+
+    def test_build_ghost_jwt_explicit_now(self):
+        from kerygma_social.ghost_jwt import build_ghost_jwt
+
+        key = "abc123:deadbeef0102030405060708090a0b0c0d0e0f101112131415161718191a1b"
+        token = build_ghost_jwt(key, now=1_700_000_000)  # allow-secret — test-generated JWT token
+        assert token == build_ghost_jwt(key, now=1_700_000_000)
+        payload = json.loads(urlsafe_b64decode(_pad_b64(token.split(".")[1])))
+        assert payload == {"iat": 1_700_000_000, "exp": 1_700_000_300, "aud": "/admin/"}
+
+    def test_jwt_invalid_secret_hex(self):
+        from kerygma_social.ghost_jwt import build_ghost_jwt
+
+        with pytest.raises(ValueError):
+            build_ghost_jwt("abc123:not-hex")
+
+    def test_jwt_distinct_keys_sign_differently(self):
+        from kerygma_social.ghost_jwt import build_ghost_jwt
+
+        a = build_ghost_jwt("k1:00ff", now=1_700_000_000)  # allow-secret — test-generated JWT token
+        b = build_ghost_jwt("k2:00fe", now=1_700_000_000)  # allow-secret — test-generated JWT token
+        assert a.split(".")[0] != b.split(".")[0]
+        assert a.split(".")[2] != b.split(".")[2]
+
     def test_mock_post_creation(self):
-        client = self._client()
+        client = _client()
         post = GhostPost(title="Test Post", html="<p>Hello</p>")
         result = client.create_post(post)
         assert "id" in result
@@ -55,13 +100,12 @@ class TestGhost:
         assert client.post_count == 1
 
     def test_mock_post_url(self):
-        client = self._client()
+        client = _client()
         result = client.create_post(GhostPost(title="T", html="<p>H</p>"))
         assert result["url"].startswith("https://ghost.example.com/")
 
-    def test_format_for_ghost(self):
-        client = self._client()
-        post = client.format_for_ghost(
+    def test_format_for_ghost(self, ghost_client):
+        post = ghost_client.format_for_ghost(
             title="My Essay",
             body="This is the summary.",
             canonical_url="https://example.com/essay",
@@ -71,20 +115,19 @@ class TestGhost:
         assert 'href="https://example.com/essay"' in post.html
         assert post.status == "draft"
 
-    def test_format_for_ghost_no_url(self):
-        client = self._client()
-        post = client.format_for_ghost(title="T", body="B")
+    def test_format_for_ghost_no_url(self, ghost_client):
+        post = ghost_client.format_for_ghost(title="T", body="B")
         assert "href" not in post.html
 
     def test_post_count_increments(self):
-        client = self._client()
+        client = _client()
         assert client.post_count == 0
         client.create_post(GhostPost(title="One", html="<p>1</p>"))
         client.create_post(GhostPost(title="Two", html="<p>2</p>"))
         assert client.post_count == 2
 
     def test_post_status_preserved(self):
-        client = self._client()
+        client = _client()
         result = client.create_post(
             GhostPost(title="Published", html="<p>Live</p>", status="published")
         )
@@ -95,7 +138,7 @@ class TestGhost:
         assert post.visibility == "public"
 
     def test_visibility_paid(self):
-        client = self._client()
+        client = _client()
         post = GhostPost(
             title="Paid Content", html="<p>Premium</p>",
             visibility="paid"
@@ -104,7 +147,7 @@ class TestGhost:
         assert result["visibility"] == "paid"
 
     def test_visibility_members(self):
-        client = self._client()
+        client = _client()
         post = GhostPost(
             title="Members Only", html="<p>Exclusive</p>",
             visibility="members"
@@ -115,3 +158,47 @@ class TestGhost:
     def test_config_defaults(self):
         config = GhostConfig(admin_api_key="a:b", api_url="https://x.com")
         assert config.newsletter_slug == ""
+
+    def _live_client(self, api_server, pool=None) -> GhostClient:
+        return GhostClient(
+            GhostConfig(
+                admin_api_key="abc123:deadbeef0102030405060708090a0b0c0d0e0f101112131415161718191a1b",
+                api_url=api_server.url,
+                newsletter_slug="weekly",
+            ),
+            live=True,
+            pool=pool,
+        )
+
+    def test_live_post_reuses_connection_and_token(self, api_server):
+        api_server.queue(201, {"posts": [{"id": "g1", "url": "https://ghost.test/one/"}]})
+        api_server.queue(201, {"posts": [{"id": "g2", "url": "https://ghost.test/two/"}]})
+        client = self._live_client(api_server)
+        first = client.create_post(GhostPost(title="One", html="<p>1</p>", tags=["news"]))
+        client.create_post(GhostPost(title="Two", html="<p>2</p>"))
+        assert first["id"] == "g1"
+        assert client.post_count == 2
+        assert api_server.connections == 1
+        auth = [r["headers"]["Authorization"] for r in api_server.requests]
+        assert auth[0].startswith("Ghost ") and auth[0] == auth[1]
+        sent = json.loads(api_server.requests[0]["body"])["posts"][0]
+        assert api_server.requests[0]["path"] == "/ghost/api/admin/posts/"
+        assert sent["tags"] == [{"name": "news"}]
+        assert sent["newsletter"] == {"slug": "weekly"}
+
+    def test_live_api_error(self, api_server):
+        import pytest
+
+        api_server.queue(422, {"errors": [{"message": "Validation error"}]})
+        client = self._live_client(api_server)
+        with pytest.raises(RuntimeError, match="Ghost API error 422"):
+            client.create_post(GhostPost(title="T", html="<p>H</p>"))
+
+    def test_close_leaves_shared_pool_open(self, api_server):
+        from kerygma_social.http_pool import HttpPool
+
+        pool = HttpPool()
+        client = self._live_client(api_server, pool=pool)
+        client.create_post(GhostPost(title="T", html="<p>H</p>"))
+        client.close()
+        assert pool.idle_connections == 1
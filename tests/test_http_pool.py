@@ -0,0 +1,94 @@
+"""Tests for the keep-alive HTTP connection pool."""
+
+import http.client
+
+import pytest
+
+from kerygma_social.http_pool import (
+    DeliveryUncertainError,
+    HttpError,
+    HttpPool,
+    HttpResponse,
+    shared_pool,
+)
+
+
+class TestHttpPool:
+    def test_reuses_connection_across_requests(self, api_server):
+        pool = HttpPool()
+        for _ in range(3):
+            resp = pool.request("POST", f"{api_server.url}/post", body=b"{}")
+            assert resp.status == 200
+            assert resp.json() == {"ok": True}
+        assert len(api_server.requests) == 3
+        assert api_server.connections == 1
+        assert pool.idle_connections == 1
+
+    def test_raise_for_status(self, api_server):
+        api_server.queue(429, {"error": "slow down"})
+        resp = HttpPool().request("POST", f"{api_server.url}/post", body=b"{}")
+        with pytest.raises(HttpError, match="Test API error 429") as exc_info:
+            resp.raise_for_status("Test API error")
+        assert exc_info.value.status == 429
+        assert "slow down" in exc_info.value.body
+
+    def test_raise_for_status_parses_retry_after(self, api_server):
+        api_server.queue(429, {"error": "slow down"}, Retry_After="7")
+        api_server.queue(503, None, Retry_After="Wed, 21 Oct 2015 07:28:00 GMT")
+        api_server.queue(500, None)
+        pool = HttpPool()
+        delays = []
+        for _ in range(3):
+            with pytest.raises(HttpError) as exc_info:
+                pool.request("GET", f"{api_server.url}/x").raise_for_status("err")
+            delays.append(exc_info.value.retry_after)
+        assert delays == [7.0, 0.0, None]
+
+    def test_error_is_runtime_error(self):
+        assert issubclass(HttpError, RuntimeError)
+
+    def test_stale_connection_is_replayed(self, api_server):
+        pool = HttpPool()
+        api_server.drop_after_response = True
+        pool.request("POST", f"{api_server.url}/first", body=b"{}")
+        api_server.drop_after_response = False
+        resp = pool.request("POST", f"{api_server.url}/second", body=b"{}")
+        assert resp.status == 200
+        assert [r["path"] for r in api_server.requests] == ["/first", "/second"]
+
+    def test_post_dropped_after_processing_is_not_replayed(self, api_server):
+        pool = HttpPool()
+        pool.request("POST", f"{api_server.url}/first", body=b"{}")
+        api_server.drop_without_response = 1
+        with pytest.raises(DeliveryUncertainError) as exc_info:
+            pool.request("POST", f"{api_server.url}/second", body=b"{}")
+        assert isinstance(exc_info.value.__cause__, http.client.RemoteDisconnected)
+        assert not isinstance(exc_info.value, (RuntimeError, OSError))
+        assert [r["path"] for r in api_server.requests] == ["/first", "/second"]
+
+    def test_get_dropped_after_processing_is_replayed(self, api_server):
+        pool = HttpPool()
+        pool.request("GET", f"{api_server.url}/first")
+        api_server.drop_without_response = 1
+        assert pool.request("GET", f"{api_server.url}/second").status == 200
+        assert [r["path"] for r in api_server.requests] == ["/first", "/second", "/second"]
+
+    def test_close_drops_idle_connections(self, api_server):
+        pool = HttpPool()
+        pool.request("GET", f"{api_server.url}/feed")
+        assert pool.idle_connections == 1
+        pool.close()
+        assert pool.idle_connections == 0
+
+    def test_rejects_unsupported_scheme(self):
+        with pytest.raises(ValueError, match="scheme"):
+            HttpPool().request("GET", "ftp://example.com/file")
+
+    def test_shared_pool_is_a_singleton(self):
+        assert shared_pool() is shared_pool()
+
+
+class TestHttpResponse:
+    def test_json_parses_utf8_bytes(self):
+        resp = HttpResponse(status=200, headers=None, body='{"name": "café"}'.encode())
+        assert resp.json() == {"name": "café"}
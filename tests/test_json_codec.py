@@ -0,0 +1,55 @@
+"""Tests for the JSON codec helpers (stdlib and optional orjson backends)."""
+
+import json
+
+import pytest
+
+from kerygma_social import json_codec
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_codec, "orjson", None)
+    else:
+        monkeypatch.setattr(json_codec, "orjson", pytest.importorskip("orjson"))
+    return request.param
+
+
+SAMPLE = {"title": "Café ☕", "tags": ["a", "b"], "n": 3, "nested": {"ok": True, "none": None}}
+
+
+class TestJsonCodec:
+    def test_compact_dumps(self, backend):
+        out = json_codec.dumps(SAMPLE)
+        assert isinstance(out, bytes)
+        assert out == json.dumps(SAMPLE, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def test_indented_dumps_matches_stdlib(self, backend):
+        out = json_codec.dumps(SAMPLE, indent=True)
+        assert out == json.dumps(SAMPLE, indent=2, ensure_ascii=False).encode()
+
+    def test_loads_bytes_and_str(self, backend):
+        raw = json_codec.dumps(SAMPLE)
+        assert json_codec.loads(raw) == SAMPLE
+        assert json_codec.loads(raw.decode()) == SAMPLE
+
+    def test_decode_error(self, backend):
+        with pytest.raises(json_codec.JSONDecodeError):
+            json_codec.loads(b'{"broken"')
+
+    def test_ghost_jwt_is_backend_independent(self, backend):
+        from kerygma_social.ghost_jwt import build_ghost_jwt
+
+        key = "abc123:deadbeef0102030405060708090a0b0c0d0e0f101112131415161718191a1b"
+        assert build_ghost_jwt(key, now=1_700_000_000) == (  # allow-secret — test-generated JWT token
+            "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCIsImtpZCI6ImFiYzEyMyJ9"
+            ".eyJpYXQiOjE3MDAwMDAwMDAsImV4cCI6MTcwMDAwMDMwMCwiYXVkIjoiL2FkbWluLyJ9"
+            ".9PjHGuti6u1zcXWaYGfBwfP4qFKBELpsFU34XOvDr3I"
+        )
+
+    def test_loads_lines_skips_torn_line(self, backend):
+        lines = [b'"a"', b'{"n": 1}', b'"tor']
+        assert json_codec.loads_lines(lines) == ["a", {"n": 1}]
+        assert json_codec.loads_lines(lines[:2]) == ["a", {"n": 1}]
+        assert json_codec.loads_lines([]) == []
@@ -1,4 +1,6 @@
 """Tests for the mastodon module."""
+import pytest
+
 from kerygma_social.mastodon import MastodonClient, MastodonConfig, Toot
 
 
@@ -42,8 +44,13 @@ def test_post_toot_uses_config_max_chars():
 def test_format_for_mastodon():
     client = MastodonClient(MastodonConfig(instance_url="https://mastodon.social", access_token="test"))
     text = client.format_for_mastodon("New Essay", "https://example.com/essay", ["writing", "organvm"])
-    assert "New Essay" in text
-    assert "#writing" in text
+    assert text == "New Essay\n\nhttps://example.com/essay\n\n#writing #organvm"
+
+
+@pytest.fixture(scope="module")
+def client():
+    """50-char client shared by tests that only split text (no state)."""
+    return MastodonClient(MastodonConfig(instance_url="https://m.test", access_token="t", max_chars=50))
 
 
 class TestSplitForThread:
@@ -52,24 +59,38 @@ class TestSplitForThread:
         result = client.split_for_thread("Short message")
         assert result == ["Short message"]
 
-    def test_long_text_splits_at_word_boundary(self):
-        client = MastodonClient(MastodonConfig(instance_url="https://m.test", access_token="t", max_chars=50))
+    def test_long_text_splits_at_word_boundary(self, client):
         text = "This is a fairly long message that should be split into multiple parts"
         chunks = client.split_for_thread(text)
         assert len(chunks) >= 2
         for chunk in chunks:
             assert len(chunk) <= 50
 
-    def test_thread_numbering_space(self):
+    def test_thread_numbering_space(self, client):
         """If thread numbering (e.g. '1/3') is added, chunks must have room for it.
         This test documents the W8 weakness: the current split doesn't reserve space."""
-        client = MastodonClient(MastodonConfig(instance_url="https://m.test", access_token="t", max_chars=50))
         text = "A" * 120  # Forces split
         chunks = client.split_for_thread(text)
         # Verify raw split respects limit (numbering must be added externally)
         for chunk in chunks:
             assert len(chunk) <= 50
 
+    def test_numbered_chunks_fit_limit(self, client):
+        text = "word " * 200
+        chunks = client.split_for_thread(text.strip(), number=True)
+        total = len(chunks)
+        assert total >= 10
+        for i, chunk in enumerate(chunks, 1):
+            assert len(chunk) <= 50
+            assert chunk.endswith(f" {i}/{total}")
+        assert client.split_for_thread("short", number=True) == ["short"]
+
+    def test_numbering_widens_when_count_gains_a_digit(self):
+        client = MastodonClient(MastodonConfig(instance_url="https://m.test", access_token="t", max_chars=12))
+        chunks = client.split_for_thread(" ".join(["abcde"] * 15), number=True)
+        assert chunks[0] == "abcde 1/15" and chunks[-1] == "abcde 15/15"
+        assert all(len(c) <= 12 for c in chunks)
+
     def test_split_preserves_all_content(self):
         """Joining chunks should reconstruct the original content (modulo whitespace)."""
         client = MastodonClient(MastodonConfig(instance_url="https://m.test", access_token="t", max_chars=30))
@@ -78,11 +99,111 @@ class TestSplitForThread:
         rejoined = " ".join(c.strip() for c in chunks)
         assert rejoined == text.strip()
 
-    def test_unicode_emoji_in_text(self):
+    def test_unicode_emoji_in_text(self, client):
         """Emoji characters should not break splitting."""
-        client = MastodonClient(MastodonConfig(instance_url="https://m.test", access_token="t", max_chars=50))
         text = "Hello world! " + "🔥" * 30
         chunks = client.split_for_thread(text)
         assert len(chunks) >= 1
         full_text = "".join(chunks)
         assert "🔥" in full_text
+
+    def test_skips_mixed_whitespace_between_chunks(self):
+        client = MastodonClient(MastodonConfig(instance_url="https://m.test", access_token="t", max_chars=10))
+        assert client.split_for_thread("alpha beta \n\tgamma delta") == ["alpha", "beta", "gamma", "delta"]
+
+
+def test_would_exceed():
+    client = MastodonClient(MastodonConfig(instance_url="https://m.test", access_token="t", max_chars=100))
+    assert client.would_exceed(60, 38) is False
+    assert client.would_exceed(60, 39) is True
+    title, url = "x" * 60, "https://e.com/" + "y" * 24
+    assert len(client.format_for_mastodon(title, url)) == 100
+
+
+def test_format_without_truncation():
+    client = MastodonClient(MastodonConfig(instance_url="https://m.test", access_token="t", max_chars=20))
+    text = client.format_for_mastodon("A long title here", "https://example.com", truncate=False)
+    assert text == "A long title here\n\nhttps://example.com"
+
+
+def _live_client(api_server):
+    return MastodonClient(MastodonConfig(instance_url=api_server.url, access_token="tok"), live=True)
+
+
+def test_live_thread_reuses_connection(api_server):
+    import json
+
+    api_server.queue(200, {"id": "1", "url": "https://m.test/@u/1"})
+    api_server.queue(200, {"id": "2", "url": "https://m.test/@u/2"})
+    client = _live_client(api_server)
+    results = client.post_thread([Toot(content="one"), Toot(content="two")])
+    assert [r["id"] for r in results] == ["1", "2"]
+    assert api_server.connections == 1
+    assert api_server.requests[0]["path"] == "/api/v1/statuses"
+    assert api_server.requests[0]["headers"]["Authorization"] == "Bearer tok"
+    assert json.loads(api_server.requests[1]["body"])["in_reply_to_id"] == "1"
+    client.close()
+
+
+def test_live_api_error(api_server):
+    import pytest
+
+    api_server.queue(422, {"error": "Validation failed"})
+    with pytest.raises(RuntimeError, match="Mastodon API error 422: .*Validation failed"):
+        _live_client(api_server).post_toot(Toot(content="hi"))
+
+
+def test_live_connection_error():
+    import pytest
+
+    client = MastodonClient(MastodonConfig(instance_url="http://127.0.0.1:9", access_token="t"), live=True)
+    with pytest.raises(RuntimeError, match="Mastodon connection error"):
+        client.post_toot(Toot(content="hi"))
+
+
+def test_live_observes_rate_limit_headers(api_server):
+    from kerygma_social.rate_limiter import RateLimiter, RateLimiterConfig
+
+    api_server.queue(200, {"id": "1"}, X_RateLimit_Remaining="12", X_RateLimit_Reset="2099-01-01T00:00:00.000Z")
+    limiter = RateLimiter(RateLimiterConfig(tokens_per_second=1.0, max_tokens=300.0))
+    client = MastodonClient(
+        MastodonConfig(instance_url=api_server.url, access_token="tok"), live=True, rate_limiter=limiter,
+    )
+    client.post_toot(Toot(content="hi"))
+    assert 11.0 < limiter.available_tokens <= 13.0
+    client.close()
+
+
+def test_format_is_memoized_across_clients():
+    from kerygma_social.mastodon import _format_toot
+
+    a = MastodonClient(MastodonConfig(instance_url="https://a.test", access_token="t"))
+    b = MastodonClient(MastodonConfig(instance_url="https://b.test", access_token="t"))
+    first = a.format_for_mastodon("Memo", "https://example.com/memo", ["x"])
+    hits = _format_toot.cache_info().hits
+    assert b.format_for_mastodon("Memo", "https://example.com/memo", ["x"]) is first
+    assert _format_toot.cache_info().hits == hits + 1
+
+
+def test_split_for_thread_returns_fresh_list():
+    client = MastodonClient(MastodonConfig(instance_url="https://m.test", access_token="t", max_chars=10))
+    chunks = client.split_for_thread("one two three four")
+    chunks.append("mutated")
+    assert "mutated" not in client.split_for_thread("one two three four")
+
+
+def test_format_truncates_title_not_url():
+    client = MastodonClient(MastodonConfig(instance_url="https://m.test", access_token="t", max_chars=60))
+    url = "https://example.com/essays/long-slug"
+    text = client.format_for_mastodon("An essay title far too long to fit here", url, ["x"])
+    assert len(text) <= 60
+    assert text.endswith(f"\n\n{url}\n\n#x")
+    assert text.split("\n\n")[0].endswith("…")
+
+
+def test_format_batch_matches_single_format():
+    client = MastodonClient(MastodonConfig(instance_url="https://m.test", access_token="t", max_chars=60))
+    items = [("Short", "https://example.com/a"), ("A title that is much too long to fit " * 2, "https://example.com/b")]
+    tags = ["writing", "organvm"]
+    assert client.format_batch(items, tags) == [client.format_for_mastodon(t, u, tags) for t, u in items]
+    assert client.format_batch(items) == [client.format_for_mastodon(t, u) for t, u in items]
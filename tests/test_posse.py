@@ -129,3 +129,539 @@ class TestWithResilience:
         result = dist._with_resilience("test", mock.do_action)
         assert result == {"url": "https://mock.example.com/posted"}
         assert mock.calls == 2
+
+    def test_runner_built_once_per_platform(self):
+        dist = PosseDistributor(
+            retry_config=RetryConfig(max_attempts=2, base_delay=0.001, jitter=False),
+        )
+        assert dist._with_resilience("test", lambda x: x + 1, 1) == 2
+        runner = dist._runners["test"]
+        # The call itself is passed per invocation, so swapped clients are honored.
+        assert dist._with_resilience("test", lambda x, y=0: x * y, 3, y=4) == 12
+        assert dist._runners["test"] is runner
+        assert dist._with_resilience("other", lambda: "ok") == "ok"
+        assert set(dist._runners) == {"test", "other"}
+
+
+class TestConcurrentSyndicate:
+    """syndicate() and syndicate_async() share ordering, dedup, and fan-out behavior."""
+
+    @pytest.fixture(params=["sync", "async"])
+    def run(self, request):
+        import asyncio
+
+        if request.param == "sync":
+            return lambda dist, post_id: dist.syndicate(post_id)
+        return lambda dist, post_id: asyncio.run(dist.syndicate_async(post_id))
+
+    def _dist(self, delivery_log=None):
+        from kerygma_social.discord import DiscordWebhook
+        from kerygma_social.mastodon import MastodonClient, MastodonConfig
+
+        return PosseDistributor(
+            mastodon_client=MastodonClient(MastodonConfig(instance_url="https://m.test", access_token="t")),
+            discord_webhook=DiscordWebhook("https://discord.test/webhook"),
+            delivery_log=delivery_log,
+        )
+
+    def test_records_follow_platform_order(self, run):
+        from kerygma_social.delivery_log import DeliveryLog
+
+        log = DeliveryLog()
+        dist = self._dist(log)
+        dist.create_post("P1", "Title", "Body", "https://example.com",
+                         [Platform.DISCORD, Platform.BLUESKY, Platform.MASTODON])
+        records = run(dist, "P1")
+        assert [r.platform for r in records] == [Platform.DISCORD, Platform.BLUESKY, Platform.MASTODON]
+        assert records[0].status == SyndicationStatus.PUBLISHED
+        assert records[1].status == SyndicationStatus.SKIPPED
+        assert records[2].status == SyndicationStatus.PUBLISHED
+        assert dist.get_post("P1").syndications == records
+        assert log.total_records == 3
+
+    def test_platforms_dispatch_concurrently(self, run):
+        """Both platform calls must be in flight at once to pass the barrier."""
+        import threading
+
+        dist = self._dist()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def meet(*args, **kwargs):
+            barrier.wait()
+            return {"url": "https://posted.example.com"}
+
+        dist._mastodon.post_toot = meet
+        dist._discord.send_embed = meet
+        dist.create_post("P1", "T", "B", "https://example.com", [Platform.MASTODON, Platform.DISCORD])
+        records = run(dist, "P1")
+        assert all(r.status == SyndicationStatus.PUBLISHED for r in records)
+
+    def test_handler_error_fails_only_its_platform(self, run):
+        from kerygma_social.delivery_log import DeliveryLog
+
+        log = DeliveryLog()
+        dist = self._dist(log)
+
+        def broken(post):
+            raise ValueError("bad fragments")
+
+        dist._handlers[Platform.DISCORD] = broken
+        dist.create_post("P1", "T", "B", "https://example.com", [Platform.DISCORD, Platform.MASTODON])
+        records = run(dist, "P1")
+        assert records[0].status == SyndicationStatus.FAILED
+        assert records[0].error == "bad fragments"
+        assert records[1].status == SyndicationStatus.PUBLISHED
+        assert log.total_records == 2
+
+    def test_dedup_skips_without_dispatch(self, run):
+        from kerygma_social.delivery_log import DeliveryLog
+
+        log = DeliveryLog()
+        dist = self._dist(log)
+        dist.create_post("P1", "T", "B", "https://example.com", [Platform.MASTODON])
+        run(dist, "P1")
+        records = run(dist, "P1")
+        assert records[0].status == SyndicationStatus.SKIPPED
+        assert records[0].error == "Already delivered (dedup)"
+        assert dist._mastodon.post_count == 1
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_for_one_post_coalesce(self):
+        import threading
+        import time
+
+        from kerygma_social.discord import DiscordWebhook
+
+        dist = PosseDistributor(discord_webhook=DiscordWebhook("https://discord.test/webhook"))
+        entered, release = threading.Event(), threading.Event()
+        calls = []
+
+        def slow_send(*args, **kwargs):
+            calls.append(1)
+            entered.set()
+            release.wait(timeout=5)
+            return {"url": "https://posted.example.com"}
+
+        dist._discord.send_embed = slow_send
+        dist.create_post("P1", "T", "B", "https://example.com", [Platform.DISCORD])
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(dist.syndicate("P1"))) for _ in range(3)]
+        threads[0].start()
+        assert entered.wait(timeout=5)
+        for t in threads[1:]:
+            t.start()
+        time.sleep(0.05)  # let the followers reach the in-flight future
+        release.set()
+        for t in threads:
+            t.join()
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+        assert dist._inflight == {}
+
+    def test_failed_call_clears_flight(self):
+        dist = PosseDistributor()
+        with pytest.raises(KeyError):
+            dist.syndicate("missing")
+        assert dist._inflight == {}
+
+
+class TestSyndicateBatchAsync:
+    def test_posts_dispatch_together(self):
+        """Two posts' platform calls must be in flight at once to pass the barrier."""
+        import asyncio
+        import threading
+
+        from kerygma_social.discord import DiscordWebhook
+
+        dist = PosseDistributor(discord_webhook=DiscordWebhook("https://discord.test/webhook"))
+        barrier = threading.Barrier(2, timeout=5)
+
+        def meet(*args, **kwargs):
+            barrier.wait()
+            return {"url": "https://posted.example.com"}
+
+        dist._discord.send_embed = meet
+        for post_id in ("P1", "P2"):
+            dist.create_post(post_id, "T", "B", "https://example.com", [Platform.DISCORD])
+        results = asyncio.run(dist.syndicate_batch_async(iter(["P1", "P2", "P1"])))
+        assert list(results) == ["P1", "P2"]
+        assert all(r[0].status == SyndicationStatus.PUBLISHED for r in results.values())
+
+    def test_batch_logs_with_one_write(self, tmp_path):
+        import asyncio
+
+        from kerygma_social.delivery_log import DeliveryLog
+        from kerygma_social.discord import DiscordWebhook
+
+        log = DeliveryLog(tmp_path / "log.jsonl")
+        writes = []
+        real_append = log.append_batch
+        log.append_batch = lambda records: writes.append(1) or real_append(records)
+        dist = PosseDistributor(
+            discord_webhook=DiscordWebhook("https://discord.test/webhook"), delivery_log=log,
+        )
+        for post_id in ("P1", "P2", "P3"):
+            dist.create_post(post_id, "T", "B", "https://example.com", [Platform.DISCORD])
+        asyncio.run(dist.syndicate_batch_async(["P1", "P2", "P3"]))
+        assert writes == [1]
+        assert DeliveryLog(tmp_path / "log.jsonl").total_records == 3
+
+    def test_bluesky_posts_share_one_call(self):
+        import asyncio
+
+        from kerygma_social.bluesky import BlueskyClient, BlueskyConfig
+
+        dist = PosseDistributor(bluesky_client=BlueskyClient(BlueskyConfig(handle="h", app_password="p")))
+        calls = []
+
+        def post_batch(posts):
+            calls.append(len(posts))
+            return [{"uri": f"at://x/{n}"} for n in range(len(posts))]
+
+        dist._bluesky.post_batch = post_batch
+        for post_id in ("P1", "P2", "P3"):
+            dist.create_post(post_id, "T", "B", "https://example.com", [Platform.BLUESKY])
+        results = asyncio.run(dist.syndicate_batch_async(["P1", "P2", "P3"]))
+        assert calls == [3]
+        stamps = {r[0].published_at for r in results.values()}
+        assert len(stamps) == 1 and None not in stamps
+        assert [r[0].external_url for r in results.values()] == ["at://x/0", "at://x/1", "at://x/2"]
+
+    def test_bluesky_batch_failure_fails_each_post(self):
+        import asyncio
+
+        from kerygma_social.bluesky import BlueskyClient, BlueskyConfig
+
+        dist = PosseDistributor(bluesky_client=BlueskyClient(BlueskyConfig(handle="h", app_password="p")))
+
+        def post_batch(posts):
+            raise RuntimeError("Bluesky API error 500")
+
+        dist._bluesky.post_batch = post_batch
+        for post_id in ("P1", "P2"):
+            dist.create_post(post_id, "T", "B", "https://example.com", [Platform.BLUESKY])
+        results = asyncio.run(dist.syndicate_batch_async(["P1", "P2"]))
+        assert all(r[0].status == SyndicationStatus.FAILED for r in results.values())
+        assert "500" in results["P2"][0].error
+
+    def _chunked_bluesky(self, monkeypatch, fail_calls):
+        """Four Bluesky posts, two per applyWrites chunk; listed calls raise."""
+        import asyncio
+
+        import kerygma_social.posse as posse_module
+        from kerygma_social.bluesky import BlueskyClient, BlueskyConfig
+
+        monkeypatch.setattr(posse_module, "MAX_WRITES_PER_BATCH", 2)
+        dist = PosseDistributor(
+            bluesky_client=BlueskyClient(BlueskyConfig(handle="h", app_password="p")),
+            retry_config=RetryConfig(max_attempts=2, base_delay=0.001, jitter=False),
+        )
+        created = []
+
+        def post_batch(posts):
+            if len(created) + 1 in fail_calls:
+                created.append(None)
+                raise RuntimeError("Bluesky API error 502")
+            created.append(len(posts))
+            return [{"uri": f"at://x/{p.text[:2]}"} for p in posts]
+
+        dist._bluesky.post_batch = post_batch
+        ids = ["P1", "P2", "P3", "P4"]
+        for post_id in ids:
+            dist.create_post(post_id, post_id, "B", "https://example.com", [Platform.BLUESKY])
+        results = asyncio.run(dist.syndicate_batch_async(ids))
+        return created, {post_id: results[post_id][0] for post_id in ids}
+
+    def test_bluesky_retry_resends_only_failed_chunk(self, monkeypatch):
+        created, records = self._chunked_bluesky(monkeypatch, fail_calls={2})
+        assert created == [2, None, 2]
+        assert all(r.status == SyndicationStatus.PUBLISHED for r in records.values())
+
+    def test_bluesky_failed_chunk_keeps_earlier_chunks_published(self, monkeypatch):
+        created, records = self._chunked_bluesky(monkeypatch, fail_calls={2, 3})
+        assert created == [2, None, None]
+        assert [r.status for r in records.values()] == [
+            SyndicationStatus.PUBLISHED, SyndicationStatus.PUBLISHED,
+            SyndicationStatus.FAILED, SyndicationStatus.FAILED,
+        ]
+
+    def test_bluesky_missing_result_fails_record(self):
+        import asyncio
+
+        from kerygma_social.bluesky import BlueskyClient, BlueskyConfig
+
+        dist = PosseDistributor(bluesky_client=BlueskyClient(BlueskyConfig(handle="h", app_password="p")))
+        dist._bluesky.post_batch = lambda posts: [{"uri": "at://x/0"}]
+        for post_id in ("P1", "P2"):
+            dist.create_post(post_id, "T", "B", "https://example.com", [Platform.BLUESKY])
+        results = asyncio.run(dist.syndicate_batch_async(["P1", "P2"]))
+        assert results["P1"][0].status == SyndicationStatus.PUBLISHED
+        assert results["P2"][0].status == SyndicationStatus.FAILED
+        assert "no result" in results["P2"][0].error
+
+
+def test_create_post_accepts_created_at():
+    from datetime import datetime
+
+    stamp = datetime(2026, 1, 1, 12, 0)
+    dist = PosseDistributor()
+    post = dist.create_post("P1", "T", "B", "https://example.com", created_at=stamp)
+    assert post.created_at == stamp
+    assert dist.create_post("P2", "T", "B", "https://example.com").created_at > stamp
+
+
+class TestMaxInFlight:
+    def test_caps_concurrent_calls_per_platform(self):
+        import asyncio
+        import threading
+        import time
+
+        from kerygma_social.mastodon import MastodonClient, MastodonConfig
+
+        dist = PosseDistributor(
+            mastodon_client=MastodonClient(MastodonConfig(instance_url="https://m.test", access_token="t")),
+            max_in_flight={"mastodon": 2},
+        )
+        lock = threading.Lock()
+        active, peak = [0], [0]
+
+        def post_toot(toot):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return {"url": "https://m.test/@u/1"}
+
+        dist._mastodon.post_toot = post_toot
+        ids = [f"P{i}" for i in range(6)]
+        for post_id in ids:
+            dist.create_post(post_id, "T", "B", "https://example.com", [Platform.MASTODON])
+        results = asyncio.run(dist.syndicate_batch_async(ids))
+        assert all(r[0].status == SyndicationStatus.PUBLISHED for r in results.values())
+        assert peak[0] == 2
+
+    def test_defaults(self):
+        from kerygma_social.posse import DEFAULT_MAX_IN_FLIGHT
+
+        assert set(PosseDistributor()._in_flight) == set(DEFAULT_MAX_IN_FLIGHT)
+        assert PosseDistributor(max_in_flight={})._in_flight == {}
+
+
+class TestDiscordEmbed:
+    def _dist(self):
+        from kerygma_social.discord import DiscordWebhook
+
+        return PosseDistributor(discord_webhook=DiscordWebhook("https://discord.test/webhook"))
+
+    def _sent_embed(self, dist):
+        return dist._discord._sent[-1]["embeds"][0]
+
+    def test_body_split_and_category_color(self):
+        dist = self._dist()
+        dist.create_post("P1", "Essay: On Tools", "Headline\nLonger description",
+                         "https://example.com", [Platform.DISCORD])
+        dist.syndicate("P1")
+        embed = self._sent_embed(dist)
+        assert embed["title"] == "Headline"
+        assert embed["description"] == "Longer description"
+        assert embed["color"] == 0xF1C40F
+        assert embed["fields"][0]["name"] == "Published"
+
+    def test_published_field_is_utc(self):
+        from datetime import UTC, datetime, timedelta
+
+        dist = self._dist()
+        dist.create_post("P1", "Hello", "World", "https://example.com", [Platform.DISCORD])
+        dist.syndicate("P1")
+        stamp = datetime.strptime(self._sent_embed(dist)["fields"][0]["value"], "%Y-%m-%d %H:%M UTC")
+        now = datetime.now(UTC).replace(tzinfo=None)
+        assert abs(now - stamp) < timedelta(minutes=2)
+
+    def test_default_color(self):
+        dist = self._dist()
+        dist.create_post("P1", "Hello", "World", "https://example.com", [Platform.DISCORD])
+        dist.syndicate("P1")
+        assert self._sent_embed(dist)["color"] == 0x5865F2
+
+    def test_fragments_refresh_when_post_recreated(self):
+        dist = self._dist()
+        dist.create_post("P1", "Launch", "First", "https://example.com", [Platform.DISCORD])
+        dist.syndicate("P1")
+        dist.create_post("P1", "Release", "Second", "https://example.com", [Platform.DISCORD])
+        dist.syndicate("P1")
+        embed = self._sent_embed(dist)
+        assert embed["title"] == "Second"
+        assert embed["color"] == 0x3498DB
+
+
+def test_dedup_uses_reloaded_delivery_log(tmp_path):
+    from kerygma_social.delivery_log import DeliveryLog
+    from kerygma_social.mastodon import MastodonClient, MastodonConfig
+
+    path = tmp_path / "log.jsonl"
+    client = MastodonClient(MastodonConfig(instance_url="https://m.test", access_token="t"))
+    first = PosseDistributor(mastodon_client=client, delivery_log=DeliveryLog(path))
+    first.create_post("P1", "T", "B", "https://example.com", [Platform.MASTODON])
+    first.syndicate("P1")
+
+    second = PosseDistributor(mastodon_client=client, delivery_log=DeliveryLog(path))
+    second.create_post("P1", "T", "B", "https://example.com", [Platform.MASTODON])
+    records = second.syndicate("P1")
+    assert records[0].error == "Already delivered (dedup)"
+    assert client.post_count == 1
+
+
+def test_post_and_record_are_slotted():
+    dist = PosseDistributor()
+    post = dist.create_post("P1", "T", "B", "https://example.com", [Platform.RSS])
+    records = dist.syndicate("P1")
+    assert not hasattr(post, "__dict__")
+    assert not hasattr(records[0], "__dict__")
+
+
+class TestGetSyndication:
+    def test_lookup_after_syndicate(self):
+        from kerygma_social.discord import DiscordWebhook
+
+        dist = PosseDistributor(discord_webhook=DiscordWebhook("https://discord.test/webhook"))
+        post = dist.create_post("P1", "T", "B", "https://example.com", [Platform.DISCORD, Platform.RSS])
+        assert post.get_syndication(Platform.DISCORD) is None
+        records = dist.syndicate("P1")
+        assert post.get_syndication(Platform.DISCORD) is records[0]
+        assert post.get_syndication(Platform.RSS) is records[1]
+        assert post.get_syndication(Platform.GHOST) is None
+
+    def test_syndicate_builds_index_up_front(self):
+        from kerygma_social.discord import DiscordWebhook
+
+        dist = PosseDistributor(discord_webhook=DiscordWebhook("https://discord.test/webhook"))
+        post = dist.create_post("P1", "T", "B", "https://example.com", [Platform.DISCORD])
+        records = dist.syndicate("P1")
+        assert post._syndication_source[0] is post.syndications
+        assert post._syndication_map == {Platform.DISCORD: records[0]}
+
+    def test_tracks_list_changes(self):
+        from kerygma_social.posse import ContentPost, SyndicationRecord
+
+        post = ContentPost("P1", "T", "B", "https://example.com")
+        first = SyndicationRecord(platform=Platform.MASTODON)
+        post.syndications.append(first)
+        assert post.get_syndication(Platform.MASTODON) is first
+        second = SyndicationRecord(platform=Platform.BLUESKY)
+        post.syndications.append(second)
+        assert post.get_syndication(Platform.BLUESKY) is second
+        replacement = SyndicationRecord(platform=Platform.MASTODON)
+        post.syndications = [replacement, second]
+        assert post.get_syndication(Platform.MASTODON) is replacement
+
+    def test_first_record_per_platform_wins(self):
+        from kerygma_social.posse import ContentPost, SyndicationRecord
+
+        post = ContentPost("P1", "T", "B", "https://example.com")
+        first = SyndicationRecord(platform=Platform.MASTODON)
+        post._set_syndications([first, SyndicationRecord(platform=Platform.MASTODON)])
+        assert post.get_syndication(Platform.MASTODON) is first
+
+
+def test_long_mastodon_post_is_threaded():
+    from kerygma_social.mastodon import MastodonClient, MastodonConfig
+
+    client = MastodonClient(MastodonConfig(instance_url="https://m.test", access_token="t", max_chars=50))
+    dist = PosseDistributor(mastodon_client=client)
+    title = "A rather long announcement title that will not fit in one toot"
+    dist.create_post("P1", title, "B", "https://example.com/launch", [Platform.MASTODON])
+    records = dist.syndicate("P1")
+    assert records[0].status == SyndicationStatus.PUBLISHED
+    assert client.post_count > 1
+    assert client._posted[-1]["content"].endswith("https://example.com/launch")
+
+
+def test_thread_failing_mid_way_stops_without_reposting():
+    from kerygma_social.mastodon import MastodonClient, MastodonConfig
+
+    client = MastodonClient(MastodonConfig(instance_url="https://m.test", access_token="t", max_chars=50))
+    dist = PosseDistributor(
+        mastodon_client=client,
+        retry_config=RetryConfig(max_attempts=2, base_delay=0.001, jitter=False),
+    )
+    sent = []
+    real_post_toot = client.post_toot
+
+    def post_toot(toot):
+        sent.append(toot.content)
+        if len(sent) > 1:
+            raise RuntimeError("Mastodon API error 503")
+        return real_post_toot(toot)
+
+    client.post_toot = post_toot
+    title = "A rather long announcement title that will not fit in one toot"
+    dist.create_post("P1", title, "B", "https://example.com/launch", [Platform.MASTODON])
+    record = dist.syndicate("P1")[0]
+    assert record.status == SyndicationStatus.FAILED
+    assert "503" in record.error
+    # Toot 1 went out once; toot 2 was tried twice; nothing after it was sent.
+    assert len(sent) == 3 and sent[1] == sent[2] != sent[0]
+    assert client.post_count == 1
+
+
+def test_thread_retry_resends_only_the_failed_toot(api_server):
+    import json
+
+    from kerygma_social.mastodon import MastodonClient, MastodonConfig
+
+    client = MastodonClient(
+        MastodonConfig(instance_url=api_server.url, access_token="t", max_chars=60), live=True,
+    )
+    dist = PosseDistributor(
+        mastodon_client=client,
+        retry_config=RetryConfig(max_attempts=3, base_delay=0.001, jitter=False),
+    )
+    title = " ".join(["A rather long announcement title that needs several toots"] * 3)
+    dist.create_post("P1", title, "B", "https://example.com/launch", [Platform.MASTODON])
+    chunks = client.split_for_thread(
+        client.format_for_mastodon(title, "https://example.com/launch", truncate=False),
+    )
+    assert len(chunks) >= 3
+    api_server.queue(200, {"id": "1", "url": "https://m.test/@u/1"})
+    api_server.queue(503, {"error": "unavailable"})
+    for n in range(2, len(chunks) + 1):
+        api_server.queue(200, {"id": str(n), "url": f"https://m.test/@u/{n}"})
+
+    record = dist.syndicate("P1")[0]
+    assert record.status == SyndicationStatus.PUBLISHED
+    assert record.external_url == "https://m.test/@u/1"
+    bodies = [json.loads(r["body"]) for r in api_server.requests]
+    assert len(bodies) == len(chunks) + 1  # the 503'd toot, sent twice
+    sent = [b["status"] for n, b in enumerate(bodies) if n != 1]
+    assert sent == chunks  # every toot POSTed once and in order
+    assert [b.get("in_reply_to_id") for b in bodies[2:]] == [str(n) for n in range(1, len(chunks))]
+
+
+def test_post_lost_after_sending_is_not_retried(api_server):
+    from kerygma_social.mastodon import MastodonClient, MastodonConfig
+
+    client = MastodonClient(MastodonConfig(instance_url=api_server.url, access_token="t"), live=True)
+    dist = PosseDistributor(mastodon_client=client, retry_config=RetryConfig())
+    dist.create_post("P1", "T", "B", "https://example.com", [Platform.MASTODON])
+    dist.create_post("P2", "T", "B", "https://example.com", [Platform.MASTODON])
+    assert dist.syndicate("P1")[0].status == SyndicationStatus.PUBLISHED
+    api_server.drop_without_response = 1
+    record = dist.syndicate("P2")[0]
+    assert record.status == SyndicationStatus.FAILED
+    assert "may have been delivered" in record.error
+    assert len(api_server.requests) == 2
+
+
+def test_skipped_records_are_independent():
+    dist = PosseDistributor()
+    dist.create_post("P1", "T", "B", "https://example.com", [Platform.RSS])
+    dist.create_post("P2", "T", "B", "https://example.com", [Platform.RSS])
+    first = dist.syndicate("P1")[0]
+    second = dist.syndicate("P2")[0]
+    assert first.error == second.error == "No client configured for rss"
+    assert first is not second
+    first.mark_failed("changed")
+    assert second.status == SyndicationStatus.SKIPPED
@@ -74,6 +74,31 @@ class TestRateLimiter:
         assert len(sleeps) == 1
         assert sleeps[0] == pytest.approx(1.0)
 
+    def test_blocking_acquire_leaves_bucket_empty(self):
+        clock, advance = self._clock()
+
+        rl = RateLimiter(
+            RateLimiterConfig(tokens_per_second=2.0, max_tokens=4.0, initial_tokens=1.0),
+            clock=clock, sleep_func=advance,
+        )
+        assert rl.acquire(3.0, block=True)
+        assert clock() == pytest.approx(1.0)
+        assert rl.available_tokens == pytest.approx(0.0)
+        advance(1.0)
+        assert rl.available_tokens == pytest.approx(2.0)
+
+    def test_acquire_reads_clock_once(self):
+        reads = []
+
+        def clock():
+            reads.append(1)
+            return 0.0
+
+        rl = RateLimiter(RateLimiterConfig(max_tokens=5.0), clock=clock)
+        reads.clear()
+        rl.acquire()
+        assert len(reads) == 1
+
     def test_rate_limit_exceeded_has_retry_after(self):
         clock, advance = self._clock()
         rl = RateLimiter(
@@ -83,3 +108,109 @@ class TestRateLimiter:
         with pytest.raises(RateLimitExceeded) as exc_info:
             rl.acquire(1.0, block=False)
         assert exc_info.value.retry_after > 0
+
+    def test_concurrent_acquire_respects_budget(self):
+        import threading
+
+        limiter = RateLimiter(RateLimiterConfig(tokens_per_second=0.001, max_tokens=50), clock=lambda: 0.0)
+        granted = []
+
+        def worker():
+            for _ in range(20):
+                try:
+                    limiter.acquire(block=False)
+                    granted.append(1)
+                except RateLimitExceeded:
+                    pass
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(granted) == 50
+        assert limiter.available_tokens == 0
+
+    def test_blocked_acquire_does_not_hold_lock(self):
+        """A thread sleeping for tokens must not stall a non-blocking caller."""
+        import threading
+
+        clock, _ = self._clock()
+        sleeping = threading.Event()
+        release = threading.Event()
+
+        def slow_sleep(_):
+            sleeping.set()
+            release.wait(timeout=5)
+
+        rl = RateLimiter(
+            RateLimiterConfig(tokens_per_second=1.0, max_tokens=1.0, initial_tokens=0.0),
+            clock=clock, sleep_func=slow_sleep,
+        )
+        blocked = threading.Thread(target=rl.acquire)
+        blocked.start()
+        assert sleeping.wait(timeout=5)
+        try:
+            # The sleeper already reserved the next token, so this caller
+            # is told to wait behind it rather than being blocked on the lock.
+            with pytest.raises(RateLimitExceeded) as exc_info:
+                rl.acquire(block=False)
+            assert exc_info.value.retry_after == pytest.approx(2.0)
+        finally:
+            release.set()
+            blocked.join()
+
+    def test_observe_lowers_bucket_to_remaining(self):
+        clock, _ = self._clock()
+        rl = RateLimiter(RateLimiterConfig(tokens_per_second=1.0, max_tokens=10.0), clock=clock)
+        rl.observe(remaining=3, reset_after=60.0)
+        assert rl.available_tokens == pytest.approx(3.0)
+        # A looser report never refills the bucket.
+        rl.observe(remaining=8, reset_after=60.0)
+        assert rl.available_tokens == pytest.approx(3.0)
+
+    def test_observe_exhausted_waits_for_reset(self):
+        clock, advance = self._clock()
+        rl = RateLimiter(RateLimiterConfig(tokens_per_second=1.0, max_tokens=10.0), clock=clock)
+        rl.observe(remaining=0, reset_after=5.0)
+        with pytest.raises(RateLimitExceeded) as exc_info:
+            rl.acquire(block=False)
+        assert exc_info.value.retry_after == pytest.approx(5.0)
+        advance(5.0)
+        assert rl.acquire(block=False) is True
+
+    def test_observe_headers(self):
+        from datetime import UTC, datetime, timedelta
+
+        clock, _ = self._clock()
+        rl = RateLimiter(RateLimiterConfig(tokens_per_second=1.0, max_tokens=10.0), clock=clock)
+        rl.observe_headers({"Content-Type": "application/json"})
+        assert rl.available_tokens == 10.0
+        rl.observe_headers({"X-RateLimit-Remaining": "4", "X-RateLimit-Reset-After": "1.5"})
+        assert rl.available_tokens == pytest.approx(4.0)
+        reset = (datetime.now(UTC) + timedelta(seconds=30)).isoformat()
+        rl.observe_headers({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset})
+        with pytest.raises(RateLimitExceeded) as exc_info:
+            rl.acquire(block=False)
+        assert exc_info.value.retry_after == pytest.approx(30.0, abs=0.5)
+
+
+class TestRateLimitFromHeaders:
+    def test_discord_reset_after(self):
+        from kerygma_social.rate_limiter import rate_limit_from_headers
+
+        headers = {"X-RateLimit-Remaining": "2", "X-RateLimit-Reset-After": "0.75"}
+        assert rate_limit_from_headers(headers) == (2.0, 0.75)
+
+    def test_mastodon_reset_timestamp(self):
+        from kerygma_social.rate_limiter import rate_limit_from_headers
+
+        headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2015-10-21T07:28:00.000Z"}
+        assert rate_limit_from_headers(headers) == (0.0, 0.0)
+
+    def test_missing_or_malformed(self):
+        from kerygma_social.rate_limiter import rate_limit_from_headers
+
+        assert rate_limit_from_headers(None) is None
+        assert rate_limit_from_headers({}) is None
+        assert rate_limit_from_headers({"X-RateLimit-Remaining": "lots"}) is None
@@ -105,3 +105,116 @@ class TestRetry:
         with pytest.raises(ValueError, match="not retryable"):
             retry(fail_with_value_error, RetryConfig(max_attempts=3), sleep_func=lambda _: None)
         assert len(attempts) == 1  # No retries for non-retryable exceptions
+
+    def _sleeps(self, **config):
+        sleeps = []
+
+        def always_fail():
+            raise RuntimeError("fail")
+
+        with pytest.raises(RetryError):
+            retry(always_fail, RetryConfig(**config), sleep_func=sleeps.append)
+        return sleeps
+
+    def test_full_jitter_is_default(self):
+        sleeps = self._sleeps(max_attempts=20, base_delay=1.0, max_delay=8.0)
+        backoffs = [min(2.0 ** i, 8.0) for i in range(19)]
+        assert all(0.0 <= s <= b for s, b in zip(sleeps, backoffs))
+        # Full jitter spreads over the whole range, not just the top half.
+        assert any(s < b / 2 for s, b in zip(sleeps, backoffs))
+
+    def test_equal_jitter_keeps_upper_half(self):
+        sleeps = self._sleeps(max_attempts=10, base_delay=1.0, max_delay=8.0, jitter_strategy="equal")
+        backoffs = [min(2.0 ** i, 8.0) for i in range(9)]
+        assert all(b / 2 <= s <= b for s, b in zip(sleeps, backoffs))
+
+    def test_decorrelated_jitter_grows_from_previous_sleep(self):
+        sleeps = self._sleeps(max_attempts=20, base_delay=1.0, max_delay=10.0, jitter_strategy="decorrelated")
+        previous = 1.0
+        for s in sleeps:
+            assert 1.0 <= s <= min(10.0, previous * 3)
+            previous = s
+
+    def test_unknown_jitter_strategy(self):
+        # Rejected when the config is built, not after the first real failure.
+        with pytest.raises(ValueError, match="jitter strategy"):
+            RetryConfig(jitter_strategy="bogus")
+        with pytest.raises(ValueError, match="jitter strategy"):
+            RetryConfig(jitter=False, jitter_strategy="bogus")
+
+    def test_config_is_frozen_with_precomputed_schedule(self):
+        import dataclasses
+
+        cfg = RetryConfig(max_attempts=5, base_delay=1.0, max_delay=5.0)
+        assert cfg._delays == (1.0, 2.0, 4.0, 5.0)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            cfg.max_attempts = 10
+        assert cfg == RetryConfig(max_attempts=5, base_delay=1.0, max_delay=5.0)
+
+    def test_honors_retry_after(self):
+        from kerygma_social.http_pool import HttpError
+
+        sleeps = []
+        errors = [HttpError(429, "", "slow down", retry_after=5.0)]
+
+        def limited():
+            if errors:
+                raise errors.pop()
+            return "ok"
+
+        cfg = RetryConfig(max_attempts=2, base_delay=1.0, jitter=False)
+        assert retry(limited, cfg, sleeps.append) == "ok"
+        assert sleeps == [5.0]
+
+    def test_gives_up_when_retry_after_exceeds_max_delay(self):
+        from kerygma_social.http_pool import HttpError
+
+        calls = []
+
+        def limited():
+            calls.append(1)
+            raise HttpError(429, "", "slow down", retry_after=120.0)
+
+        with pytest.raises(RetryError) as exc_info:
+            retry(limited, RetryConfig(max_attempts=3, max_delay=30.0), sleep_func=lambda _: None)
+        assert len(calls) == 1
+        assert exc_info.value.attempts == 1
+
+    def test_client_error_is_not_retried(self):
+        from kerygma_social.http_pool import HttpError
+
+        calls = []
+
+        def rejected():
+            calls.append(1)
+            raise HttpError(422, "", "Validation failed")
+
+        with pytest.raises(HttpError):
+            retry(rejected, RetryConfig(max_attempts=3), sleep_func=lambda _: None)
+        assert len(calls) == 1
+
+    def test_uncertain_delivery_is_never_retried(self):
+        from kerygma_social.http_pool import DeliveryUncertainError
+
+        calls = []
+
+        def lost():
+            calls.append(1)
+            raise DeliveryUncertainError("POST", "https://m.test/api", ConnectionResetError())
+
+        config = RetryConfig(max_attempts=3, retryable_exceptions=(Exception,))
+        with pytest.raises(DeliveryUncertainError):
+            retry(lost, config, sleep_func=lambda _: None)
+        assert len(calls) == 1
+
+    def test_server_error_is_retried(self):
+        from kerygma_social.http_pool import HttpError
+
+        errors = [HttpError(502, "", "Bad Gateway"), HttpError(408, "", "Request Timeout")]
+
+        def flaky():
+            if errors:
+                raise errors.pop()
+            return "ok"
+
+        assert retry(flaky, RetryConfig(max_attempts=3), sleep_func=lambda _: None) == "ok"
@@ -1,7 +1,11 @@
 """Tests for the RSS poller module."""
 
+import json
+import xml.etree.ElementTree as ET
 from pathlib import Path
 
+import pytest
+
 from kerygma_social.rss_poller import RssPoller, FeedEntry
 
 FIXTURES = Path(__file__).parent / "fixtures"
@@ -27,6 +31,22 @@ class TestRssPoller:
         assert len(entries) == 1
         assert entries[0].title == "Item 1"
 
+    def test_parse_feed_from_byte_chunks(self):
+        data = FIXTURES.joinpath("sample_feed.xml").read_bytes().replace(b"Eight", "Eight \u00e9".encode())
+        poller = RssPoller()
+        chunks = [data[i:i + 7] for i in range(0, len(data), 7)]
+        entries = list(poller._iter_entries(chunks))
+        assert [e.title for e in entries] == [e.title for e in poller.parse_feed(data)]
+        assert entries[0].title == "Orchestrating the Eight \u00e9 Organs"
+
+    def test_parse_rss_guid_falls_back_to_link(self):
+        rss = """<rss version="2.0"><channel>
+        <item><link>https://example.com/1</link></item>
+        <item><link>https://example.com/2</link></item>
+        </channel></rss>"""
+        entries = RssPoller().parse_feed(rss)
+        assert [e.entry_id for e in entries] == ["https://example.com/1", "https://example.com/2"]
+
     def test_poll_returns_new_entries(self):
         xml = FIXTURES.joinpath("sample_feed.xml").read_text()
         poller = RssPoller(
@@ -63,6 +83,47 @@ class TestRssPoller:
         new = poller2.poll()
         assert len(new) == 0
 
+    def test_seen_log_is_append_only(self, tmp_path):
+        seen_path = tmp_path / "seen.jsonl"
+        poller = RssPoller(seen_path=seen_path)
+        poller.mark_seen("a")
+        poller.mark_seen("b")
+        poller.mark_seen("a")
+        assert seen_path.read_text().splitlines() == ['"a"', '"b"']
+
+    def test_append_after_torn_line_survives_reload(self, tmp_path):
+        seen_path = tmp_path / "seen.jsonl"
+        seen_path.write_bytes(b'"a"\n"tor')
+        poller = RssPoller(seen_path=seen_path)
+        assert poller.seen_count == 1
+        poller.mark_seen("b")
+        reloaded = RssPoller(seen_path=seen_path)
+        assert reloaded.seen_count == 2
+        assert seen_path.read_text().splitlines() == ['"a"', '"b"']
+
+    def test_seen_log_compacts_past_max_seen(self, tmp_path):
+        seen_path = tmp_path / "seen.jsonl"
+        poller = RssPoller(seen_path=seen_path, max_seen=2)
+        for entry_id in "abcd":
+            poller.mark_seen(entry_id)
+        assert seen_path.read_text().splitlines() == ['"c"', '"d"']
+        assert RssPoller(seen_path=seen_path, max_seen=2).seen_count == 2
+
+    def test_prunes_oldest_seen_ids(self):
+        poller = RssPoller(max_seen=2)
+        for entry_id in "abc":
+            poller.mark_seen(entry_id)
+        assert list(poller._seen) == ["b", "c"]
+
+    def test_legacy_seen_document_is_migrated(self, tmp_path):
+        seen_path = tmp_path / "seen.json"
+        seen_path.write_text(json.dumps({"seen_ids": ["a", "b"], "etag": '"v1"', "last_modified": ""}))
+        poller = RssPoller(seen_path=seen_path)
+        assert poller.seen_count == 2
+        assert poller._etag == '"v1"'
+        assert seen_path.read_text().splitlines() == ['"a"', '"b"']
+        assert RssPoller(seen_path=seen_path)._etag == '"v1"'
+
     def test_mark_seen(self):
         poller = RssPoller()
         poller.mark_seen("test-id")
@@ -74,3 +135,55 @@ class TestRssPoller:
             summary="A test entry", published="2026-01-01",
         )
         assert entry.entry_id == "id1"
+
+
+class TestConditionalPoll:
+    def _feed(self):
+        return FIXTURES.joinpath("sample_feed.xml").read_bytes()
+
+    def test_sends_validators_and_handles_304(self, api_server, tmp_path):
+        seen_path = tmp_path / "seen.json"
+        api_server.queue(200, self._feed(), ETag='"v1"', Last_Modified="Tue, 17 Feb 2026 00:00:00 GMT")
+        api_server.queue(304, None)
+        poller = RssPoller(feed_url=f"{api_server.url}/feed.xml", seen_path=seen_path)
+        assert len(poller.poll()) == 2
+        assert "If-None-Match" not in api_server.requests[0]["headers"]
+
+        # A fresh poller picks the validators up from the seen file.
+        poller = RssPoller(feed_url=f"{api_server.url}/feed.xml", seen_path=seen_path)
+        assert poller.poll() == []
+        headers = api_server.requests[1]["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == "Tue, 17 Feb 2026 00:00:00 GMT"
+        assert poller.seen_count == 2
+
+    def test_max_age_skips_request(self, api_server):
+        api_server.queue(200, self._feed(), Cache_Control="public, max-age=600")
+        poller = RssPoller(feed_url=f"{api_server.url}/feed.xml")
+        assert len(poller.poll()) == 2
+        assert poller.poll() == []
+        assert len(api_server.requests) == 1
+
+    def test_failed_parse_keeps_old_validators(self, api_server):
+        api_server.queue(200, b"<feed", ETag='"broken"')
+        poller = RssPoller(feed_url=f"{api_server.url}/feed.xml")
+        with pytest.raises(ET.ParseError):
+            poller.poll()
+        api_server.queue(200, self._feed())
+        assert len(poller.poll()) == 2
+        assert "If-None-Match" not in api_server.requests[1]["headers"]
+
+    def test_unchanged_body_is_not_reparsed(self, api_server, tmp_path, monkeypatch):
+        seen_path = tmp_path / "seen.json"
+        api_server.queue(200, self._feed())
+        api_server.queue(200, self._feed())
+        poller = RssPoller(feed_url=f"{api_server.url}/feed.xml", seen_path=seen_path)
+        assert len(poller.poll()) == 2
+
+        # A fresh poller reads the body fingerprint from the sidecar.
+        poller = RssPoller(feed_url=f"{api_server.url}/feed.xml", seen_path=seen_path)
+        parses = []
+        monkeypatch.setattr(poller, "_iter_entries", lambda chunks: parses.append(chunks) or [])
+        assert poller.poll() == []
+        assert parses == []
+        assert len(api_server.requests) == 2